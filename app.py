@@ -1,47 +1,94 @@
 # app.py
 import streamlit as st
-import json
-import tempfile
-import os
+import time
+from datetime import date
+from itertools import chain
+from typing import Dict, Tuple
 from src.generators.json_generator import JSONGenerator
 from src.generators.xml_generator import XMLGenerator
 from src.generators.csv_generator import CSVGenerator
-from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.data_types.field_types import FieldDefinition, FieldTypes, template_fingerprint
 from src.templates.user_template import UserTemplate
 from src.templates.financial_template import FinancialTemplate
-import base64
-from contextlib import contextmanager
+from src.generators.stats import ExportStats, GenerationStats
 
-@contextmanager
-def temp_file_handler(suffix: str):
-    """Context manager for handling temporary files"""
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-    try:
-        yield temp_file.name
-    finally:
-        temp_file.close()
-        try:
-            os.unlink(temp_file.name)
-        except Exception:
-            pass
+MAX_RECORDS = 1_000_000
+CACHE_ENTRIES = 4  # Cached downloads; at 1M records each can be tens of MB
+
+GENERATORS = {
+    "JSON": JSONGenerator,
+    "CSV": CSVGenerator,
+    "XML": XMLGenerator,
+}
+
+MIME_TYPES = {
+    "JSON": "application/json",
+    "XML": "application/xml",
+    "CSV": "text/csv",
+}
+
+@st.cache_data(max_entries=CACHE_ENTRIES, show_spinner=False)
+def build_download(template_key: str, export_format: str, seed: int, record_count: int,
+                   reference_date: date, _template: Dict[str, FieldDefinition]) -> Tuple[bytes, GenerationStats]:
+    """
+    Generate and export a dataset straight into memory.
 
-def get_file_content_as_string(filepath: str) -> str:
-    """Read file content as string"""
-    with open(filepath, 'r', encoding='utf-8') as file:
-        return file.read()
+    Cached by (template fingerprint, format, seed, count, reference date); the
+    least recently used entries are evicted beyond CACHE_ENTRIES. Records are
+    streamed chunk by chunk into the payload, never held as a full list.
+    """
+    generator = GENERATORS[export_format](seed=seed, reference_date=reference_date, stats=True)
+    start = time.perf_counter()
+    chunks = generator.iter_generate(_template, record_count)
+    payload = generator.export_bytes(chain.from_iterable(chunks))
+    stats = generator.stats
+    # Generation and encoding are interleaved; the export share is what generation did not use
+    export_seconds = max(time.perf_counter() - start - stats.seconds, 0.0)
+    stats.exports.append(ExportStats(export_format.lower(), record_count, len(payload), export_seconds))
+    return payload, stats
 
-def get_file_download_link(file_content: str, filename: str, text: str) -> str:
-    """Generate a download link for file content"""
-    b64 = base64.b64encode(file_content.encode()).decode()
-    mime_types = {
-        'json': 'application/json',
-        'xml': 'application/xml',
-        'csv': 'text/csv'
-    }
-    extension = filename.split('.')[-1]
-    mime_type = mime_types.get(extension, 'text/plain')
-    href = f'<a href="data:{mime_type};base64,{b64}" download="{filename}">{text}</a>'
-    return href
+@st.cache_data(max_entries=CACHE_ENTRIES * 4, show_spinner=False)
+def build_preview(template_key: str, seed: int, preview_count: int, reference_date: date,
+                  _template: Dict[str, FieldDefinition]) -> list:
+    """First rows of the dataset; a seeded generator draws them identically to the download"""
+    return JSONGenerator(seed=seed, reference_date=reference_date).generate(_template, preview_count)
+
+def render_stats_panel(stats: GenerationStats):
+    """Show per-field timing, null/unique counters and export throughput"""
+    with st.expander("Generation Statistics"):
+        if stats.seconds:
+            st.write(f"Generated {stats.records:,} records in {stats.seconds:.3f}s "
+                     f"({stats.records / stats.seconds:,.0f} records/s)")
+        st.markdown("**Per field**")
+        st.table([
+            {
+                "field": field.name,
+                "type": field.field_type,
+                "time (ms)": round(field.seconds * 1000, 2),
+                "values/s": round(field.values_per_second),
+                "nulls": field.nulls,
+                "unique retries": field.unique_retries,
+                "unique exhausted": field.unique_exhausted,
+            }
+            for field in stats.fields.values()
+        ])
+        st.markdown("**Per field type**")
+        st.table([
+            {"type": field_type, "time (ms)": round(field.seconds * 1000, 2), "values": field.values}
+            for field_type, field in stats.by_field_type().items()
+        ])
+        if stats.exports:
+            st.markdown("**Export**")
+            st.table([
+                {
+                    "format": export.format,
+                    "records": export.records,
+                    "bytes": export.bytes,
+                    "time (ms)": round(export.seconds * 1000, 2),
+                    "MB/s": round(export.bytes_per_second / 1e6, 2),
+                }
+                for export in stats.exports
+            ])
 
 def main():
     st.title("Mock Test Data Generator")
@@ -55,10 +102,17 @@ def main():
     record_count = st.sidebar.number_input(
         "Number of Records",
         min_value=1,
-        max_value=1000,
+        max_value=MAX_RECORDS,
         value=10
     )
     
+    seed = st.sidebar.number_input(
+        "Seed",
+        min_value=0,
+        value=0,
+        help="Equal settings and seed always produce the same data"
+    )
+    
     preview_count = min(5, record_count)  # Show at most 5 records in preview
     
     st.header("Define Fields")
@@ -112,58 +166,46 @@ def main():
         financial_template = FinancialTemplate()
         fields = list(financial_template.get_template().values())
     
-    if st.button("Generate Data"):
-        if not fields:
+    if not fields:
+        if st.button("Generate Data"):
             st.error("Please define at least one field")
-            return
-            
-        template = {field.name: field for field in fields if field.name}
+        return
         
-        try:
-            # Create appropriate generator
-            if export_format == "JSON":
-                generator = JSONGenerator()
-            elif export_format == "XML":
-                generator = XMLGenerator()
-            else:  # CSV
-                generator = CSVGenerator()
-            
-            # Generate data with specified record count
-            generated_data = generator.generate(template, record_count)
-            
-            # Show preview
-            st.subheader(f"Preview (showing {preview_count} of {record_count} records)")
-            st.json(generated_data[:preview_count])
-            
-            # Show total records generated
-            st.info(f"Total records generated: {len(generated_data)}")
-            
-            st.markdown("### Download Data")
-            
-            file_extension = export_format.lower()
-            output_filename = f"mock_data.{file_extension}"
+    template = {field.name: field for field in fields if field.name}
+    request = (template_fingerprint(template), export_format, int(seed), int(record_count), date.today())
+    
+    if st.button("Generate Data"):
+        st.session_state["request"] = request
+    # Results stay visible across reruns (e.g. after a download) while the settings are unchanged
+    if st.session_state.get("request") != request:
+        return
+    template_key, _, seed, record_count, reference_date = request
+        
+    try:
+        # Show preview
+        st.subheader(f"Preview (showing {preview_count} of {record_count} records)")
+        st.json(build_preview(template_key, seed, preview_count, reference_date, template))
+        
+        with st.spinner(f"Generating {record_count:,} records..."):
+            payload, stats = build_download(template_key, export_format, seed, record_count,
+                                            reference_date, template)
+        
+        # Show total records generated
+        st.info(f"Total records generated: {record_count:,} ({len(payload) / 1e6:,.1f} MB)")
+        
+        st.markdown("### Download Data")
+        st.download_button(
+            f"Download {export_format}",
+            data=payload,
+            file_name=f"mock_data.{export_format.lower()}",
+            mime=MIME_TYPES[export_format],
+        )
+        
+        render_stats_panel(stats)
             
-            # Use context manager for temporary file handling
-            with temp_file_handler(f".{file_extension}") as temp_filepath:
-                # Export data to temporary file
-                generator.export(generated_data, temp_filepath)
-                
-                # Read content immediately after writing
-                file_content = get_file_content_as_string(temp_filepath)
-                
-                # Create download link
-                st.markdown(
-                    get_file_download_link(
-                        file_content,
-                        output_filename,
-                        f"Download {export_format}"
-                    ),
-                    unsafe_allow_html=True
-                )
-                
-        except Exception as e:
-            st.error(f"Error generating data: {str(e)}")
-            st.exception(e)  # This will show the full traceback in development
+    except Exception as e:
+        st.error(f"Error generating data: {str(e)}")
+        st.exception(e)  # This will show the full traceback in development
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
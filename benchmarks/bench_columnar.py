@@ -0,0 +1,40 @@
+# benchmarks/bench_columnar.py
+"""
+Compare columnar NumPy generation with the compiled row-at-a-time plan.
+
+Run from the repository root:
+    python -m benchmarks.bench_columnar --count 200000
+"""
+import argparse
+from src.generators.json_generator import JSONGenerator
+from src.templates.financial_template import FinancialTemplate
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from .bench_plan import rows_per_second
+
+NUMERIC_TEMPLATE = {
+    "amount": FieldDefinition(name="amount", field_type=FieldTypes.FLOAT, min_value=0.01, max_value=10000.00),
+    "quantity": FieldDefinition(name="quantity", field_type=FieldTypes.INTEGER, min_value=1, max_value=500),
+    "status": FieldDefinition(name="status", field_type=FieldTypes.STRING, choices=["completed", "pending", "failed"]),
+    "created": FieldDefinition(name="created", field_type=FieldTypes.DATE),
+    "active": FieldDefinition(name="active", field_type=FieldTypes.BOOLEAN, nullable=True),
+}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200000, help="records per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement")
+    args = parser.parse_args()
+
+    generator = JSONGenerator()
+    templates = [("numeric", NUMERIC_TEMPLATE), ("FinancialTemplate", FinancialTemplate().get_template())]
+    print(f"{'template':<20}{'plan rows/s':>14}{'columns rows/s':>16}{'records rows/s':>16}")
+    for label, template in templates:
+        plan = generator.compile(template)
+        columnar = generator.compile_columnar(template)
+        scalar = rows_per_second(lambda: plan.generate(args.count), args.count, args.repeat)
+        columns = rows_per_second(lambda: list(columnar.iter_columns(args.count)), args.count, args.repeat)
+        records = rows_per_second(lambda: columnar.generate(args.count), args.count, args.repeat)
+        print(f"{label:<20}{scalar:>14,.0f}{columns:>16,.0f}{records:>16,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# benchmarks/bench_memory.py
+"""
+Measure the memory held by generated records: dict rows vs. RecordBatch tuples vs. columns.
+
+Run from the repository root:
+    python -m benchmarks.bench_memory --count 10000000
+Smaller counts are measured exactly and projected linearly to --rows.
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Callable
+from src.generators.json_generator import JSONGenerator
+from src.templates.financial_template import FinancialTemplate
+from src.templates.user_template import UserTemplate
+from .bench_plan import rows_per_second
+from .suite import fit_unique_domains
+
+def held_bytes(build: Callable[[], object]) -> int:
+    """Bytes still allocated by the object build() returns"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return held
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200000, help="records generated per measurement")
+    parser.add_argument("--rows", type=int, default=10000000, help="row count to project the totals to")
+    args = parser.parse_args()
+
+    templates = [("FinancialTemplate", FinancialTemplate().get_template()),
+                 ("UserTemplate", fit_unique_domains(UserTemplate().get_template(), args.count))]
+    # Plans are compiled (and Faker pools built) outside the measurement
+    layouts = [
+        ("dict rows", lambda generator, template: generator.compile(template).generate),
+        ("tuple batch", lambda generator, template: generator.compile(template).generate_batch),
+        ("column batch", lambda generator, template: generator.compile_columnar(template).generate_batch),
+    ]
+    print(f"{'template':<20}{'layout':<14}{'bytes/row':>10}{f'GB at {args.rows:,}':>20}{'rows/s':>12}")
+    for label, template in templates:
+        for layout, compile_plan in layouts:
+            generate = compile_plan(JSONGenerator(seed=1, pool_size=1000), template)
+            per_row = held_bytes(lambda: generate(args.count)) / args.count
+            generate = compile_plan(JSONGenerator(seed=1, pool_size=1000), template)
+            speed = rows_per_second(lambda: generate(args.count), args.count, 1)
+            print(f"{label:<20}{layout:<14}{per_row:>10,.0f}{per_row * args.rows / 1e9:>20,.2f}{speed:>12,.0f}")
+
+if __name__ == "__main__":
+    main()
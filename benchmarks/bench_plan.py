@@ -0,0 +1,109 @@
+# benchmarks/bench_plan.py
+"""
+Compare the compiled generation plan with the original per-value dispatch.
+
+Run from the repository root:
+    python -m benchmarks.bench_plan --count 20000
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.json_generator import JSONGenerator
+from src.templates.user_template import UserTemplate
+from src.templates.financial_template import FinancialTemplate
+
+def legacy_field_value(fake, field_def: FieldDefinition) -> Any:
+    """Original if/elif dispatch, kept verbatim as the baseline"""
+    if field_def.nullable and random.random() < 0.1:
+        return None
+
+    if field_def.field_type == FieldTypes.STRING:
+        if field_def.choices:
+            return random.choice(field_def.choices)
+        elif field_def.pattern:
+            return fake.pystr()
+        return fake.text(max_nb_chars=50)
+
+    elif field_def.field_type == FieldTypes.INTEGER:
+        min_val = field_def.min_value if field_def.min_value is not None else 0
+        max_val = field_def.max_value if field_def.max_value is not None else 1000
+        return random.randint(min_val, max_val)
+
+    elif field_def.field_type == FieldTypes.FLOAT:
+        min_val = float(field_def.min_value if field_def.min_value is not None else 0)
+        max_val = float(field_def.max_value if field_def.max_value is not None else 1000)
+        return round(random.uniform(min_val, max_val), 2)
+
+    elif field_def.field_type == FieldTypes.EMAIL:
+        return fake.email()
+
+    elif field_def.field_type == FieldTypes.DATE:
+        start_date = datetime.now() - timedelta(days=365)
+        end_date = datetime.now()
+        return fake.date_between(start_date=start_date, end_date=end_date)
+
+    elif field_def.field_type == FieldTypes.NAME:
+        return fake.name()
+
+    elif field_def.field_type == FieldTypes.BOOLEAN:
+        return random.choice([True, False])
+
+    elif field_def.field_type == FieldTypes.PHONE:
+        return fake.phone_number()
+
+    elif field_def.field_type == FieldTypes.ADDRESS:
+        return fake.address()
+
+    return None
+
+def legacy_generate(fake, template: Dict[str, FieldDefinition], count: int) -> List[Dict[str, Any]]:
+    """Original generate() loop, kept verbatim as the baseline"""
+    result = []
+    unique_values = {field_name: set() for field_name, field_def in template.items()
+                     if field_def.unique}
+
+    for _ in range(count):
+        record = {}
+        for field_name, field_def in template.items():
+            value = legacy_field_value(fake, field_def)
+            if field_def.unique:
+                attempts = 0
+                while str(value) in unique_values[field_name] and attempts < 100:
+                    value = legacy_field_value(fake, field_def)
+                    attempts += 1
+                unique_values[field_name].add(str(value))
+            record[field_name] = value
+        result.append(record)
+
+    return result
+
+def rows_per_second(run: Callable[[], Any], count: int, repeat: int) -> float:
+    """Best-of-N throughput for a generation callable"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000, help="records per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement")
+    args = parser.parse_args()
+
+    generator = JSONGenerator()
+    print(f"{'template':<16}{'legacy rows/s':>16}{'plan rows/s':>16}{'speedup':>10}")
+    for template_cls in (UserTemplate, FinancialTemplate):
+        template = template_cls().get_template()
+        legacy = rows_per_second(lambda: legacy_generate(generator.fake, template, args.count),
+                                 args.count, args.repeat)
+        planned = rows_per_second(lambda: generator.generate(template, args.count),
+                                  args.count, args.repeat)
+        print(f"{template_cls.__name__:<16}{legacy:>16,.0f}{planned:>16,.0f}{planned / legacy:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
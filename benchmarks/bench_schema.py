@@ -0,0 +1,72 @@
+# benchmarks/bench_schema.py
+"""
+Compare cold and cached loading of a large YAML or JSON schema file.
+
+Run from the repository root:
+    python -m benchmarks.bench_schema --fields 500
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from src.generators.pattern import compile_pattern
+from src.templates.schema_template import SchemaTemplate
+
+def build_schema(field_count: int) -> dict:
+    """A schema of field_count fields in groups of 10, mixing every option"""
+    groups = {}
+    for index in range(field_count):
+        group = groups.setdefault(f"group{index // 10}", {"fields": {}})["fields"]
+        kind = index % 5
+        if kind == 0:
+            spec = {"type": "integer", "min_value": 0, "max_value": 10 ** 6, "distribution": "zipf"}
+        elif kind == 1:
+            spec = {"type": "float", "min_value": 0.01, "max_value": 10000, "distribution": "lognormal"}
+        elif kind == 2:
+            spec = {"type": "string", "choices": ["a", "b", "c"], "weights": [7, 2, 1]}
+        elif kind == 3:
+            spec = {"type": "string", "pattern": f"[A-Z]{{2}}[0-9]{{{index % 12 + 4}}}"}
+        else:
+            spec = {"type": "date", "nullable": True}
+        group[f"field{index}"] = spec
+    return {"name": "wide", "fields": groups}
+
+def seconds(function, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fields", type=int, default=500, help="fields in the schema")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement")
+    args = parser.parse_args()
+
+    schema = build_schema(args.fields)
+    with tempfile.TemporaryDirectory() as directory:
+        cache_dir = os.path.join(directory, "cache")
+        print(f"{'file':<12}{'cold ms':>10}{'cached ms':>12}")
+        for extension in ("json", "yaml"):
+            path = os.path.join(directory, f"wide.{extension}")
+            with open(path, "w", encoding="utf-8") as f:
+                if extension == "json":
+                    json.dump(schema, f)
+                else:
+                    import yaml
+                    yaml.safe_dump(schema, f)
+
+            def cold_load():
+                compile_pattern.cache_clear()  # A fresh process compiles every pattern
+                SchemaTemplate.from_file(path, cache_dir=False)
+
+            cold = seconds(cold_load, args.repeat)
+            SchemaTemplate.from_file(path, cache_dir=cache_dir)
+            cached = seconds(lambda: SchemaTemplate.from_file(path, cache_dir=cache_dir), args.repeat)
+            print(f"{extension:<12}{cold * 1000:>10.1f}{cached * 1000:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+# benchmarks/suite.py
+"""
+Benchmark suite: rows/s and peak memory per field type, template and exporter.
+
+Run from the repository root:
+    python -m benchmarks.suite --sizes 1000,10000,100000 --save baseline.json
+    python -m benchmarks.suite --sizes 1000,10000,100000 --compare baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, replace
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.base_generator import DataGenerator
+from src.generators.csv_generator import CSVGenerator
+from src.generators.json_generator import JSONGenerator
+from src.generators.unique import domain_size
+from src.generators.xml_generator import XMLGenerator
+from src.templates.financial_template import FinancialTemplate
+from src.templates.user_template import UserTemplate
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+DEFAULT_THRESHOLD = 0.15  # Relative slowdown (or memory growth) reported as a regression
+REFERENCE_DATE = date(2024, 1, 31)
+SEED = 0
+
+FIELD_CASES: Dict[str, FieldDefinition] = {
+    FieldTypes.STRING: FieldDefinition(name="value", field_type=FieldTypes.STRING),
+    "string[pattern]": FieldDefinition(name="value", field_type=FieldTypes.STRING, pattern="[a-z0-9_]{5,15}"),
+    "string[choices]": FieldDefinition(name="value", field_type=FieldTypes.STRING, choices=["a", "b", "c"]),
+    FieldTypes.INTEGER: FieldDefinition(name="value", field_type=FieldTypes.INTEGER, min_value=0, max_value=10 ** 9),
+    FieldTypes.FLOAT: FieldDefinition(name="value", field_type=FieldTypes.FLOAT, min_value=0, max_value=10000),
+    FieldTypes.BOOLEAN: FieldDefinition(name="value", field_type=FieldTypes.BOOLEAN),
+    FieldTypes.DATE: FieldDefinition(name="value", field_type=FieldTypes.DATE),
+    FieldTypes.EMAIL: FieldDefinition(name="value", field_type=FieldTypes.EMAIL),
+    FieldTypes.PHONE: FieldDefinition(name="value", field_type=FieldTypes.PHONE),
+    FieldTypes.ADDRESS: FieldDefinition(name="value", field_type=FieldTypes.ADDRESS),
+    FieldTypes.NAME: FieldDefinition(name="value", field_type=FieldTypes.NAME),
+}
+
+TEMPLATE_CASES = {
+    "UserTemplate": UserTemplate,
+    "FinancialTemplate": FinancialTemplate,
+}
+
+EXPORTER_CASES = {
+    "JSONGenerator": (JSONGenerator, ".json"),
+    "JSONGenerator[lines]": (JSONGenerator, ".jsonl"),
+    "CSVGenerator": (CSVGenerator, ".csv"),
+    "XMLGenerator": (XMLGenerator, ".xml"),
+}
+
+TEMPLATE_MODES = {
+    "": {},
+    "[columnar]": {"columnar": True},
+    "[pooled]": {"columnar": True, "pool_size": 10000},
+}
+
+GROUPS = ("field", "template", "exporter")
+
+@dataclass
+class Result:
+    """One measurement; `name` identifies the case across runs"""
+    name: str
+    group: str
+    count: int
+    rows_per_second: float
+    peak_bytes: Optional[int] = None
+
+@dataclass
+class Case:
+    """A benchmark case: `setup` runs untimed and returns the callable that is measured"""
+    name: str
+    group: str
+    count: int
+    setup: Callable[[], Callable[[], Any]]
+
+def fit_unique_domains(template: Dict[str, FieldDefinition], count: int) -> Dict[str, FieldDefinition]:
+    """
+    Widen unique integer ranges that cannot hold count values.
+
+    UserTemplate ids span 9000 values; larger runs would otherwise fail up front.
+    """
+    fitted = {}
+    for field_name, field_def in template.items():
+        size = domain_size(field_def) if field_def.unique else None
+        if size is not None and size < count and field_def.field_type == FieldTypes.INTEGER:
+            field_def = replace(field_def, max_value=(field_def.min_value or 0) + count - 1)
+        fitted[field_name] = field_def
+    return fitted
+
+def _generator(**options) -> JSONGenerator:
+    return JSONGenerator(seed=SEED, reference_date=REFERENCE_DATE, **options)
+
+def _generate_case(template: Dict[str, FieldDefinition], count: int, options: Dict[str, Any]):
+    def setup():
+        generator = _generator(**options)
+        return lambda: generator.generate(template, count)
+    return setup
+
+def _export_case(generator_cls, suffix: str, count: int, directory: str):
+    def setup():
+        records = _generator().generate(fit_unique_domains(UserTemplate().get_template(), count), count)
+        exporter: DataGenerator = generator_cls()
+        path = os.path.join(directory, f"export{suffix}")
+        return lambda: exporter.export(records, path)
+    return setup
+
+def build_cases(sizes: Sequence[int], groups: Sequence[str], directory: str) -> Iterator[Case]:
+    """Every (case, size) combination of the selected groups"""
+    for count in sizes:
+        if "field" in groups:
+            for label, field_def in FIELD_CASES.items():
+                yield Case(f"field:{label}", "field", count,
+                           _generate_case({"value": field_def}, count, {}))
+        if "template" in groups:
+            for label, template_cls in TEMPLATE_CASES.items():
+                template = fit_unique_domains(template_cls().get_template(), count)
+                for suffix, options in TEMPLATE_MODES.items():
+                    yield Case(f"template:{label}{suffix}", "template", count,
+                               _generate_case(template, count, options))
+        if "exporter" in groups:
+            for label, (generator_cls, suffix) in EXPORTER_CASES.items():
+                yield Case(f"exporter:{label}", "exporter", count,
+                           _export_case(generator_cls, suffix, count, directory))
+
+def measure_throughput(run: Callable[[], Any], count: int, repeat: int) -> float:
+    """Best-of-N rows per second"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return count / best if best > 0 else float("inf")
+
+def measure_peak_memory(run: Callable[[], Any]) -> int:
+    """Peak bytes allocated by Python during one run (tracemalloc, so timed separately)"""
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_case(case: Case, repeat: int, memory: bool = True) -> Result:
+    run = case.setup()
+    rows_per_second = measure_throughput(run, case.count, repeat)
+    peak_bytes = measure_peak_memory(run) if memory else None
+    return Result(case.name, case.group, case.count, rows_per_second, peak_bytes)
+
+def run_suite(sizes: Sequence[int] = DEFAULT_SIZES, groups: Sequence[str] = GROUPS,
+              repeat: int = 3, memory: bool = True,
+              progress: Optional[Callable[[Result], None]] = None) -> List[Result]:
+    """Run every selected case and return the measurements in order"""
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for case in build_cases(sizes, groups, directory):
+            result = run_case(case, repeat, memory)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+def save_results(results: List[Result], path: str) -> None:
+    """Write results and the environment they were measured in"""
+    payload = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+
+def load_results(path: str) -> List[Result]:
+    with open(path, encoding="utf-8") as f:
+        return [Result(**result) for result in json.load(f)["results"]]
+
+@dataclass
+class Regression:
+    """A case whose metric moved past the threshold"""
+    name: str
+    count: int
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1
+
+def compare(results: List[Result], baseline: List[Result],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+    """
+    Flag cases slower, or using more peak memory, than the baseline by more than threshold.
+
+    Cases missing from either side are ignored.
+    """
+    previous = {(result.name, result.count): result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result.name, result.count))
+        if before is None:
+            continue
+        if result.rows_per_second < before.rows_per_second * (1 - threshold):
+            regressions.append(Regression(result.name, result.count, "rows/s",
+                                          before.rows_per_second, result.rows_per_second))
+        if (result.peak_bytes is not None and before.peak_bytes
+                and result.peak_bytes > before.peak_bytes * (1 + threshold)):
+            regressions.append(Regression(result.name, result.count, "peak bytes",
+                                          before.peak_bytes, result.peak_bytes))
+    return regressions
+
+def _print_result(result: Result) -> None:
+    memory = f"{result.peak_bytes / 1e6:>12,.1f}" if result.peak_bytes is not None else f"{'-':>12}"
+    print(f"{result.name:<36}{result.count:>10,}{result.rows_per_second:>16,.0f}{memory}", flush=True)
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated record counts")
+    parser.add_argument("--groups", default=",".join(GROUPS),
+                        help=f"comma-separated subset of {', '.join(GROUPS)}")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak-memory run")
+    parser.add_argument("--save", metavar="PATH", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="baseline to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative change reported as a regression")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    groups = [group for group in args.groups.split(",") if group]
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"unknown groups: {', '.join(sorted(unknown))}")
+
+    print(f"{'case':<36}{'records':>10}{'rows/s':>16}{'peak MB':>12}")
+    results = run_suite(sizes, groups, args.repeat, not args.no_memory, _print_result)
+    if args.save:
+        save_results(results, args.save)
+    if args.compare:
+        regressions = compare(results, load_results(args.compare), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression.name} @ {regression.count:,}: {regression.metric} "
+                  f"{regression.baseline:,.0f} -> {regression.current:,.0f} ({regression.change:+.0%})")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+# src/cli.py
+"""
+Headless entry point for large-scale generation:
+
+    python -m src.cli --template user --count 100000000 --seed 42 --workers 16 -o users.csv
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Type
+from .data_types.field_types import FieldDefinition
+from .generators.base_generator import DataGenerator, DEFAULT_CHUNK_SIZE
+from .generators.compression import DEFAULT_LEVELS, OutputFile, compression_for, strip_compression_extension
+from .generators.csv_generator import CSVGenerator
+from .generators.fixed_width import FIXED_WIDTH, PADDED_CSV, FixedWidthGenerator, LayoutError
+from .generators.json_generator import JSONGenerator
+from .generators.parallel import DEFAULT_SHARD_SIZE, ParallelGenerator
+from .generators.sql_generator import SQLGenerator, table_name_for
+from .generators.unique import UniqueDomainError
+from .generators.xml_generator import XMLGenerator
+from .templates.base_template import BaseTemplate
+from .templates.registry import TEMPLATES
+from .templates.schema_template import SchemaError, SchemaTemplate
+
+FORMATS: Dict[str, Tuple[Type[DataGenerator], Dict[str, Any]]] = {
+    "json": (JSONGenerator, {"lines": False}),
+    "jsonl": (JSONGenerator, {"lines": True}),
+    "csv": (CSVGenerator, {}),
+    "xml": (XMLGenerator, {}),
+    "sql": (SQLGenerator, {"file_format": "insert"}),
+    "pgcopy": (SQLGenerator, {"file_format": "copy"}),
+    "sqlite": (SQLGenerator, {"file_format": "sqlite"}),
+    # Fixed-width formats are laid out by the generator, so these are generator options
+    "fixed": (FixedWidthGenerator, {"file_format": FIXED_WIDTH}),
+    "fixed-csv": (FixedWidthGenerator, {"file_format": PADDED_CSV}),
+}
+FILE_ONLY_FORMATS = ("sqlite", "fixed", "fixed-csv")
+
+EXTENSION_FORMATS = {
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".xml": "xml",
+    ".sql": "sql",
+    ".db": "sqlite",
+    ".sqlite": "sqlite",
+    ".sqlite3": "sqlite",
+}
+
+DEFAULT_FORMAT = "csv"
+PROGRESS_INTERVAL = 5.0  # Seconds between progress lines
+
+class Progress:
+    """
+    Counts records as they are written and reports progress to a stream.
+
+    A line is printed at most every `interval` seconds, so the cost per
+    chunk is one clock read.
+    """
+
+    def __init__(self, total: int, stream: Optional[TextIO] = None,
+                 interval: float = PROGRESS_INTERVAL, clock=time.perf_counter):
+        self.total = total
+        self.stream = stream
+        self.interval = interval
+        self.clock = clock
+        self.records = 0
+        self.started = clock()
+        self._next_report = self.started + interval
+
+    @property
+    def elapsed(self) -> float:
+        return self.clock() - self.started
+
+    @property
+    def rate(self) -> float:
+        """Records per second so far"""
+        elapsed = self.elapsed
+        return self.records / elapsed if elapsed > 0 else 0.0
+
+    def track(self, chunks: Iterable[List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        """Yield the records of every chunk, counting each chunk once it has been consumed"""
+        for chunk in chunks:
+            yield from chunk
+            self.update(len(chunk))
+
+    def update(self, count: int) -> None:
+        self.records += count
+        if self.stream is not None and self.clock() >= self._next_report:
+            self.report()
+            self._next_report = self.clock() + self.interval
+
+    def report(self) -> None:
+        percent = 100.0 * self.records / self.total if self.total else 100.0
+        print(f"{self.records:,}/{self.total:,} records ({percent:.1f}%), "
+              f"{self.rate:,.0f} records/s", file=self.stream, flush=True)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Generate mock data without the Streamlit UI, streaming records to a file or stdout.",
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("-t", "--template", choices=sorted(TEMPLATES),
+                        help="built-in template")
+    source.add_argument("-s", "--schema", metavar="PATH",
+                        help="JSON or YAML schema file defining the fields")
+    parser.add_argument("-n", "--count", type=int, required=True,
+                        help="number of records to generate")
+    parser.add_argument("-f", "--format", choices=sorted(FORMATS),
+                        help="output format; inferred from the output extension, "
+                             f"otherwise {DEFAULT_FORMAT}")
+    parser.add_argument("-o", "--output", default="-", metavar="PATH",
+                        help="output file; '-' (the default) writes to stdout")
+    parser.add_argument("--compression", choices=sorted(DEFAULT_LEVELS),
+                        help="compress the output file; inferred from a .gz/.bz2/.xz extension")
+    parser.add_argument("--compression-level", type=int, metavar="LEVEL",
+                        help="compression level (gzip/bz2 1-9, xz 0-9)")
+    parser.add_argument("--seed", type=int,
+                        help="master seed; a random seed is chosen and reported when omitted")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="worker processes; output does not depend on this value")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE,
+                        help="records per shard (part of the output's identity)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="records generated per batch inside a shard")
+    parser.add_argument("--reference-date", type=date.fromisoformat, metavar="YYYY-MM-DD",
+                        help="last day of the DATE range; defaults to today")
+    parser.add_argument("--columnar", action="store_true",
+                        help="generate vectorizable columns with NumPy")
+    parser.add_argument("--pool-size", type=int,
+                        help="sample names, emails, phones and addresses from Faker pools of this size")
+    parser.add_argument("--locale", help="Faker locale, e.g. de_DE")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="suppress progress and the final summary")
+    return parser
+
+def resolve_format(output: str, fmt: Optional[str]) -> str:
+    """Explicit format, else the one implied by the output extension, else DEFAULT_FORMAT"""
+    if fmt:
+        return fmt
+    if output != "-":
+        extension = os.path.splitext(strip_compression_extension(output))[1].lower()
+        return EXTENSION_FORMATS.get(extension, DEFAULT_FORMAT)
+    return DEFAULT_FORMAT
+
+def load_template(args: argparse.Namespace) -> BaseTemplate:
+    if args.schema:
+        return SchemaTemplate.from_file(args.schema)
+    return TEMPLATES[args.template]()
+
+def build_generator(args: argparse.Namespace, fmt: str) -> ParallelGenerator:
+    """Sharded generator for the run; output depends on the seed and shard size, not on workers"""
+    generator_cls, options = FORMATS[fmt]
+    return ParallelGenerator(
+        generator_cls, seed=args.seed, workers=args.workers, shard_size=args.shard_size,
+        chunk_size=args.chunk_size, reference_date=args.reference_date or date.today(),
+        columnar=args.columnar, pool_size=args.pool_size, locale=args.locale,
+        **(options if generator_cls is FixedWidthGenerator else {}),
+    )
+
+def run(args: argparse.Namespace, stdout: TextIO, stderr: TextIO) -> None:
+    template = load_template(args)
+    fields = template.get_template()
+    fmt = resolve_format(args.output, args.format)
+    parallel = build_generator(args, fmt)
+    # Fail before touching the output if a unique field cannot cover the count
+    generator = parallel.generator_cls(**parallel.options)
+    getattr(generator, "json_generator", generator).compile(fields).check_capacity(args.count)
+
+    generator_cls, write_options = FORMATS[fmt]
+    exporter = generator_cls()
+    if generator_cls is SQLGenerator:
+        # The schema comes from the template, the table name from the template name
+        write_options = dict(write_options, template=fields, table=table_name_for(template.get_name()))
+    progress = Progress(args.count, None if args.quiet else stderr)
+    records = progress.track(parallel.iter_chunks(fields, args.count))
+
+    if generator_cls is FixedWidthGenerator:
+        # Workers write their shards in place into the preallocated file
+        parallel.export(fields, args.count, args.output)
+        progress.update(args.count)
+        destination = f"{args.output} ({os.path.getsize(args.output) / 1e6:,.1f} MB)"
+    elif fmt == "sqlite":
+        exporter.export(records, args.output, **write_options)
+        destination = f"{args.output} ({os.path.getsize(args.output) / 1e6:,.1f} MB)"
+    elif args.output == "-":
+        exporter.write(records, stdout, **write_options)
+        stdout.flush()
+        destination = "stdout"
+    else:
+        newline = "" if fmt == "csv" else None
+        output = OutputFile(args.output, args.compression, args.compression_level, newline)
+        with output as f:
+            exporter.write(records, f, **write_options)
+        size = f"{os.path.getsize(args.output) / 1e6:,.1f} MB"
+        if output.stats is not None:
+            size += (f" {output.compression}, ratio {output.stats.ratio:.1f}x, "
+                     f"{output.stats.bytes_per_second / 1e6:,.1f} MB/s compressed")
+        destination = f"{args.output} ({size})"
+
+    if not args.quiet:
+        print(f"Wrote {progress.records:,} {template.get_name()} records as {fmt} to {destination} "
+              f"in {progress.elapsed:.2f}s ({progress.rate:,.0f} records/s, seed {args.seed})",
+              file=stderr, flush=True)
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.count < 0:
+        parser.error("--count must be non-negative")
+    if args.workers < 1 or args.shard_size < 1 or args.chunk_size < 1:
+        parser.error("--workers, --shard-size and --chunk-size must be positive")
+    if args.output == "-" and (args.compression or args.format in FILE_ONLY_FORMATS):
+        parser.error(f"--compression and --format {'/'.join(FILE_ONLY_FORMATS)} need an output file")
+    if args.format in ("fixed", "fixed-csv") and compression_for(args.output, args.compression):
+        parser.error("fixed-width output is written in place and cannot be compressed")
+    if args.seed is None:
+        args.seed = random.SystemRandom().randrange(2 ** 32)
+
+    try:
+        run(args, sys.stdout, sys.stderr)
+    except (SchemaError, UniqueDomainError, LayoutError, OSError) as exc:
+        if isinstance(exc, BrokenPipeError):
+            # The reader went away (e.g. `| head`); silence the flush at interpreter exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 1
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,13 @@
 # src/data_types/constraints.py
+import re
 from dataclasses import dataclass
-from typing import Optional, Any, List
+from functools import lru_cache
+from typing import Optional, Any, List, Pattern
+
+@lru_cache(maxsize=None)
+def compiled_regex(pattern: str) -> Pattern[str]:
+    """Compile a pattern once; every later lookup is a dictionary hit"""
+    return re.compile(pattern)
 
 @dataclass
 class Constraint:
@@ -36,7 +43,7 @@ def validate_constraints(value: Any, constraints: List[Constraint]) -> Optional[
             if constraint.max_value is not None and value > constraint.max_value:
                 return constraint.message
         elif isinstance(constraint, PatternConstraint):
-            if not re.match(constraint.pattern, str(value)):
+            if not compiled_regex(constraint.pattern).match(str(value)):
                 return constraint.message
         elif isinstance(constraint, ChoiceConstraint):
             if value not in constraint.choices:
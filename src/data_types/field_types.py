@@ -1,9 +1,17 @@
 # src/data_types/field_types.py
-from dataclasses import dataclass
-from typing import Any, Optional, List
+import hashlib
+import json
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, List
 from datetime import datetime
 
-@dataclass
+DATE_RANGE_DAYS = 365  # DATE fields span the year up to the reference date
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_OPTIONS)
 class FieldDefinition:
     """
     Defines the structure and constraints for a field in the mock data.
@@ -16,6 +24,10 @@ class FieldDefinition:
     pattern: Optional[str] = None
     nullable: bool = False
     unique: bool = False
+    references: Optional[str] = None  # "table.field" of a parent key (see generators/relational.py)
+    weights: Optional[List[float]] = None  # Relative weight of each choice
+    distribution: Optional[str] = None  # INTEGER/FLOAT: normal, lognormal, exponential or zipf
+    distribution_params: Optional[Dict[str, float]] = None
 
 class FieldTypes:
     """
@@ -29,4 +41,15 @@ class FieldTypes:
     EMAIL = "email"
     PHONE = "phone"
     ADDRESS = "address"
-    NAME = "name"
\ No newline at end of file
+    NAME = "name"
+
+def template_fingerprint(template: Dict[str, FieldDefinition]) -> str:
+    """
+    Stable hex digest of a template's field names and definitions.
+
+    Equal templates give equal fingerprints across processes, so the digest
+    can key caches of generated output.
+    """
+    payload = json.dumps([[field_name, asdict(field_def)] for field_name, field_def in template.items()],
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
@@ -0,0 +1,291 @@
+# src/generators/arrow_generator.py
+import io
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+from .base_generator import DataGenerator, DEFAULT_CHUNK_SIZE
+from .columnar import Columns
+from .json_generator import JSONGenerator
+from .stats import GenerationStats, measure_export
+from ..data_types.field_types import FieldDefinition, FieldTypes
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; only ArrowGenerator needs it
+    pa = None
+    pq = None
+
+PARQUET = "parquet"
+ARROW = "arrow"
+DEFAULT_ROW_GROUP_SIZE = 100000
+DEFAULT_COMPRESSION = {PARQUET: "snappy", ARROW: None}
+
+FORMAT_EXTENSIONS = {
+    ".parquet": PARQUET,
+    ".pq": PARQUET,
+    ".arrow": ARROW,
+    ".feather": ARROW,
+    ".ipc": ARROW,
+}
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("ArrowGenerator requires pyarrow (pip install pyarrow)")
+
+def arrow_type(field_def: FieldDefinition):
+    """Arrow type of a field; text-like types (email, name, ...) are strings"""
+    _require_pyarrow()
+    field_type = field_def.field_type
+    if field_type == FieldTypes.INTEGER:
+        return pa.int64()
+    elif field_type == FieldTypes.FLOAT:
+        return pa.float64()
+    elif field_type == FieldTypes.BOOLEAN:
+        return pa.bool_()
+    elif field_type == FieldTypes.DATE:
+        return pa.date32()
+    return pa.string()
+
+def arrow_schema(template: Dict[str, FieldDefinition]):
+    """Arrow schema with one typed column per template field"""
+    _require_pyarrow()
+    return pa.schema([
+        pa.field(field_name, arrow_type(field_def), nullable=field_def.nullable)
+        for field_name, field_def in template.items()
+    ])
+
+def file_format_for(filepath: str) -> Optional[str]:
+    """Format implied by a file extension, or None"""
+    lowered = filepath.lower()
+    for extension, file_format in FORMAT_EXTENSIONS.items():
+        if lowered.endswith(extension):
+            return file_format
+    return None
+
+class _TableWriter:
+    """Parquet or Arrow IPC file writer fed one record batch at a time"""
+
+    def __init__(self, sink, schema, file_format: str, compression: Optional[str],
+                 compression_level: Optional[int], row_group_size: int):
+        self.file_format = file_format
+        self.row_group_size = row_group_size
+        self.rows = 0
+        if file_format == PARQUET:
+            self._writer = pq.ParquetWriter(sink, schema, compression=compression or "none",
+                                            compression_level=compression_level)
+        else:
+            codec = None
+            if compression:
+                codec = pa.Codec(compression, compression_level) if compression_level is not None else compression
+            self._writer = pa.ipc.new_file(sink, schema, options=pa.ipc.IpcWriteOptions(compression=codec))
+
+    def write_batch(self, batch) -> None:
+        if self.file_format == PARQUET:
+            self._writer.write_batch(batch, row_group_size=self.row_group_size)
+        else:
+            self._writer.write_batch(batch)
+        self.rows += batch.num_rows
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def __enter__(self) -> "_TableWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+class ArrowGenerator(DataGenerator):
+    """
+    Columnar export to Parquet or Arrow IPC files.
+
+    Columns are typed from the template's FieldTypes (int64, float64, bool,
+    date32, string), and each batch of row_group_size rows becomes one
+    Parquet row group or IPC record batch. export_stream() feeds NumPy
+    column batches straight into Arrow arrays without building row
+    dictionaries. Requires the optional pyarrow package.
+    """
+
+    def __init__(self, file_format: Optional[str] = None, compression: Optional[str] = "default",
+                 compression_level: Optional[int] = None, row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                 **options):
+        """
+        Args:
+            file_format: "parquet" or "arrow"; inferred from the output extension by default
+                (.parquet/.pq, .arrow/.feather/.ipc)
+            compression: Codec name (e.g. "snappy", "zstd", "gzip", "lz4"); None disables it.
+                Defaults to snappy for Parquet and uncompressed for Arrow IPC
+            compression_level: Codec-specific compression level
+            row_group_size: Rows per row group / record batch
+            options: Generation options (seed, reference_date, ...) forwarded to the JSON
+                generator; columnar generation is enabled unless columnar=False is given
+        """
+        _require_pyarrow()
+        if file_format not in (None, PARQUET, ARROW):
+            raise ValueError(f"unknown Arrow file format: {file_format}")
+        options.setdefault("columnar", True)
+        self.json_generator = JSONGenerator(**options)
+        self.file_format = file_format
+        self.compression = compression
+        self.compression_level = compression_level
+        self.row_group_size = row_group_size
+
+    @property
+    def stats(self) -> Optional[GenerationStats]:
+        """Instrumentation shared with the JSON generator (enabled with stats=True)"""
+        return self.json_generator.stats
+
+    def generate(self, template: Dict[str, FieldDefinition], count: int) -> List[Dict[str, Any]]:
+        """Generate data using JSON generator for consistency"""
+        return self.json_generator.generate(template, count)
+
+    def iter_generate(self, template: Dict[str, FieldDefinition], count: int,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """Stream data chunks using JSON generator for consistency"""
+        return self.json_generator.iter_generate(template, count, chunk_size)
+
+    def _resolve(self, filepath: Optional[str]) -> Tuple[str, Optional[str]]:
+        file_format = self.file_format or (file_format_for(filepath) if filepath else None) or PARQUET
+        compression = self.compression
+        if compression == "default":
+            compression = DEFAULT_COMPRESSION[file_format]
+        return file_format, compression
+
+    def _writer(self, sink, schema, filepath: Optional[str]) -> _TableWriter:
+        file_format, compression = self._resolve(filepath)
+        return _TableWriter(sink, schema, file_format, compression, self.compression_level,
+                            self.row_group_size)
+
+    def _write_column_batches(self, sink, filepath: Optional[str], batches: Iterable[Columns],
+                              schema=None) -> int:
+        """
+        Write column batches; the schema is inferred from the data when not given.
+
+        A column that has only held nulls so far is typed null, so inferred
+        batches are held back until every column has had a value (or the data
+        ends) and are then written with the unified schema.
+        """
+        writer = None
+        pending: List[Columns] = []
+        try:
+            for columns in batches:
+                if writer is None and not pending and schema is not None:
+                    writer = self._writer(sink, schema, filepath)
+                if writer is not None:
+                    writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=schema))
+                    continue
+                inferred = pa.RecordBatch.from_pydict(columns).schema
+                schema = inferred if schema is None else pa.unify_schemas([schema, inferred])
+                pending.append(columns)
+                if not any(pa.types.is_null(field.type) for field in schema):
+                    writer = self._writer(sink, schema, filepath)
+                    for held in pending:
+                        writer.write_batch(pa.RecordBatch.from_pydict(held, schema=schema))
+                    pending = []
+            if writer is None:
+                writer = self._writer(sink, schema if schema is not None else pa.schema([]), filepath)
+                for held in pending:
+                    writer.write_batch(pa.RecordBatch.from_pydict(held, schema=schema))
+            return writer.rows
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _record_batches(self, data: Iterable[Dict[str, Any]]) -> Iterator[Columns]:
+        """Group records into row_group_size column batches"""
+        records = iter(data)
+        while True:
+            chunk = list(islice(records, self.row_group_size))
+            if not chunk:
+                return
+            field_names = list(chunk[0])
+            yield {field_name: [record.get(field_name) for record in chunk] for field_name in field_names}
+
+    def export(self, data: Iterable[Dict[str, Any]], filepath: str,
+               template: Optional[Dict[str, FieldDefinition]] = None) -> None:
+        """
+        Export records to a Parquet or Arrow IPC file.
+
+        Args:
+            data: Generated data records; consumed row_group_size records at a time
+            filepath: Path to save the exported file
+            template: Template whose FieldTypes fix the column types; inferred
+                from the first row group when omitted
+        """
+        schema = arrow_schema(template) if template is not None else None
+        file_format, _ = self._resolve(filepath)
+        with measure_export(self.stats, file_format, filepath, data) as data:
+            self._write_column_batches(filepath, filepath, self._record_batches(data), schema)
+
+    def export_columns(self, columns: Columns, filepath: str,
+                       template: Optional[Dict[str, FieldDefinition]] = None) -> None:
+        """Export one column batch without building row dictionaries"""
+        schema = arrow_schema(template) if template is not None else None
+        file_format, _ = self._resolve(filepath)
+        records = len(next(iter(columns.values()), ()))
+        with measure_export(self.stats, file_format, filepath, records=records):
+            self._write_column_batches(filepath, filepath, [columns], schema)
+
+    def export_stream(self, template: Dict[str, FieldDefinition], count: int, filepath: str,
+                      chunk_size: Optional[int] = None) -> None:
+        """
+        Generate and write count records, one row group per batch.
+
+        With columnar generation (the default) the NumPy column batches are
+        converted to Arrow arrays directly; otherwise rows are regrouped.
+
+        Args:
+            template: Dictionary defining the data structure and constraints
+            count: Total number of records to generate
+            filepath: Path to save the exported file
+            chunk_size: Rows per batch; defaults to row_group_size
+        """
+        batch_size = chunk_size or self.row_group_size
+        file_format, _ = self._resolve(filepath)
+        with measure_export(self.stats, file_format, filepath, records=count):
+            self._write_column_batches(filepath, filepath, self.iter_column_batches(template, count, batch_size),
+                                       arrow_schema(template))
+
+    def iter_column_batches(self, template: Dict[str, FieldDefinition], count: int,
+                            batch_size: Optional[int] = None) -> Iterator[Columns]:
+        """Yield generated column batches of at most batch_size rows"""
+        batch_size = batch_size or self.row_group_size
+        if self.json_generator.columnar:
+            return self.json_generator.compile_columnar(template).iter_columns(count, batch_size)
+        return self._record_batches_of(template, count, batch_size)
+
+    def _record_batches_of(self, template: Dict[str, FieldDefinition], count: int,
+                           batch_size: int) -> Iterator[Columns]:
+        field_names = list(template)
+        for chunk in self.json_generator.iter_generate(template, count, batch_size):
+            yield {field_name: [record[field_name] for record in chunk] for field_name in field_names}
+
+    def write(self, data: Iterable[Dict[str, Any]], stream: TextIO,
+              template: Optional[Dict[str, FieldDefinition]] = None) -> None:
+        """
+        Write records into the binary buffer beneath a text stream (e.g. sys.stdout).
+
+        Parquet and Arrow IPC are binary, so the stream must wrap one (as
+        io.TextIOWrapper does); with no file name the format defaults to
+        Parquet unless file_format is given. Use export_bytes() for an
+        in-memory payload.
+
+        Raises:
+            TypeError: if the stream has no binary buffer, e.g. io.StringIO
+        """
+        buffer = getattr(stream, "buffer", None)
+        if buffer is None:
+            raise TypeError(f"{type(self).__name__} writes binary output; "
+                            f"pass a stream with a binary buffer or use export_bytes()")
+        stream.flush()
+        schema = arrow_schema(template) if template is not None else None
+        self._write_column_batches(pa.PythonFile(buffer, mode="w"), None, self._record_batches(data), schema)
+        buffer.flush()
+
+    def export_bytes(self, data: Iterable[Dict[str, Any]],
+                     template: Optional[Dict[str, FieldDefinition]] = None) -> bytes:
+        """Export records to an in-memory Parquet or Arrow IPC payload"""
+        buffer = io.BytesIO()
+        schema = arrow_schema(template) if template is not None else None
+        self._write_column_batches(pa.PythonFile(buffer, mode="w"), None, self._record_batches(data), schema)
+        return buffer.getvalue()
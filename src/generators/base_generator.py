@@ -1,8 +1,12 @@
 # src/generators/base_generator.py
+import io
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from itertools import chain
+from typing import Dict, Any, Iterable, Iterator, List, TextIO
 from ..data_types.field_types import FieldDefinition
 
+DEFAULT_CHUNK_SIZE = 10000
+
 class DataGenerator(ABC):
     """
     Abstract base class for all data generators following the Interface Segregation Principle.
@@ -24,12 +28,68 @@ class DataGenerator(ABC):
         pass
     
     @abstractmethod
-    def export(self, data: List[Dict[str, Any]], filepath: str) -> None:
+    def iter_generate(self, template: Dict[str, FieldDefinition], count: int,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Generate mock data lazily, one chunk at a time.
+        
+        Unique constraints are enforced across all chunks of one call.
+        
+        Args:
+            template: Dictionary defining the data structure and constraints
+            count: Total number of records to generate
+            chunk_size: Maximum number of records per chunk
+            
+        Returns:
+            Iterator over lists of generated data records
+        """
+        pass
+    
+    @abstractmethod
+    def export(self, data: Iterable[Dict[str, Any]], filepath: str) -> None:
         """
         Export generated data to a file.
         
         Args:
-            data: List of generated data records
+            data: Generated data records; any iterable is consumed incrementally
+            filepath: Path to save the exported file
+        """
+        pass
+    
+    @abstractmethod
+    def write(self, data: Iterable[Dict[str, Any]], stream: TextIO) -> None:
+        """
+        Write generated data to an open text stream (a file, sys.stdout, ...).
+        
+        Args:
+            data: Generated data records; any iterable is consumed incrementally
+            stream: Destination stream; it is left open
+        """
+        pass
+    
+    def export_bytes(self, data: Iterable[Dict[str, Any]], **options) -> bytes:
+        """
+        Export generated data to an in-memory UTF-8 payload (e.g. for HTTP or UI downloads).
+        
+        The payload matches what export() writes to a file; options are passed to write().
+        """
+        buffer = io.BytesIO()
+        stream = io.TextIOWrapper(buffer, encoding="utf-8", newline="")
+        self.write(data, stream, **options)
+        stream.flush()
+        payload = buffer.getvalue()
+        stream.close()
+        return payload
+    
+    def export_stream(self, template: Dict[str, FieldDefinition], count: int, filepath: str,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Generate and export records chunk by chunk without materializing the dataset.
+        
+        Args:
+            template: Dictionary defining the data structure and constraints
+            count: Total number of records to generate
             filepath: Path to save the exported file
+            chunk_size: Maximum number of records held in memory at once
         """
-        pass
\ No newline at end of file
+        self.export(chain.from_iterable(self.iter_generate(template, count, chunk_size)), filepath)
@@ -0,0 +1,129 @@
+# src/generators/batch.py
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+Row = Tuple[Any, ...]
+
+class RecordView(Mapping):
+    """
+    Read-only dict view of one row of a RecordBatch.
+
+    Built on access and holding only (batch, row), so code written for
+    dict records keeps working without a dict per row being stored.
+    """
+    __slots__ = ("_batch", "_row")
+
+    def __init__(self, batch: "RecordBatch", row: int):
+        self._batch = batch
+        self._row = row
+
+    def __getitem__(self, field_name: str) -> Any:
+        return self._batch.value(self._row, field_name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._batch.fields)
+
+    def __len__(self) -> int:
+        return len(self._batch.fields)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+class RecordBatch(Sequence):
+    """
+    Compact batch of records sharing one tuple of field names.
+
+    Rows are stored either as tuples (row plans) or as one list per field
+    (columnar plans), so field names are stored once per batch instead of
+    once per record. Indexing and iteration give RecordView mappings;
+    exporters read iter_rows() or columns directly.
+    """
+    __slots__ = ("fields", "_rows", "_columns", "_index")
+
+    def __init__(self, fields: Tuple[str, ...], rows: Optional[List[Row]] = None,
+                 columns: Optional[Dict[str, List[Any]]] = None):
+        """
+        Args:
+            fields: Field names, in record order
+            rows: One tuple of values per record, in field order
+            columns: One list of values per field; exactly one of rows and columns is given
+        """
+        if (rows is None) == (columns is None):
+            raise ValueError("a record batch needs either rows or columns")
+        self.fields = tuple(fields)
+        self._rows = rows
+        self._columns = columns
+        self._index = {field_name: position for position, field_name in enumerate(self.fields)}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]],
+                     fields: Optional[Tuple[str, ...]] = None) -> "RecordBatch":
+        """Pack dict records; fields default to the keys of the first record"""
+        records = list(records)
+        if fields is None:
+            fields = tuple(records[0]) if records else ()
+        return cls(fields, rows=[tuple(record[field_name] for field_name in fields) for record in records])
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List[Any]]) -> "RecordBatch":
+        """Wrap a column batch without copying it"""
+        return cls(tuple(columns), columns=columns)
+
+    @property
+    def is_columnar(self) -> bool:
+        return self._columns is not None
+
+    @property
+    def columns(self) -> Dict[str, List[Any]]:
+        """One list per field (transposed on demand for row batches)"""
+        if self._columns is not None:
+            return self._columns
+        if not self._rows:
+            return {field_name: [] for field_name in self.fields}
+        return {field_name: list(values) for field_name, values in zip(self.fields, zip(*self._rows))}
+
+    def iter_rows(self) -> Iterator[Row]:
+        """Rows as tuples in field order"""
+        if self._rows is not None:
+            return iter(self._rows)
+        return zip(*self._columns.values())
+
+    def column(self, field_name: str) -> List[Any]:
+        """All values of one field"""
+        if self._columns is not None:
+            return self._columns[field_name]
+        position = self._index[field_name]
+        return [row[position] for row in self._rows]
+
+    def value(self, row: int, field_name: str) -> Any:
+        """One value, without building a view"""
+        if self._columns is not None:
+            return self._columns[field_name][row]
+        return self._rows[row][self._index[field_name]]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize plain dict records"""
+        fields = self.fields
+        return [dict(zip(fields, row)) for row in self.iter_rows()]
+
+    def __len__(self) -> int:
+        if self._rows is not None:
+            return len(self._rows)
+        return len(next(iter(self._columns.values()), ()))
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[RecordView, List[RecordView]]:
+        if isinstance(key, slice):
+            return [RecordView(self, row) for row in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("record index out of range")
+        return RecordView(self, key)
+
+    def __iter__(self) -> Iterator[RecordView]:
+        for row in range(len(self)):
+            yield RecordView(self, row)
+
+    def __repr__(self) -> str:
+        layout = "columns" if self.is_columnar else "rows"
+        return f"RecordBatch({len(self)} {layout}, fields={self.fields!r})"
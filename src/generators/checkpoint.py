@@ -0,0 +1,261 @@
+# src/generators/checkpoint.py
+import csv
+import hashlib
+import io
+import os
+import pickle
+import random
+import tempfile
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, TextIO, Type
+from ..data_types.field_types import FieldDefinition
+from .base_generator import DataGenerator, DEFAULT_CHUNK_SIZE
+from .batch import RecordBatch
+from .compression import compression_for
+from .csv_generator import CSVGenerator
+from .json_generator import JSONGenerator
+from .json_writer import JSONArrayWriter, JSONLinesWriter, is_json_lines_path
+from .unique import check_capacity
+from .xml_generator import XMLGenerator
+from .xml_writer import XMLStreamWriter
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_EXTENSION = ".checkpoint"
+DEFAULT_CHECKPOINT_EVERY = 1000000  # Rows between checkpoints (rounded up to whole chunks)
+
+@dataclass
+class Checkpoint:
+    """Everything needed to continue a job exactly where it stopped"""
+    version: int
+    job_key: str
+    seed: int
+    reference_date: date
+    rows: int  # Records already in the output file
+    position: int  # Byte length of the output file at this checkpoint
+    random_state: Any
+    faker_states: List[Any]
+    numpy_state: Optional[Dict[str, Any]]  # Columnar plans only
+    unique_states: Dict[str, Dict[str, Any]]
+
+class _CSVBatchWriter:
+    """CSV batch writer whose header state survives a restart"""
+
+    def __init__(self, stream: TextIO, header_written: bool):
+        self._writer = csv.writer(stream)
+        self.header_written = header_written
+
+    def write_batch(self, batch: RecordBatch) -> None:
+        if not len(batch):
+            return
+        if not self.header_written:
+            self._writer.writerow(batch.fields)
+            self.header_written = True
+        self._writer.writerows(batch.iter_rows())
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+def read_checkpoint(checkpoint_path: str) -> Optional[Checkpoint]:
+    """Load a checkpoint, or None if there is none (checkpoints are pickles: only load your own)"""
+    try:
+        with open(checkpoint_path, "rb") as f:
+            checkpoint = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    if not isinstance(checkpoint, Checkpoint) or checkpoint.version != CHECKPOINT_VERSION:
+        raise ValueError(f"{checkpoint_path} is not a checkpoint of this version")
+    return checkpoint
+
+def write_checkpoint(checkpoint_path: str, checkpoint: Checkpoint) -> None:
+    """Write atomically and durably, so a crash leaves either the old or the new checkpoint"""
+    directory = os.path.dirname(os.path.abspath(checkpoint_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, checkpoint_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+class GenerationJob:
+    """
+    Resumable single-file generation with periodic checkpoints.
+
+    Every checkpoint_every rows the output is flushed to disk and a checkpoint
+    records the Python, Faker and NumPy RNG states, the unique samplers' state,
+    the row offset and the output file's length. Running a job whose
+    checkpoint exists truncates the file to that length, restores the states
+    and appends from there, so the finished file is byte-identical to
+    generator.export_stream(template, count, filepath, chunk_size) with the
+    same seed and options. The checkpoint is removed once the file is complete.
+
+    Supports CSV, JSON/JSON Lines and XML output without compression; a
+    compressed stream cannot be truncated and appended to.
+    """
+
+    def __init__(self, generator_cls: Type[DataGenerator], template: Dict[str, FieldDefinition],
+                 count: int, filepath: str, checkpoint_path: Optional[str] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+                 seed: Optional[int] = None, reference_date: Optional[date] = None, **options):
+        """
+        Args:
+            generator_cls: CSVGenerator, JSONGenerator or XMLGenerator
+            template: Field definitions for every record
+            count: Total number of records in the finished file
+            filepath: Output file; .jsonl/.ndjson selects JSON Lines
+            checkpoint_path: Defaults to filepath + ".checkpoint"
+            chunk_size: Records generated and written per batch
+            checkpoint_every: Records between checkpoints
+            seed: Master seed; a random one is chosen (and checkpointed) when omitted
+            reference_date: Last day of the DATE range; defaults to the day the job started
+            options: Further generator options (columnar, unique, pool_size, locale, stats)
+        """
+        if generator_cls not in (CSVGenerator, JSONGenerator, XMLGenerator):
+            raise ValueError("resumable jobs support CSVGenerator, JSONGenerator and XMLGenerator")
+        if compression_for(filepath) is not None:
+            raise ValueError("resumable jobs cannot append to compressed output")
+        if count < 0 or chunk_size < 1 or checkpoint_every < 1:
+            raise ValueError("count must be non-negative, chunk_size and checkpoint_every positive")
+        self.generator_cls = generator_cls
+        self.template = template
+        self.count = count
+        self.filepath = filepath
+        self.checkpoint_path = checkpoint_path or filepath + CHECKPOINT_EXTENSION
+        self.chunk_size = chunk_size
+        self.checkpoint_every = checkpoint_every
+        self.seed = seed
+        self.reference_date = reference_date
+        self.options = options
+        self.lines = generator_cls is JSONGenerator and is_json_lines_path(filepath)
+        self.rows = 0
+
+    @property
+    def job_key(self) -> str:
+        """Fingerprint of everything that determines the output except seed and reference date"""
+        description = repr((CHECKPOINT_VERSION, self.generator_cls.__name__, list(self.template.items()),
+                            self.count, self.chunk_size, self.lines, sorted(self.options.items())))
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def _load(self) -> Optional[Checkpoint]:
+        checkpoint = read_checkpoint(self.checkpoint_path)
+        if checkpoint is None:
+            return None
+        if checkpoint.job_key != self.job_key:
+            raise ValueError(f"{self.checkpoint_path} belongs to a different job "
+                             f"(template, count, chunk size or options changed)")
+        if self.seed is not None and checkpoint.seed != self.seed:
+            raise ValueError(f"{self.checkpoint_path} was written with seed {checkpoint.seed}")
+        if self.reference_date is not None and checkpoint.reference_date != self.reference_date:
+            raise ValueError(f"{self.checkpoint_path} was written with reference date "
+                             f"{checkpoint.reference_date}")
+        return checkpoint
+
+    def _writer(self, stream: TextIO, rows: int):
+        if self.generator_cls is CSVGenerator:
+            return _CSVBatchWriter(stream, header_written=rows > 0)
+        if self.generator_cls is XMLGenerator:
+            writer = XMLStreamWriter(stream)
+        elif self.lines:
+            writer = JSONLinesWriter(stream)
+        else:
+            writer = JSONArrayWriter(stream)
+        writer.records_written = rows
+        return writer
+
+    def run(self, stop_after: Optional[int] = None) -> int:
+        """
+        Generate until the file is complete, resuming from the checkpoint if there is one.
+
+        Args:
+            stop_after: Stop (with a checkpoint) once at least this many more
+                records have been written in this run, e.g. for time-boxed runs
+
+        Returns:
+            Number of records in the output file; equals count when it is complete
+        """
+        checkpoint = self._load()
+        if checkpoint is None:
+            seed = self.seed if self.seed is not None else random.SystemRandom().randrange(2 ** 32)
+            reference_date = self.reference_date or date.today()
+        else:
+            seed, reference_date = checkpoint.seed, checkpoint.reference_date
+
+        # A fresh generator compiles exactly as the original did (the same
+        # compile-time draws); the checkpointed states then replace its own
+        generator = self.generator_cls(seed=seed, reference_date=reference_date, **self.options)
+        json_generator = getattr(generator, "json_generator", generator)
+        if json_generator.columnar:
+            plan = json_generator.compile_columnar(self.template)
+            samplers = plan.scalar_plan.unique_samplers
+        else:
+            plan = json_generator.compile(self.template)
+            samplers = plan.unique_samplers
+        faker_randoms = [factory.random for factory in json_generator.fake.factories]
+
+        if checkpoint is None:
+            rows = 0
+            raw = open(self.filepath, "w+b")
+        else:
+            json_generator.random.setstate(checkpoint.random_state)
+            for faker_random, state in zip(faker_randoms, checkpoint.faker_states):
+                faker_random.setstate(state)
+            if checkpoint.numpy_state is not None:
+                plan.np_rng.bit_generator.state = checkpoint.numpy_state
+            for field_name, state in checkpoint.unique_states.items():
+                samplers[field_name].set_state(state)
+            rows = checkpoint.rows
+            raw = open(self.filepath, "r+b")
+            if os.fstat(raw.fileno()).st_size < checkpoint.position:
+                raw.close()
+                raise ValueError(f"{self.filepath} is shorter than its checkpoint")
+            # Anything written after the checkpoint is regenerated
+            raw.truncate(checkpoint.position)
+            raw.seek(checkpoint.position)
+
+        def save() -> None:
+            writer.flush()
+            stream.flush()
+            os.fsync(raw.fileno())
+            write_checkpoint(self.checkpoint_path, Checkpoint(
+                version=CHECKPOINT_VERSION,
+                job_key=self.job_key,
+                seed=seed,
+                reference_date=reference_date,
+                rows=rows,
+                position=raw.tell(),
+                random_state=json_generator.random.getstate(),
+                faker_states=[faker_random.getstate() for faker_random in faker_randoms],
+                numpy_state=plan.np_rng.bit_generator.state if json_generator.columnar else None,
+                unique_states={field_name: sampler.get_state() for field_name, sampler in samplers.items()},
+            ))
+
+        stream = io.TextIOWrapper(raw, encoding="utf-8",
+                                  newline="" if self.generator_cls is CSVGenerator else None)
+        with stream:
+            writer = self._writer(stream, rows)
+            check_capacity(list(samplers.values()), self.count - rows)
+            limit = self.count if stop_after is None else min(self.count, rows + stop_after)
+            checkpointed = rows
+            while rows < limit:
+                size = min(self.chunk_size, self.count - rows)
+                writer.write_batch(plan.generate_batch(size))
+                rows += size
+                if rows - checkpointed >= self.checkpoint_every and rows < self.count:
+                    save()
+                    checkpointed = rows
+            if rows == self.count:
+                writer.close()
+            elif rows > checkpointed:
+                save()
+
+        self.rows = rows
+        if rows == self.count and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        return rows
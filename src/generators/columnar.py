@@ -0,0 +1,240 @@
+# src/generators/columnar.py
+import random
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import numpy as np
+from ..data_types.field_types import DATE_RANGE_DAYS, FieldDefinition, FieldTypes
+from .batch import RecordBatch
+from .distributions import distribution_for, weighted_choices_for
+from .pattern import compile_pattern
+from .plan import NULL_PROBABILITY, GenerationPlan, compile_value
+from .pools import PooledFaker
+from .stats import GenerationStats
+from .unique import UniqueOptions
+
+DEFAULT_BATCH_SIZE = 10000
+
+INT64 = np.iinfo(np.int64)
+
+ColumnFactory = Callable[[int], List[Any]]
+Columns = Dict[str, List[Any]]
+
+def _integer_column(np_rng: np.random.Generator, field_def: FieldDefinition) -> Optional[ColumnFactory]:
+    """NumPy draws for int64 bounds; None (scalar fallback) for wider ranges"""
+    low = field_def.min_value if field_def.min_value is not None else 0
+    high = field_def.max_value if field_def.max_value is not None else 1000
+    if low < INT64.min or high > INT64.max:
+        return None
+    return lambda n: np_rng.integers(low, high, size=n, endpoint=True).tolist()
+
+def _float_column(np_rng: np.random.Generator, field_def: FieldDefinition) -> ColumnFactory:
+    low = float(field_def.min_value if field_def.min_value is not None else 0)
+    high = float(field_def.max_value if field_def.max_value is not None else 1000)
+    return lambda n: np.round(np_rng.uniform(low, high, size=n), 2).tolist()
+
+def _boolean_column(np_rng: np.random.Generator, field_def: FieldDefinition) -> ColumnFactory:
+    return lambda n: (np_rng.random(n) < 0.5).tolist()
+
+def _choice_column(np_rng: np.random.Generator, field_def: FieldDefinition) -> ColumnFactory:
+    weighted = weighted_choices_for(field_def)
+    if weighted is not None:
+        return lambda n: weighted.generate_batch(n, np_rng)
+    choices = np.empty(len(field_def.choices), dtype=object)
+    choices[:] = field_def.choices
+    return lambda n: choices[np_rng.integers(0, len(choices), size=n)].tolist()
+
+def _pattern_column(np_rng: np.random.Generator, field_def: FieldDefinition) -> ColumnFactory:
+    program = compile_pattern(field_def.pattern)
+    return lambda n: program.generate_batch(n, np_rng)
+
+def _pool_column(np_rng: np.random.Generator, pool) -> ColumnFactory:
+    values = np.empty(len(pool), dtype=object)
+    values[:] = pool
+    return lambda n: values[np_rng.integers(0, len(values), size=n)].tolist()
+
+def _date_column(np_rng: np.random.Generator, field_def: FieldDefinition,
+                 reference_date: Optional[date] = None) -> ColumnFactory:
+    end = np.datetime64(reference_date or datetime.now().date(), "D")
+    start = end - DATE_RANGE_DAYS
+    # datetime64[D] converts to datetime.date in tolist()
+    return lambda n: (start + np_rng.integers(0, DATE_RANGE_DAYS, size=n, endpoint=True)).tolist()
+
+def vectorized_column(np_rng: np.random.Generator, field_def: FieldDefinition,
+                      reference_date: Optional[date] = None, fake=None) -> Optional[ColumnFactory]:
+    """
+    Return a NumPy column factory for the field, or None if it has no vectorized form.
+    Null injection is not applied. Pooled Faker fields are vectorized when fake
+    is a PooledFaker.
+    """
+    if field_def.unique:
+        return None
+    if isinstance(fake, PooledFaker):
+        pool = fake.pool(field_def.field_type)
+        if pool is not None:
+            return _pool_column(np_rng, pool)
+
+    distribution = distribution_for(field_def)
+    if distribution is not None:
+        return lambda n: distribution.generate_batch(n, np_rng)
+
+    field_type = field_def.field_type
+    if field_type == FieldTypes.STRING and field_def.choices:
+        return _choice_column(np_rng, field_def)
+    elif field_type == FieldTypes.STRING and field_def.pattern:
+        return _pattern_column(np_rng, field_def)
+    elif field_type == FieldTypes.INTEGER:
+        return _integer_column(np_rng, field_def)
+    elif field_type == FieldTypes.FLOAT:
+        return _float_column(np_rng, field_def)
+    elif field_type == FieldTypes.BOOLEAN:
+        return _boolean_column(np_rng, field_def)
+    elif field_type == FieldTypes.DATE:
+        return _date_column(np_rng, field_def, reference_date)
+    return None
+
+class ColumnarPlan:
+    """
+    Batch generation plan that fills one column at a time.
+
+    INTEGER, FLOAT, BOOLEAN, DATE and choice or pattern STRING columns are
+    drawn with NumPy per batch; every other field falls back to the scalar
+    callables of a GenerationPlan, and unique fields use its samplers. Rows
+    are only assembled when requested, so columnar consumers can take the
+    batches directly. With stats, every column call is timed exactly.
+    """
+
+    def __init__(self, template: Dict[str, FieldDefinition], fake, rng=random,
+                 np_rng: Optional[np.random.Generator] = None, reference_date: Optional[date] = None,
+                 unique: Optional[UniqueOptions] = None, stats: Optional[GenerationStats] = None):
+        self.np_rng = np_rng if np_rng is not None else np.random.default_rng()
+        self.reference_date = reference_date
+        self.stats = stats
+        self.template = template
+        self.scalar_plan = GenerationPlan(template, fake, rng, reference_date, unique)
+        self.field_names = self.scalar_plan.field_names
+        self.vectorized_fields: List[str] = []
+        self.columns: Dict[str, ColumnFactory] = {
+            field_name: self._compile_column(field_name, field_def, fake, rng)
+            for field_name, field_def in template.items()
+        }
+
+    def _compile_column(self, field_name: str, field_def: FieldDefinition, fake, rng) -> ColumnFactory:
+        if field_def.unique:
+            # The scalar plan's unique sampler already applies null injection
+            sampler = self.scalar_plan.field(field_name).generate
+            return lambda n: [sampler() for _ in range(n)]
+
+        column = vectorized_column(self.np_rng, field_def, self.reference_date, fake)
+        if column is not None:
+            self.vectorized_fields.append(field_name)
+        else:
+            factory = compile_value(field_def, fake, rng, self.reference_date)
+            column = lambda n: [factory() for _ in range(n)]
+
+        if not field_def.nullable:
+            return column
+
+        np_rng = self.np_rng
+
+        def nullable_column(n: int) -> List[Any]:
+            values = column(n)
+            for index in np.flatnonzero(np_rng.random(n) < NULL_PROBABILITY).tolist():
+                values[index] = None
+            return values
+
+        return nullable_column
+
+    def generate_columns(self, count: int) -> Columns:
+        """
+        Generate one batch as columns.
+
+        Args:
+            count: Number of values per column
+
+        Returns:
+            Mapping of field name to a list of count values
+        """
+        if self.stats is not None:
+            return self._generate_columns_instrumented(count)
+        self.scalar_plan.check_capacity(count)
+        return {field_name: column(count) for field_name, column in self.columns.items()}
+
+    def _generate_columns_instrumented(self, count: int) -> Columns:
+        stats = self.stats
+        perf_counter = time.perf_counter
+        start = perf_counter()
+        columns: Columns = {}
+        try:
+            self.scalar_plan.check_capacity(count)
+            for field_name, column in self.columns.items():
+                field_def = self.template[field_name]
+                started = perf_counter()
+                values = column(count)
+                field_stats = stats.field(field_name, field_def.field_type)
+                field_stats.timed_seconds += perf_counter() - started
+                field_stats.values += count
+                field_stats.timed_values += count
+                if field_def.nullable:
+                    field_stats.nulls += values.count(None)
+                columns[field_name] = values
+        finally:
+            stats.observe_unique(self.scalar_plan.unique_samplers)
+        stats.add_batch(count, perf_counter() - start)
+        return columns
+
+    def iter_columns(self, count: int, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Columns]:
+        """Yield column batches of at most batch_size rows until count rows are produced"""
+        self.scalar_plan.check_capacity(count)
+        remaining = count
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            yield self.generate_columns(size)
+            remaining -= size
+
+    def generate_batch(self, count: int) -> RecordBatch:
+        """Generate one batch as a column-backed RecordBatch"""
+        return RecordBatch.from_columns(self.generate_columns(count))
+
+    def generate(self, count: int, batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """
+        Generate records column by column and assemble rows at the end.
+
+        Args:
+            count: Number of records to generate
+            batch_size: Rows drawn per column call
+
+        Returns:
+            List of generated data records
+        """
+        result = []
+        for columns in self.iter_columns(count, batch_size):
+            result.extend(columns_to_records(columns))
+        return result
+
+def columns_to_records(columns: Columns) -> List[Dict[str, Any]]:
+    """Assemble a column batch into row dictionaries"""
+    field_names = tuple(columns)
+    return [dict(zip(field_names, row)) for row in zip(*columns.values())]
+
+def compile_columnar(template: Dict[str, FieldDefinition], fake, rng=random,
+                     np_rng: Optional[np.random.Generator] = None,
+                     reference_date: Optional[date] = None,
+                     unique: Optional[UniqueOptions] = None,
+                     stats: Optional[GenerationStats] = None) -> ColumnarPlan:
+    """
+    Compile a template into a columnar generation plan.
+
+    Args:
+        template: Dictionary defining the data structure and constraints
+        fake: Faker instance used for non-vectorized fields
+        rng: Random source for non-vectorized fields
+        np_rng: NumPy generator for vectorized columns
+        reference_date: Last day of the DATE range; defaults to today
+        unique: Unique sampling settings for unique fields
+        stats: Instrumentation to record into; None disables it
+
+    Returns:
+        ColumnarPlan producing whole columns per batch
+    """
+    return ColumnarPlan(template, fake, rng, np_rng, reference_date, unique, stats)
@@ -0,0 +1,183 @@
+# src/generators/compression.py
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Optional, TextIO
+
+GZIP = "gzip"
+BZ2 = "bz2"
+XZ = "xz"
+
+COMPRESSION_EXTENSIONS = {
+    ".gz": GZIP,
+    ".bz2": BZ2,
+    ".xz": XZ,
+}
+DEFAULT_LEVELS = {GZIP: 6, BZ2: 9, XZ: 6}
+BLOCK_SIZE = 1 << 20  # Bytes handed to the compression thread at a time
+QUEUE_BLOCKS = 8  # Blocks buffered between the writer and the compression thread
+
+def compression_for(filepath: str, compression: Optional[str] = None) -> Optional[str]:
+    """Explicit compression, else the one implied by the file extension, else None"""
+    if compression is not None:
+        if compression not in DEFAULT_LEVELS:
+            raise ValueError(f"unknown compression: {compression}")
+        return compression
+    lowered = filepath.lower()
+    for extension, name in COMPRESSION_EXTENSIONS.items():
+        if lowered.endswith(extension):
+            return name
+    return None
+
+def strip_compression_extension(filepath: str) -> str:
+    """Path without a trailing .gz/.bz2/.xz, so the inner extension selects the format"""
+    lowered = filepath.lower()
+    for extension in COMPRESSION_EXTENSIONS:
+        if lowered.endswith(extension):
+            return filepath[:-len(extension)]
+    return filepath
+
+def open_input(filepath: str, newline: Optional[str] = None) -> TextIO:
+    """Open a text file for reading, decompressing .gz/.bz2/.xz files on the fly"""
+    compression = compression_for(filepath)
+    if compression == GZIP:
+        return gzip.open(filepath, "rt", encoding="utf-8", newline=newline)
+    elif compression == BZ2:
+        return bz2.open(filepath, "rt", encoding="utf-8", newline=newline)
+    elif compression == XZ:
+        return lzma.open(filepath, "rt", encoding="utf-8", newline=newline)
+    return open(filepath, encoding="utf-8", newline=newline)
+
+def _compressor(compression: str, level: int):
+    if compression == GZIP:
+        # wbits=31 writes a gzip container; the header carries no name or mtime,
+        # so equal input always gives byte-identical files
+        return zlib.compressobj(level, zlib.DEFLATED, 31)
+    elif compression == BZ2:
+        return bz2.BZ2Compressor(level)
+    return lzma.LZMACompressor(preset=level)
+
+@dataclass
+class CompressionStats:
+    """Result of one compressed write"""
+    compression: str
+    level: int
+    bytes_in: int = 0
+    bytes_out: int = 0
+    seconds: float = 0.0  # Time the compression thread spent compressing
+
+    @property
+    def ratio(self) -> float:
+        """Uncompressed size divided by compressed size"""
+        return self.bytes_in / self.bytes_out if self.bytes_out else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Uncompressed bytes compressed per second of compression time"""
+        return self.bytes_in / self.seconds if self.seconds > 0 else 0.0
+
+class BackgroundCompressor(io.RawIOBase):
+    """
+    Binary sink that compresses on a background thread.
+
+    Writes are queued (bounded, so memory stays flat) and compressed and
+    written to the file by a worker thread. zlib, bz2 and lzma release the
+    GIL while compressing, so compression overlaps generation.
+    """
+
+    def __init__(self, filepath: str, compression: str, level: Optional[int] = None):
+        super().__init__()
+        level = DEFAULT_LEVELS[compression] if level is None else level
+        self.stats = CompressionStats(compression, level)
+        self._compressor = _compressor(compression, level)
+        self._file = open(filepath, "wb")
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=QUEUE_BLOCKS)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="compressor", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        compress, write, stats = self._compressor.compress, self._file.write, self.stats
+        finished = False
+        try:
+            while True:
+                block = self._queue.get()
+                if block is None:
+                    finished = True
+                    break
+                start = time.perf_counter()
+                out = compress(block)
+                stats.seconds += time.perf_counter() - start
+                stats.bytes_out += len(out)
+                write(out)
+            out = self._compressor.flush()
+            stats.bytes_out += len(out)
+            write(out)
+        except BaseException as exc:  # Surfaced to the writer on its next call
+            self._error = exc
+            # Keep draining so a blocked writer can reach close()
+            while not finished:
+                finished = self._queue.get() is None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self._error is not None:
+            raise self._error
+        block = bytes(data)
+        self.stats.bytes_in += len(block)
+        # The worker always consumes (even after a failure), so this cannot block forever
+        self._queue.put(block)
+        return len(block)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._queue.put(None)
+            self._thread.join()
+        finally:
+            self._file.close()
+            super().close()
+        if self._error is not None:
+            raise self._error
+
+class OutputFile:
+    """
+    Text output file, transparently compressed when requested.
+
+    Compression is selected by `compression` ("gzip", "bz2", "xz") or by a
+    .gz/.bz2/.xz extension. After the with-block, `stats` holds the
+    CompressionStats (None for plain files).
+    """
+
+    def __init__(self, filepath: str, compression: Optional[str] = None,
+                 level: Optional[int] = None, newline: Optional[str] = None):
+        self.filepath = filepath
+        self.compression = compression_for(filepath, compression)
+        self.level = level
+        self.newline = newline
+        self.stats: Optional[CompressionStats] = None
+        self._stream: Optional[TextIO] = None
+        self._sink: Optional[BackgroundCompressor] = None
+
+    def __enter__(self) -> TextIO:
+        if self.compression is None:
+            self._stream = open(self.filepath, "w", encoding="utf-8", newline=self.newline)
+        else:
+            self._sink = BackgroundCompressor(self.filepath, self.compression, self.level)
+            buffered = io.BufferedWriter(self._sink, buffer_size=BLOCK_SIZE)
+            self._stream = io.TextIOWrapper(buffered, encoding="utf-8", newline=self.newline)
+        return self._stream
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self._stream.close()
+        if self._sink is not None:
+            self.stats = self._sink.stats
@@ -1,26 +1,120 @@
 # src/generators/csv_generator.py
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TextIO, Tuple
 import csv
-from .base_generator import DataGenerator
+from itertools import chain
+from .base_generator import DataGenerator, DEFAULT_CHUNK_SIZE
+from .batch import RecordBatch
 from .json_generator import JSONGenerator  # Added this import
+from .compression import OutputFile
+from .stats import GenerationStats, measure_export
 from ..data_types.field_types import FieldDefinition
 
 class CSVGenerator(DataGenerator):
-    def __init__(self):
-        self.json_generator = JSONGenerator()  # Reuse JSON generator for field generation
+    def __init__(self, **options):
+        """Options (columnar, seed, reference_date) are forwarded to the JSON generator"""
+        self.json_generator = JSONGenerator(**options)  # Reuse JSON generator for field generation
+        
+    @property
+    def stats(self) -> Optional[GenerationStats]:
+        """Instrumentation shared with the JSON generator (enabled with stats=True)"""
+        return self.json_generator.stats
         
     def generate(self, template: Dict[str, FieldDefinition], count: int) -> List[Dict[str, Any]]:
         """Generate data using JSON generator for consistency"""
         return self.json_generator.generate(template, count)
     
-    def export(self, data: List[Dict[str, Any]], filepath: str) -> None:
-        """Export data to CSV format"""
-        if not data:
+    def generate_with_stats(self, template: Dict[str, FieldDefinition],
+                            count: int) -> Tuple[List[Dict[str, Any]], GenerationStats]:
+        """Generate data and return it with the generator's instrumentation"""
+        return self.json_generator.generate_with_stats(template, count)
+    
+    def iter_generate(self, template: Dict[str, FieldDefinition], count: int,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """Stream data chunks using JSON generator for consistency"""
+        return self.json_generator.iter_generate(template, count, chunk_size)
+    
+    def iter_batches(self, template: Dict[str, FieldDefinition], count: int,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[RecordBatch]:
+        """Stream compact RecordBatches using JSON generator for consistency"""
+        return self.json_generator.iter_batches(template, count, chunk_size)
+    
+    def write(self, data: Iterable[Dict[str, Any]], stream: TextIO) -> None:
+        """Write data as CSV to an open stream; nothing is written for empty data"""
+        records = iter(data)
+        first = next(records, None)
+        if first is None:
             return
             
-        fieldnames = data[0].keys()
+        writer = csv.DictWriter(stream, fieldnames=first.keys())
+        writer.writeheader()
+        writer.writerow(first)
+        writer.writerows(records)
+    
+    def export(self, data: Iterable[Dict[str, Any]], filepath: str,
+               compression: Optional[str] = None, compression_level: Optional[int] = None) -> None:
+        """
+        Export data to CSV format, consuming the records incrementally.
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
\ No newline at end of file
+        Compression ("gzip", "bz2", "xz") defaults to the one implied by a
+        .gz/.bz2/.xz extension and runs on a background thread.
+        """
+        if isinstance(data, RecordBatch):
+            return self.export_batches([data], filepath, compression, compression_level)
+        output = OutputFile(filepath, compression, compression_level, newline='')
+        with measure_export(self.stats, "csv", filepath, data, output=output) as data:
+            records = iter(data)
+            first = next(records, None)
+            if first is None:
+                return
+                
+            with output as f:
+                self.write(chain([first], records), f)
+            
+    def export_columns(self, columns: Dict[str, List[Any]], filepath: str,
+                       compression: Optional[str] = None, compression_level: Optional[int] = None) -> None:
+        """Export a column batch to CSV format without building row dictionaries"""
+        if not columns:
+            return
+            
+        records = len(next(iter(columns.values())))
+        output = OutputFile(filepath, compression, compression_level, newline='')
+        with measure_export(self.stats, "csv", filepath, records=records, output=output):
+            with output as f:
+                writer = csv.writer(f)
+                writer.writerow(columns.keys())
+                writer.writerows(zip(*columns.values()))
+
+    
+    def write_batches(self, batches: Iterable[RecordBatch], stream: TextIO) -> None:
+        """Write RecordBatches as CSV, straight from their tuples or columns"""
+        writer = None
+        for batch in batches:
+            if not len(batch):
+                continue
+            if writer is None:
+                writer = csv.writer(stream)
+                writer.writerow(batch.fields)
+            writer.writerows(batch.iter_rows())
+    
+    def export_batches(self, batches: Iterable[RecordBatch], filepath: str,
+                       compression: Optional[str] = None, compression_level: Optional[int] = None) -> None:
+        """
+        Export RecordBatches to CSV without building row dictionaries.
+        
+        The file is identical to exporting the same records; nothing is written
+        when every batch is empty.
+        """
+        output = OutputFile(filepath, compression, compression_level, newline='')
+        with measure_export(self.stats, "csv", filepath, batches, output=output, batches=True) as batches:
+            batches = iter(batches)
+            first = next((batch for batch in batches if len(batch)), None)
+            if first is None:
+                return
+                
+            with output as f:
+                self.write_batches(chain([first], batches), f)
+    
+    def export_stream(self, template: Dict[str, FieldDefinition], count: int, filepath: str,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Generate and export chunk by chunk as RecordBatches"""
+        self.export_batches(self.iter_batches(template, count, chunk_size), filepath)
@@ -0,0 +1,236 @@
+# src/generators/distributions.py
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from ..data_types.field_types import FieldDefinition, FieldTypes
+
+UNIFORM = "uniform"
+NORMAL = "normal"
+LOGNORMAL = "lognormal"
+EXPONENTIAL = "exponential"
+ZIPF = "zipf"
+LOG_MAX_ZIPF = math.log(2 ** 63 - 1)  # Largest Zipf rank drawn, as in NumPy
+
+# Parameters each distribution accepts; defaults are derived from the field's bounds
+DISTRIBUTION_PARAMS = {
+    UNIFORM: (),
+    NORMAL: ("mean", "stddev"),
+    LOGNORMAL: ("mean", "sigma"),
+    EXPONENTIAL: ("scale",),
+    ZIPF: ("a", "scale"),
+}
+
+class AliasTable:
+    """
+    Vose's alias method: O(1) sampling from a discrete distribution.
+
+    Built once in O(n); every draw is one uniform index and one biased coin,
+    so the cost does not depend on the number of outcomes.
+    """
+
+    def __init__(self, weights: Sequence[float]):
+        size = len(weights)
+        if not size:
+            raise ValueError("weights must not be empty")
+        if any(not math.isfinite(weight) or weight < 0 for weight in weights):
+            raise ValueError("weights must be finite and non-negative")
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("weights must not all be zero")
+        scaled = [weight * size / total for weight in weights]
+        probability = [1.0] * size
+        alias = list(range(size))
+        small = [index for index, weight in enumerate(scaled) if weight < 1.0]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever remains is 1.0 up to rounding error and keeps its own outcome
+        self.size = size
+        self.probability = probability
+        self.alias = alias
+        self._probability = np.array(probability)
+        self._alias = np.array(alias, dtype=np.int64)
+
+    def sample(self, rng) -> int:
+        """Draw one outcome index"""
+        random = rng.random
+        index = int(random() * self.size)
+        return index if random() < self.probability[index] else self.alias[index]
+
+    def sample_batch(self, count: int, np_rng: np.random.Generator) -> np.ndarray:
+        """Draw count outcome indices with NumPy"""
+        indices = np_rng.integers(0, self.size, size=count)
+        return np.where(np_rng.random(count) < self._probability[indices], indices, self._alias[indices])
+
+class WeightedChoices:
+    """Choices drawn in proportion to their weights through an alias table"""
+
+    def __init__(self, choices: Sequence[Any], weights: Sequence[float]):
+        if len(choices) != len(weights):
+            raise ValueError(f"got {len(weights)} weights for {len(choices)} choices")
+        self.choices = tuple(choices)
+        self.table = AliasTable(weights)
+        self._values = np.empty(len(self.choices), dtype=object)
+        self._values[:] = self.choices
+
+    def sampler(self, rng):
+        """Return a zero-argument callable bound to rng"""
+        choices, probability, alias, size = self.choices, self.table.probability, self.table.alias, self.table.size
+        random = rng.random
+
+        def weighted_choice():
+            index = int(random() * size)
+            return choices[index if random() < probability[index] else alias[index]]
+
+        return weighted_choice
+
+    def generate_batch(self, count: int, np_rng: np.random.Generator) -> List[Any]:
+        """Draw count choices with NumPy"""
+        return self._values[self.table.sample_batch(count, np_rng)].tolist()
+
+def _zipf(rng, a: float) -> int:
+    """
+    One Zipf(a) variate from a random.Random (Devroye's rejection method, as in NumPy).
+
+    u ** (-1 / (a - 1)) overflows a float for a close to 1, so it is computed
+    in log space, and candidates beyond the int64 range are rejected as NumPy does.
+    """
+    exponent = -1.0 / (a - 1.0)
+    b = 2.0 ** (a - 1.0)
+    random = rng.random
+    while True:
+        u = 1.0 - random()
+        v = random()
+        log_x = exponent * math.log(u)
+        if log_x >= LOG_MAX_ZIPF:
+            continue
+        x = math.floor(math.exp(log_x))
+        t = (1.0 + 1.0 / x) ** (a - 1.0)
+        if v * x * (t - 1.0) / (b - 1.0) <= t / b:
+            return x
+
+class NumericDistribution:
+    """
+    A non-uniform INTEGER or FLOAT distribution clipped to the field's bounds.
+
+    normal: mean (default: middle of the range), stddev (default: a sixth of the range)
+    lognormal: mean and sigma of the underlying normal; by default the median
+        lies a tenth of the way into the range and sigma is 1
+    exponential: low + an exponential offset of the given scale (default: a tenth of the range)
+    zipf: low + (k - 1) * scale for a Zipf(a) rank k (defaults: a=2, scale=1)
+
+    INTEGER values are rounded to the nearest integer, FLOAT values to cents,
+    like the uniform generators.
+    """
+
+    def __init__(self, kind: str, low: float, high: float, params: Dict[str, float], integer: bool):
+        if kind not in DISTRIBUTION_PARAMS:
+            raise ValueError(f"unknown distribution: {kind}")
+        unknown = set(params) - set(DISTRIBUTION_PARAMS[kind])
+        if unknown:
+            raise ValueError(f"{kind} distribution has unknown parameters: {', '.join(sorted(unknown))}")
+        if low > high:
+            raise ValueError("min_value must not exceed max_value")
+        self.kind = kind
+        self.low = low
+        self.high = high
+        self.integer = integer
+        span = high - low
+        if kind == NORMAL:
+            self.params = {"mean": (low + high) / 2, "stddev": span / 6 or 1.0}
+        elif kind == LOGNORMAL:
+            self.params = {"mean": math.log(max(low + span / 10, 1e-9)), "sigma": 1.0}
+        elif kind == EXPONENTIAL:
+            self.params = {"scale": span / 10 or 1.0}
+        elif kind == ZIPF:
+            self.params = {"a": 2.0, "scale": 1.0}
+        else:
+            self.params = {}
+        self.params.update(params)
+        for name in ("stddev", "sigma", "scale"):
+            if name in self.params and self.params[name] <= 0:
+                raise ValueError(f"{kind} distribution needs a positive {name}")
+        if kind == ZIPF and self.params["a"] <= 1:
+            raise ValueError("zipf distribution needs a > 1")
+
+    def _finish(self, value: float):
+        value = min(max(value, self.low), self.high)
+        return int(round(value)) if self.integer else round(value, 2)
+
+    def _variate(self, rng) -> float:
+        params = self.params
+        if self.kind == NORMAL:
+            return rng.gauss(params["mean"], params["stddev"])
+        elif self.kind == LOGNORMAL:
+            return rng.lognormvariate(params["mean"], params["sigma"])
+        elif self.kind == EXPONENTIAL:
+            return self.low + rng.expovariate(1.0 / params["scale"])
+        elif self.kind == ZIPF:
+            return self.low + (_zipf(rng, params["a"]) - 1) * params["scale"]
+        return rng.uniform(self.low, self.high)
+
+    def sampler(self, rng):
+        """Return a zero-argument callable bound to rng"""
+        variate, finish = self._variate, self._finish
+        return lambda: finish(variate(rng))
+
+    def generate_batch(self, count: int, np_rng: np.random.Generator) -> List[Any]:
+        """Draw count values with NumPy"""
+        params = self.params
+        if self.kind == NORMAL:
+            values = np_rng.normal(params["mean"], params["stddev"], size=count)
+        elif self.kind == LOGNORMAL:
+            values = np_rng.lognormal(params["mean"], params["sigma"], size=count)
+        elif self.kind == EXPONENTIAL:
+            values = self.low + np_rng.exponential(params["scale"], size=count)
+        elif self.kind == ZIPF:
+            values = self.low + (np_rng.zipf(params["a"], size=count) - 1) * params["scale"]
+        else:
+            values = np_rng.uniform(self.low, self.high, size=count)
+        values = np.clip(values, self.low, self.high)
+        if self.integer:
+            return np.rint(values).astype(np.int64).tolist()
+        return np.round(values, 2).tolist()
+
+@lru_cache(maxsize=256)
+def _weighted_choices(choices: Tuple[Any, ...], weights: Tuple[float, ...]) -> WeightedChoices:
+    return WeightedChoices(choices, weights)
+
+@lru_cache(maxsize=256)
+def _numeric_distribution(kind: str, low: float, high: float, params: Tuple[Tuple[str, float], ...],
+                          integer: bool) -> NumericDistribution:
+    return NumericDistribution(kind, low, high, dict(params), integer)
+
+def weighted_choices_for(field_def: FieldDefinition) -> Optional[WeightedChoices]:
+    """
+    The cached weighted sampler of a choice field, or None without weights.
+
+    Raises:
+        ValueError: if the weights do not match the choices or are not a distribution
+    """
+    if not field_def.weights or not field_def.choices:
+        return None
+    return _weighted_choices(tuple(field_def.choices), tuple(float(weight) for weight in field_def.weights))
+
+def distribution_for(field_def: FieldDefinition) -> Optional[NumericDistribution]:
+    """
+    The cached distribution of an INTEGER or FLOAT field, or None for uniform fields.
+
+    Raises:
+        ValueError: on unknown distributions or parameters, or a non-numeric field
+    """
+    if field_def.distribution is None or field_def.distribution == UNIFORM:
+        return None
+    if field_def.field_type not in (FieldTypes.INTEGER, FieldTypes.FLOAT):
+        raise ValueError(f"field '{field_def.name}' is {field_def.field_type}; "
+                         f"distributions apply to integer and float fields")
+    low = field_def.min_value if field_def.min_value is not None else 0
+    high = field_def.max_value if field_def.max_value is not None else 1000
+    params = tuple(sorted((field_def.distribution_params or {}).items()))
+    return _numeric_distribution(field_def.distribution, float(low), float(high), params,
+                                 field_def.field_type == FieldTypes.INTEGER)
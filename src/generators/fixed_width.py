@@ -0,0 +1,371 @@
+# src/generators/fixed_width.py
+import math
+import mmap
+import os
+from datetime import date, datetime
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+from .base_generator import DataGenerator, DEFAULT_CHUNK_SIZE
+from .batch import RecordBatch
+from .json_generator import JSONGenerator
+from .pattern import compile_pattern
+from .pools import POOLED_PROVIDERS, Locale, get_pool
+from .stats import GenerationStats, measure_export
+from ..data_types.field_types import FieldDefinition, FieldTypes
+
+FIXED_WIDTH = "fixed"
+PADDED_CSV = "csv"
+FORMAT_EXTENSIONS = {
+    ".csv": PADDED_CSV,
+}
+DEFAULT_TEXT_WIDTH = 50  # Free-text STRING fields are Faker text of at most 50 characters
+MAX_CHAR_BYTES = 4  # Longest UTF-8 encoding of one character
+MAX_FLOAT_WIDTH = 24  # Longest repr() of a float, e.g. -2.2250738585072014e-308
+NUMERIC_TYPES = (FieldTypes.INTEGER, FieldTypes.FLOAT)
+CSV_QUOTED = frozenset(',"\r\n')
+RECORD_END = b"\n"
+
+class LayoutError(ValueError):
+    """Raised when a field has no width bound or a value does not fit its column"""
+
+def file_format_for(filepath: Optional[str]) -> str:
+    """Padded CSV for .csv paths, fixed-width text otherwise"""
+    if filepath:
+        return FORMAT_EXTENSIONS.get(os.path.splitext(filepath)[1].lower(), FIXED_WIDTH)
+    return FIXED_WIDTH
+
+def format_fixed_value(value: Any) -> str:
+    """Text of one value, as the CSV exporter writes it; None is empty"""
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+def csv_text(text: str) -> str:
+    """Quote text that would not survive padding or splitting: separators, quotes, line breaks, leading spaces"""
+    if text[:1] == " " or not CSV_QUOTED.isdisjoint(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+def _needs_quoting(field_def: FieldDefinition) -> bool:
+    """Whether any value of a field can need CSV quoting"""
+    field_type = field_def.field_type
+    if field_type in NUMERIC_TYPES or field_type in (FieldTypes.BOOLEAN, FieldTypes.DATE):
+        return False
+    if field_type == FieldTypes.STRING and field_def.choices:
+        return any(csv_text(text) != text for text in map(format_fixed_value, field_def.choices))
+    if field_type == FieldTypes.STRING and field_def.pattern:
+        alphabet = compile_pattern(field_def.pattern).alphabet
+        return not CSV_QUOTED.isdisjoint(alphabet) or " " in alphabet
+    return True
+
+def _widest(values: Iterable[Any], encode: Callable[[str], str]) -> int:
+    return max((len(encode(format_fixed_value(value)).encode()) for value in values), default=0)
+
+def field_width(field_def: FieldDefinition, padded_csv: bool = False, pool_size: Optional[int] = None,
+                locale: Locale = None) -> Optional[int]:
+    """
+    Bytes needed for the longest value a field can produce, or None if it is unbounded.
+
+    Numbers are bounded by min_value/max_value, choices and Faker pools by
+    their longest member, patterns by their program's max_bytes and free
+    text by Faker's 50-character limit at up to 4 UTF-8 bytes a character,
+    whatever the locale. Unpooled names, emails, phones and addresses have
+    no bound. With padded_csv, room for quoting is included.
+    """
+    encode = csv_text if padded_csv else str
+    field_type = field_def.field_type
+    if field_type in NUMERIC_TYPES:
+        low = field_def.min_value if field_def.min_value is not None else 0
+        high = field_def.max_value if field_def.max_value is not None else 1000
+        if field_type == FieldTypes.INTEGER:
+            return max(len(str(math.floor(low))), len(str(math.ceil(high))))
+        magnitude = max(abs(low), abs(high))
+        if magnitude >= 1e16:
+            return MAX_FLOAT_WIDTH
+        # Values are rounded to cents, so repr() never needs more than two decimals
+        return len(str(int(magnitude))) + 3 + (low < 0)
+    elif field_type == FieldTypes.BOOLEAN:
+        return len("False")
+    elif field_type == FieldTypes.DATE:
+        return len("YYYY-MM-DD")
+    elif field_type == FieldTypes.STRING:
+        if field_def.choices:
+            return _widest(field_def.choices, encode)
+        elif field_def.pattern:
+            program = compile_pattern(field_def.pattern)
+            if not padded_csv or not _needs_quoting(field_def):
+                return program.max_bytes
+            # Quoting adds two quotes and doubles any quote characters
+            return (2 * program.max_bytes if '"' in program.alphabet else program.max_bytes) + 2
+        return DEFAULT_TEXT_WIDTH * MAX_CHAR_BYTES + 2 * padded_csv
+    elif field_type in POOLED_PROVIDERS:
+        if not pool_size:
+            return None
+        return _widest(get_pool(field_type, pool_size, locale), encode)
+    return 0
+
+class FixedWidthColumn(NamedTuple):
+    """One column of a fixed-width record: bytes [start, start + width)"""
+    name: str
+    start: int
+    width: int
+    align_right: bool
+
+class FixedWidthLayout:
+    """
+    Byte layout of fixed-size records derived from a template.
+
+    Fixed-width text ("fixed") concatenates the padded columns, left-aligned
+    text and right-aligned numbers. Padded CSV ("csv") right-aligns every
+    column and separates them with commas, quoting values that contain
+    separators, quotes, line breaks or leading spaces, so readers recover
+    the values with skipinitialspace. Either way every record is
+    record_size bytes including its newline, so record i starts at
+    offset(i) and independent writers can fill one file in place.
+    """
+
+    def __init__(self, template: Dict[str, FieldDefinition], file_format: str = FIXED_WIDTH,
+                 widths: Optional[Dict[str, int]] = None, pool_size: Optional[int] = None,
+                 locale: Locale = None):
+        """
+        Args:
+            template: Field definitions, in column order
+            file_format: "fixed" or "csv"
+            widths: Column widths in bytes overriding the derived ones; required
+                for unpooled NAME/EMAIL/PHONE/ADDRESS fields
+            pool_size: Faker pool size of the generator, so pooled fields are
+                sized by their longest pooled value
+            locale: Faker locale(s) of the generator's pools
+
+        Raises:
+            LayoutError: if a field has no width bound and no explicit width
+        """
+        if file_format not in (FIXED_WIDTH, PADDED_CSV):
+            raise ValueError(f"unknown fixed-width format: {file_format}")
+        widths = widths or {}
+        unknown = set(widths) - set(template)
+        if unknown:
+            raise ValueError(f"widths given for unknown fields: {', '.join(sorted(unknown))}")
+        self.file_format = file_format
+        self.padded_csv = file_format == PADDED_CSV
+        self.columns: List[FixedWidthColumn] = []
+        self._separator = b"," if self.padded_csv else b""
+        self._quoted: List[bool] = []
+        start = 0
+        for field_name, field_def in template.items():
+            width = widths.get(field_name)
+            if width is None:
+                width = field_width(field_def, self.padded_csv, pool_size, locale)
+            if width is None:
+                raise LayoutError(
+                    f"field '{field_name}' ({field_def.field_type}) has no length bound; "
+                    f"give it a width (widths={{'{field_name}': ...}}) or sample it from a Faker pool (pool_size)"
+                )
+            if self.padded_csv:
+                width = max(width, len(csv_text(field_name).encode()))
+            align_right = self.padded_csv or field_def.field_type in NUMERIC_TYPES
+            self.columns.append(FixedWidthColumn(field_name, start, width, align_right))
+            self._quoted.append(self.padded_csv and _needs_quoting(field_def))
+            start += width + len(self._separator)
+        self.fields: Tuple[str, ...] = tuple(column.name for column in self.columns)
+        if self.columns:
+            start -= len(self._separator)  # No separator after the last column
+        self.record_size = start + len(RECORD_END)
+        # Each cell carries what follows it, so a batch is one join over its cells
+        self._suffixes = [self._separator] * (len(self.columns) - 1) + [RECORD_END]
+        self.header = b""
+        if self.padded_csv:
+            self.header = b"".join(
+                self._pad(column, [csv_text(column.name).encode()], suffix)[0]
+                for column, suffix in zip(self.columns, self._suffixes)
+            )
+
+    def _pad(self, column: FixedWidthColumn, data: List[bytes], suffix: bytes) -> List[bytes]:
+        width = column.width
+        widest = max(map(len, data), default=0)
+        if widest > width:
+            raise LayoutError(f"value of field '{column.name}' is {widest} bytes, "
+                              f"wider than its {width}-byte column")
+        if column.align_right:
+            return [value.rjust(width) + suffix for value in data]
+        return [value.ljust(width) + suffix for value in data]
+
+    def offset(self, index: int) -> int:
+        """Byte offset of record index"""
+        return len(self.header) + index * self.record_size
+
+    def file_size(self, count: int) -> int:
+        """Size of a file holding count records"""
+        return self.offset(count)
+
+    def encode_column(self, index: int, values: Iterable[Any]) -> List[bytes]:
+        """Padded cells of column index, each followed by its separator or the newline"""
+        texts = map(format_fixed_value, values)
+        if self._quoted[index]:
+            texts = map(csv_text, texts)
+        return self._pad(self.columns[index], [text.encode() for text in texts], self._suffixes[index])
+
+    def encode_batch(self, batch: RecordBatch) -> bytes:
+        """
+        Encode a RecordBatch to len(batch) * record_size bytes.
+
+        Raises:
+            LayoutError: if a value is wider than its column
+        """
+        if batch.fields != self.fields:
+            raise ValueError("batch fields do not match the layout")
+        cells = [self.encode_column(index, batch.column(column.name)) for index, column in enumerate(self.columns)]
+        return b"".join(chain.from_iterable(zip(*cells)))
+
+def preallocate(filepath: str, size: int, header: bytes = b"") -> None:
+    """Create filepath at its final size (reserving the disk blocks where supported) and write the header"""
+    with open(filepath, "wb") as f:
+        f.write(header)
+        f.truncate(size)
+        if hasattr(os, "posix_fallocate") and size:
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+            except OSError:
+                pass  # Not supported by this file system; the file stays sparse
+
+def write_slice(filepath: str, offset: int, length: int, chunks: Iterable[bytes]) -> int:
+    """
+    Write consecutive chunks into bytes [offset, offset + length) of a preallocated file.
+
+    Only that slice is memory-mapped, so any number of processes can fill
+    disjoint slices of one file at the same time.
+
+    Returns:
+        Number of bytes written; always equals length
+    """
+    if length == 0:
+        return 0
+    start = offset - offset % mmap.ALLOCATIONGRANULARITY
+    with open(filepath, "r+b") as f:
+        with mmap.mmap(f.fileno(), offset + length - start, offset=start) as mapped:
+            position = offset - start
+            for data in chunks:
+                end = position + len(data)
+                if end > len(mapped):
+                    raise ValueError("chunks overflow their slice of the file")
+                mapped[position:end] = data
+                position = end
+            mapped.flush()
+    written = position - (offset - start)
+    if written != length:
+        raise ValueError(f"wrote {written} of {length} bytes of a file slice")
+    return written
+
+class FixedWidthGenerator(DataGenerator):
+    """
+    Fixed-width text and padded CSV, written in place into a preallocated file.
+
+    Column widths come from the template (see FixedWidthLayout), so the
+    size of the output and the offset of every record are known before
+    generation starts. ParallelGenerator uses this to let each worker write
+    its shard straight into its slice of one memory-mapped file, with no
+    part files and no merge.
+    """
+
+    def __init__(self, file_format: Optional[str] = None, widths: Optional[Dict[str, int]] = None,
+                 template: Optional[Dict[str, FieldDefinition]] = None, **options):
+        """
+        Args:
+            file_format: "fixed" or "csv"; inferred from the output extension by default
+                (.csv is padded CSV, anything else fixed-width text)
+            widths: Column widths in bytes overriding the derived ones
+            template: Template export() and write() size the columns from when they
+                are not given one, so generic callers can use export(data, filepath)
+            options: Generation options (seed, columnar, pool_size, ...) forwarded to the JSON generator
+        """
+        if file_format not in (None, FIXED_WIDTH, PADDED_CSV):
+            raise ValueError(f"unknown fixed-width format: {file_format}")
+        self.json_generator = JSONGenerator(**options)
+        self.file_format = file_format
+        self.widths = widths
+        self.template = template
+
+    @property
+    def stats(self) -> Optional[GenerationStats]:
+        """Instrumentation shared with the JSON generator (enabled with stats=True)"""
+        return self.json_generator.stats
+
+    def layout(self, template: Dict[str, FieldDefinition], filepath: Optional[str] = None) -> FixedWidthLayout:
+        """Record layout of a template for this generator's format, widths and Faker pools"""
+        return FixedWidthLayout(template, self.file_format or file_format_for(filepath), self.widths,
+                                self.json_generator.pool_size, self.json_generator.locale)
+
+    def generate(self, template: Dict[str, FieldDefinition], count: int) -> List[Dict[str, Any]]:
+        """Generate data using JSON generator for consistency"""
+        return self.json_generator.generate(template, count)
+
+    def iter_generate(self, template: Dict[str, FieldDefinition], count: int,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """Stream data chunks using JSON generator for consistency"""
+        return self.json_generator.iter_generate(template, count, chunk_size)
+
+    def iter_batches(self, template: Dict[str, FieldDefinition], count: int,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[RecordBatch]:
+        """Stream compact RecordBatches using JSON generator for consistency"""
+        return self.json_generator.iter_batches(template, count, chunk_size)
+
+    def export(self, data: Iterable[Dict[str, Any]], filepath: str,
+               template: Optional[Dict[str, FieldDefinition]] = None) -> None:
+        """
+        Export records as fixed-size records.
+
+        Args:
+            data: Generated data records; consumed DEFAULT_CHUNK_SIZE records at a time
+            filepath: Path to save the exported file
+            template: Template the columns are sized from; defaults to the generator's
+        """
+        layout = self._export_layout(template, filepath)
+        records = iter(data)
+        with measure_export(self.stats, layout.file_format, filepath, records) as records:
+            with open(filepath, "wb") as f:
+                f.write(layout.header)
+                for encoded in self._encode_chunks(layout, records):
+                    f.write(encoded)
+
+    def write(self, data: Iterable[Dict[str, Any]], stream: TextIO,
+              template: Optional[Dict[str, FieldDefinition]] = None) -> None:
+        """
+        Write records to a text stream in order (file_format defaults to fixed-width text).
+
+        Args:
+            data: Generated data records; consumed DEFAULT_CHUNK_SIZE records at a time
+            stream: Destination stream; it is left open. Records are UTF-8 sized, so
+                the stream must encode UTF-8 without newline translation
+            template: Template the columns are sized from; defaults to the generator's
+        """
+        layout = self._export_layout(template)
+        stream.write(layout.header.decode("utf-8"))
+        for encoded in self._encode_chunks(layout, iter(data)):
+            stream.write(encoded.decode("utf-8"))
+
+    def _export_layout(self, template: Optional[Dict[str, FieldDefinition]],
+                       filepath: Optional[str] = None) -> FixedWidthLayout:
+        template = template if template is not None else self.template
+        if template is None:
+            raise ValueError("fixed-width export needs the template to size its columns; "
+                             "pass template= to export() or to FixedWidthGenerator()")
+        return self.layout(template, filepath)
+
+    @staticmethod
+    def _encode_chunks(layout: FixedWidthLayout, records: Iterator[Dict[str, Any]]) -> Iterator[bytes]:
+        while True:
+            chunk = list(islice(records, DEFAULT_CHUNK_SIZE))
+            if not chunk:
+                return
+            yield layout.encode_batch(RecordBatch.from_records(chunk, layout.fields))
+
+    def export_stream(self, template: Dict[str, FieldDefinition], count: int, filepath: str,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Preallocate the file and write count records into it chunk by chunk"""
+        layout = self.layout(template, filepath)
+        with measure_export(self.stats, layout.file_format, filepath, records=count):
+            preallocate(filepath, layout.file_size(count), layout.header)
+            batches = self.iter_batches(template, count, chunk_size)
+            write_slice(filepath, layout.offset(0), count * layout.record_size, map(layout.encode_batch, batches))
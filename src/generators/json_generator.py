@@ -1,66 +1,104 @@
 # src/generators/json_generator.py
-import json
 import random
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
-from ..data_types.field_types import FieldDefinition, FieldTypes
-from .base_generator import DataGenerator
+import time
+from datetime import date
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+from ..data_types.field_types import FieldDefinition
+from .base_generator import DataGenerator, DEFAULT_CHUNK_SIZE
+from .batch import RecordBatch
+from .plan import GenerationPlan, compile_field, compile_template
+from .columnar import ColumnarPlan, Columns, columns_to_records, compile_columnar
+from .compression import OutputFile
+from .json_writer import JSONArrayWriter, JSONLinesWriter, is_json_lines_path
+from .pools import Locale, PooledFaker
+from .stats import GenerationStats, measure_export
+from .unique import UniqueOptions
 import faker
+import numpy as np
 
 class JSONGenerator(DataGenerator):
     """
     Concrete implementation of DataGenerator for JSON format.
     """
     
-    def __init__(self):
-        self.fake = faker.Faker()
+    def __init__(self, columnar: bool = False, seed: Optional[int] = None,
+                 reference_date: Optional[date] = None, unique: Optional[UniqueOptions] = None,
+                 pool_size: Optional[int] = None, locale: Locale = None, stats: bool = False):
+        """
+        Args:
+            columnar: Generate vectorizable columns with NumPy instead of row by row
+            seed: Seed for reproducible output; every compiled plan draws from it
+            reference_date: Last day of the DATE range; defaults to today
+            unique: Unique sampling settings (permutation key/offset, membership mode)
+            pool_size: Sample NAME/EMAIL/PHONE/ADDRESS values from shared pools of
+                this many Faker values instead of calling Faker per cell
+            locale: Faker locale(s) for generated values and pools
+            stats: Collect per-field timing, null and unique counters and export
+                throughput in self.stats
+        """
+        self.fake = faker.Faker(locale)
+        self.locale = locale
+        self.pool_size = pool_size
+        self.columnar = columnar
+        self.seed = seed
+        self.reference_date = reference_date
+        self.unique = unique
+        self.random = random.Random(seed)
+        self.stats: Optional[GenerationStats] = GenerationStats() if stats else None
+        if seed is not None:
+            self.fake.seed_instance(seed)
+        
+    def _value_source(self):
+        """Faker instance used by compiled plans, pooled when pool_size is set"""
+        if self.pool_size:
+            return PooledFaker(self.fake, self.random, self.pool_size, self.locale)
+        return self.fake
         
     def _generate_field_value(self, field_def: FieldDefinition) -> Any:
         """
         Generate a single field value based on its definition.
+        
+        Compiles the field on every call; use compile() for bulk generation.
         """
-        if field_def.nullable and random.random() < 0.1:  # 10% chance of null
-            return None
-            
-        if field_def.field_type == FieldTypes.STRING:
-            if field_def.choices:
-                return random.choice(field_def.choices)
-            elif field_def.pattern:
-                # You might want to add a pattern-based generator here
-                return self.fake.pystr()
-            return self.fake.text(max_nb_chars=50)
-            
-        elif field_def.field_type == FieldTypes.INTEGER:
-            min_val = field_def.min_value if field_def.min_value is not None else 0
-            max_val = field_def.max_value if field_def.max_value is not None else 1000
-            return random.randint(min_val, max_val)
-            
-        elif field_def.field_type == FieldTypes.FLOAT:
-            min_val = float(field_def.min_value if field_def.min_value is not None else 0)
-            max_val = float(field_def.max_value if field_def.max_value is not None else 1000)
-            return round(random.uniform(min_val, max_val), 2)
-            
-        elif field_def.field_type == FieldTypes.EMAIL:
-            return self.fake.email()
-            
-        elif field_def.field_type == FieldTypes.DATE:
-            start_date = datetime.now() - timedelta(days=365)
-            end_date = datetime.now()
-            return self.fake.date_between(start_date=start_date, end_date=end_date)
-            
-        elif field_def.field_type == FieldTypes.NAME:
-            return self.fake.name()
-            
-        elif field_def.field_type == FieldTypes.BOOLEAN:
-            return random.choice([True, False])
-            
-        elif field_def.field_type == FieldTypes.PHONE:
-            return self.fake.phone_number()
-            
-        elif field_def.field_type == FieldTypes.ADDRESS:
-            return self.fake.address()
+        factory = compile_field(field_def, self._value_source(), self.random, self.reference_date)
+        if self.stats is None:
+            return factory()
+        start = time.perf_counter()
+        value = factory()
+        field_stats = self.stats.field(field_def.name, field_def.field_type)
+        field_stats.timed_seconds += time.perf_counter() - start
+        field_stats.values += 1
+        field_stats.timed_values += 1
+        field_stats.nulls += value is None
+        return value
+        
+    def compile(self, template: Dict[str, FieldDefinition]) -> GenerationPlan:
+        """
+        Compile a template into a generation plan bound to this generator's Faker instance.
+        """
+        return compile_template(template, self._value_source(), self.random, self.reference_date, self.unique,
+                                self.stats)
+        
+    def compile_columnar(self, template: Dict[str, FieldDefinition]) -> ColumnarPlan:
+        """
+        Compile a template into a columnar plan that draws whole columns with NumPy.
+        """
+        np_rng = np.random.default_rng(self.random.getrandbits(64))
+        return compile_columnar(template, self._value_source(), self.random, np_rng, self.reference_date,
+                                self.unique, self.stats)
+        
+    def generate_columns(self, template: Dict[str, FieldDefinition], count: int) -> Columns:
+        """
+        Generate mock data as columns without assembling rows.
+        
+        Args:
+            template: Dictionary defining the data structure and constraints
+            count: Number of values per column
             
-        return None
+        Returns:
+            Mapping of field name to a list of generated values
+        """
+        return self.compile_columnar(template).generate_columns(count)
         
     def generate(self, template: Dict[str, FieldDefinition], count: int) -> List[Dict[str, Any]]:
         """
@@ -72,33 +110,158 @@ class JSONGenerator(DataGenerator):
             
         Returns:
             List of generated data records
+            
+        Raises:
+            UniqueDomainError: if count exceeds the domain of a unique field
         """
-        result = []
-        unique_values = {field_name: set() for field_name, field_def in template.items() 
-                        if field_def.unique}
+        if self.columnar:
+            return self.compile_columnar(template).generate(count)
+        return self.compile(template).generate(count)
         
-        for _ in range(count):
-            record = {}
-            for field_name, field_def in template.items():
-                value = self._generate_field_value(field_def)
-                
-                # Handle unique constraint
-                if field_def.unique:
-                    max_attempts = 100  # Prevent infinite loop
-                    attempts = 0
-                    while str(value) in unique_values[field_name] and attempts < max_attempts:
-                        value = self._generate_field_value(field_def)
-                        attempts += 1
-                    unique_values[field_name].add(str(value))
-                
-                record[field_name] = value
-            result.append(record)
+    def generate_with_stats(self, template: Dict[str, FieldDefinition],
+                            count: int) -> Tuple[List[Dict[str, Any]], GenerationStats]:
+        """
+        Generate records and return them with the generator's instrumentation.
         
-        return result
+        Enables stats on first use; counters accumulate across calls until stats.reset().
         
-    def export(self, data: List[Dict[str, Any]], filepath: str) -> None:
+        Returns:
+            (records, stats)
+        """
+        if self.stats is None:
+            self.stats = GenerationStats()
+        return self.generate(template, count), self.stats
+        
+    def iter_generate(self, template: Dict[str, FieldDefinition], count: int,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Generate mock data lazily, one chunk at a time.
+        
+        A single plan is compiled for the whole call, so unique constraints hold across chunks.
+        A count larger than a unique field's domain raises UniqueDomainError before
+        the first chunk.
+        
+        Args:
+            template: Dictionary defining the data structure and constraints
+            count: Total number of records to generate
+            chunk_size: Maximum number of records per chunk
+            
+        Returns:
+            Iterator over lists of generated data records
+        """
+        if self.columnar:
+            for columns in self.compile_columnar(template).iter_columns(count, chunk_size):
+                yield columns_to_records(columns)
+            return
+            
+        plan = self.compile(template)
+        plan.check_capacity(count)
+        remaining = count
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            yield plan.generate(size)
+            remaining -= size
+        
+    def iter_batches(self, template: Dict[str, FieldDefinition], count: int,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[RecordBatch]:
+        """
+        Generate mock data as compact RecordBatches of at most chunk_size records.
+        
+        Yields the same records as iter_generate(): tuple rows for row plans,
+        the column lists themselves for columnar plans.
+        """
+        if self.columnar:
+            for columns in self.compile_columnar(template).iter_columns(count, chunk_size):
+                yield RecordBatch.from_columns(columns)
+            return
+            
+        plan = self.compile(template)
+        plan.check_capacity(count)
+        remaining = count
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            yield plan.generate_batch(size)
+            remaining -= size
+        
+    def _writer(self, f: TextIO, lines: bool, indent: Optional[int]):
+        if lines:
+            return JSONLinesWriter(f)
+        return JSONArrayWriter(f, indent=indent)
+        
+    def write(self, data: Iterable[Dict[str, Any]], stream: TextIO,
+              lines: bool = False, indent: Optional[int] = 2) -> None:
+        """
+        Write generated data as a JSON array, or JSON Lines with lines=True, to an open stream.
+        """
+        with self._writer(stream, lines, indent) as writer:
+            writer.write_records(data)
+        
+    def export(self, data: Iterable[Dict[str, Any]], filepath: str,
+               lines: Optional[bool] = None, indent: Optional[int] = 2,
+               compression: Optional[str] = None, compression_level: Optional[int] = None) -> None:
         """
         Export generated data to a JSON file.
+        
+        Records are encoded in batches, so generators are never materialized.
+        
+        Args:
+            data: Generated data records
+            filepath: Path to save the exported file
+            lines: Write JSON Lines instead of an array; defaults to True
+                for .jsonl/.ndjson paths
+            indent: Indentation for array output; None writes compact JSON
+            compression: "gzip", "bz2" or "xz"; defaults to the one implied by a
+                .gz/.bz2/.xz extension (compressed on a background thread)
+            compression_level: Compression level; defaults to the codec's usual level
+        """
+        if isinstance(data, RecordBatch):
+            return self.export_batches([data], filepath, lines, indent, compression, compression_level)
+        if lines is None:
+            lines = is_json_lines_path(filepath)
+        output = OutputFile(filepath, compression, compression_level)
+        with measure_export(self.stats, "jsonl" if lines else "json", filepath, data, output=output) as data:
+            with output as f:
+                self.write(data, f, lines, indent)
+                
+    def write_batches(self, batches: Iterable[RecordBatch], stream: TextIO,
+                      lines: bool = False, indent: Optional[int] = 2) -> None:
+        """Write RecordBatches to an open stream; the output equals write() of the same records"""
+        with self._writer(stream, lines, indent) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+                
+    def export_batches(self, batches: Iterable[RecordBatch], filepath: str,
+                       lines: Optional[bool] = None, indent: Optional[int] = 2,
+                       compression: Optional[str] = None, compression_level: Optional[int] = None) -> None:
+        """
+        Export RecordBatches to a JSON file without keeping a dict per record.
+        
+        Arguments are those of export(); the file is identical to exporting the same records.
+        """
+        if lines is None:
+            lines = is_json_lines_path(filepath)
+        output = OutputFile(filepath, compression, compression_level)
+        with measure_export(self.stats, "jsonl" if lines else "json", filepath, batches,
+                            output=output, batches=True) as batches:
+            with output as f:
+                self.write_batches(batches, f, lines, indent)
+                
+    def export_stream(self, template: Dict[str, FieldDefinition], count: int, filepath: str,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Generate and export chunk by chunk as RecordBatches"""
+        self.export_batches(self.iter_batches(template, count, chunk_size), filepath)
+                
+    def export_columns(self, columns: Columns, filepath: str,
+                       lines: Optional[bool] = None, indent: Optional[int] = 2,
+                       compression: Optional[str] = None, compression_level: Optional[int] = None) -> None:
+        """
+        Export a column batch to JSON, converting date columns without the encoder fallback.
         """
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
\ No newline at end of file
+        if lines is None:
+            lines = is_json_lines_path(filepath)
+        records = len(next(iter(columns.values()), ()))
+        output = OutputFile(filepath, compression, compression_level)
+        with measure_export(self.stats, "jsonl" if lines else "json", filepath, records=records, output=output):
+            with output as f:
+                with self._writer(f, lines, indent) as writer:
+                    writer.write_columns(columns)
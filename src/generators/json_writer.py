@@ -0,0 +1,153 @@
+# src/generators/json_writer.py
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+from .batch import RecordBatch
+from .compression import strip_compression_extension
+
+DEFAULT_BATCH_SIZE = 1000
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson")
+
+def _default(value: Any) -> Any:
+    """Encoder fallback: dates go straight to isoformat, record views to dicts, anything else to str()"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+def make_encoder(indent: Optional[int] = None) -> json.JSONEncoder:
+    """
+    Build a reusable JSON encoder.
+
+    With indent=None the C accelerated encoder is used with compact separators.
+    """
+    if indent is None:
+        return json.JSONEncoder(default=_default, separators=(",", ":"))
+    return json.JSONEncoder(default=_default, indent=indent)
+
+def is_json_lines_path(filepath: str) -> bool:
+    """Return True if the file extension selects JSON Lines output (.jsonl.gz and friends included)"""
+    return strip_compression_extension(filepath).lower().endswith(JSON_LINES_EXTENSIONS)
+
+def isoformat_columns(columns: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    """
+    Convert date columns to ISO strings in one pass per column.
+
+    A column is treated as a date column when its first non-null value is a date,
+    so encoding the resulting rows never falls back to the default handler.
+    """
+    converted = {}
+    for field_name, values in columns.items():
+        sample = next((value for value in values if value is not None), None)
+        if isinstance(sample, (date, datetime)):
+            values = [value.isoformat() if value is not None else None for value in values]
+        converted[field_name] = values
+    return converted
+
+class _BatchedWriter(ABC):
+    """Shared batching for the JSON writers: records are encoded batch_size at a time"""
+
+    def __init__(self, stream: TextIO, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.stream = stream
+        self.batch_size = batch_size
+        self.records_written = 0
+        self._batch: List[Dict[str, Any]] = []
+
+    @abstractmethod
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Encode one full batch of records and write it to the stream"""
+        pass
+
+    def write_record(self, record: Dict[str, Any]) -> None:
+        """Queue one record; it is written when the batch fills up or on flush()"""
+        self._batch.append(record)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Write every record from an iterable"""
+        for record in records:
+            self.write_record(record)
+
+    def write_columns(self, columns: Dict[str, List[Any]]) -> None:
+        """Write a column batch, converting date columns up front"""
+        columns = isoformat_columns(columns)
+        field_names = tuple(columns)
+        self.write_records(dict(zip(field_names, row)) for row in zip(*columns.values()))
+
+    def write_batch(self, batch: RecordBatch) -> None:
+        """Write a RecordBatch; column batches take the write_columns() path"""
+        if batch.is_columnar:
+            self.write_columns(batch.columns)
+        else:
+            field_names = batch.fields
+            self.write_records(dict(zip(field_names, row)) for row in batch.iter_rows())
+
+    def flush(self) -> None:
+        """Encode and write any queued records"""
+        if self._batch:
+            self._write_batch(self._batch)
+            self.records_written += len(self._batch)
+            self._batch = []
+
+    def close(self) -> None:
+        """Flush queued records; the underlying stream is left open"""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+
+class JSONLinesWriter(_BatchedWriter):
+    """
+    Writer for JSON Lines (NDJSON): one compact JSON object per line.
+    Output can be split on newlines by downstream loaders.
+    """
+
+    def __init__(self, stream: TextIO, batch_size: int = DEFAULT_BATCH_SIZE):
+        super().__init__(stream, batch_size)
+        self._encode = make_encoder().encode
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        self.stream.write("\n".join(map(self._encode, batch)))
+        self.stream.write("\n")
+
+class JSONArrayWriter(_BatchedWriter):
+    """
+    Writer for a single JSON array, encoded one batch at a time.
+
+    Each batch is serialized with one encoder call and spliced into the array,
+    so the output is identical to encoding the whole list at once.
+    """
+
+    def __init__(self, stream: TextIO, indent: Optional[int] = 2,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        super().__init__(stream, batch_size)
+        self.indent = indent
+        self._encode = make_encoder(indent).encode
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        body = self._encode(batch)
+        # Strip the batch's own brackets; the newline before "]" belongs to close()
+        body = body[1:-2] if self.indent is not None else body[1:-1]
+        if self.records_written == 0:
+            self.stream.write("[")
+        else:
+            self.stream.write(",")
+        self.stream.write(body)
+
+    def close(self) -> None:
+        """Flush queued records and close the array"""
+        self.flush()
+        if self.records_written == 0:
+            self.stream.write("[]")
+        elif self.indent is not None:
+            self.stream.write("\n]")
+        else:
+            self.stream.write("]")
@@ -0,0 +1,241 @@
+# src/generators/parallel.py
+import hashlib
+import os
+from collections import deque
+from dataclasses import replace
+from itertools import chain
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Type
+from ..data_types.field_types import FieldDefinition
+from .arrow_generator import ArrowGenerator
+from .base_generator import DataGenerator, DEFAULT_CHUNK_SIZE
+from .csv_generator import CSVGenerator
+from .fixed_width import FixedWidthGenerator, preallocate, write_slice
+from .json_generator import JSONGenerator
+from .sql_generator import SQLGenerator
+from .xml_generator import XMLGenerator
+from .unique import UniqueOptions
+
+DEFAULT_SHARD_SIZE = 100000
+
+SHARD_EXTENSIONS = {
+    JSONGenerator: "json",
+    CSVGenerator: "csv",
+    XMLGenerator: "xml",
+    ArrowGenerator: "parquet",
+    SQLGenerator: "sql",
+    FixedWidthGenerator: "txt",
+}
+
+def shard_seed(master_seed: int, shard_index: int) -> int:
+    """
+    Derive the seed for one shard from the master seed.
+
+    The derivation depends only on (master_seed, shard_index), never on the
+    number of workers, so any pool size reproduces the same shards.
+    """
+    digest = hashlib.sha256(f"{master_seed}:{shard_index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+class Shard(NamedTuple):
+    """A contiguous slice of the output: records [start, start + count)"""
+    index: int
+    start: int
+    count: int
+    seed: int
+
+def plan_shards(count: int, shard_size: int, master_seed: int) -> List[Shard]:
+    """Split count records into fixed-size shards with derived seeds"""
+    return [
+        Shard(index, start, min(shard_size, count - start), shard_seed(master_seed, index))
+        for index, start in enumerate(range(0, count, shard_size))
+    ]
+
+def _shard_generator(generator_cls: Type[DataGenerator], options: Dict[str, Any],
+                     shard: Shard) -> DataGenerator:
+    """Build the generator for one shard, continuing the shared unique permutations at shard.start"""
+    unique = options["unique"]
+    shard_options = dict(options, unique=replace(unique, offset=unique.offset + shard.start))
+    return generator_cls(seed=shard.seed, **shard_options)
+
+def _generate_shard(generator_cls: Type[DataGenerator], options: Dict[str, Any],
+                    template: Dict[str, FieldDefinition], shard: Shard,
+                    chunk_size: int) -> List[Dict[str, Any]]:
+    """Worker entry point: generate the records of one shard"""
+    generator = _shard_generator(generator_cls, options, shard)
+    # Same chunking as _export_shard, so merged output equals the concatenated parts
+    return list(chain.from_iterable(generator.iter_generate(template, shard.count, chunk_size)))
+
+def _export_shard(generator_cls: Type[DataGenerator], options: Dict[str, Any],
+                  template: Dict[str, FieldDefinition], shard: Shard,
+                  filepath: str, chunk_size: int) -> str:
+    """Worker entry point: stream one shard into its own part file"""
+    generator = _shard_generator(generator_cls, options, shard)
+    generator.export_stream(template, shard.count, filepath, chunk_size)
+    return filepath
+
+def _write_fixed_width_shard(generator_cls: Type[DataGenerator], options: Dict[str, Any],
+                             template: Dict[str, FieldDefinition], shard: Shard,
+                             filepath: str, chunk_size: int) -> int:
+    """Worker entry point: write one shard straight into its slice of the preallocated file"""
+    generator = _shard_generator(generator_cls, options, shard)
+    layout = generator.layout(template, filepath)
+    batches = generator.iter_batches(template, shard.count, chunk_size)
+    return write_slice(filepath, layout.offset(shard.start), shard.count * layout.record_size,
+                       map(layout.encode_batch, batches))
+
+class ParallelGenerator:
+    """
+    Sharded generation across a process pool with deterministic seeding.
+
+    The record count is split into fixed-size shards, each generated by a
+    fresh generator seeded from (seed, shard index). Output is identical for
+    any number of workers.
+
+    Unique fields with an enumerable domain share one permutation keyed by
+    the master seed, and each shard starts at its own offset, so they are
+    unique across the whole output. Open-ended unique fields (text, names,
+    emails, ...) are unique within a shard.
+
+    With FixedWidthGenerator every record has the same size, so export()
+    preallocates the output and each worker memory-maps and fills its own
+    shard's slice of it directly, with no merge step.
+    """
+
+    def __init__(self, generator_cls: Type[DataGenerator] = CSVGenerator, seed: int = 0,
+                 workers: Optional[int] = None, shard_size: int = DEFAULT_SHARD_SIZE,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, **options):
+        """
+        Args:
+            generator_cls: Generator class used for both generation and export
+            seed: Master seed from which every shard seed is derived
+            workers: Process count; defaults to os.cpu_count(), 1 runs in-process
+            shard_size: Records per shard; part of the output's identity
+            chunk_size: Records held in memory per chunk when writing part files
+            options: Extra generator options (e.g. columnar=True)
+        """
+        self.generator_cls = generator_cls
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.chunk_size = chunk_size
+        # Pin the DATE range for every shard so a run that crosses midnight stays consistent
+        options.setdefault("reference_date", date.today())
+        options.setdefault("unique", UniqueOptions())
+        if options["unique"].key is None:
+            options["unique"] = replace(options["unique"], key=seed)
+        self.options = options
+
+    def iter_chunks(self, template: Dict[str, FieldDefinition], count: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the records of each shard, one list per shard, in shard order.
+
+        Args:
+            template: Dictionary defining the data structure and constraints
+            count: Total number of records to generate
+
+        Returns:
+            Iterator over lists of generated data records
+        """
+        shards = plan_shards(count, self.shard_size, self.seed)
+        if self.workers == 1:
+            for shard in shards:
+                yield _generate_shard(self.generator_cls, self.options, template, shard,
+                                      self.chunk_size)
+            return
+
+        # Keep at most 2 * workers shards in flight so memory stays bounded
+        # when workers outpace the consumer; results are taken in shard order.
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending: "deque[Future]" = deque()
+            for shard in shards:
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+                pending.append(pool.submit(_generate_shard, self.generator_cls, self.options,
+                                           template, shard, self.chunk_size))
+            while pending:
+                yield pending.popleft().result()
+
+    def iter_records(self, template: Dict[str, FieldDefinition], count: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield all records in shard order.
+
+        Args:
+            template: Dictionary defining the data structure and constraints
+            count: Total number of records to generate
+
+        Returns:
+            Iterator over generated data records
+        """
+        return chain.from_iterable(self.iter_chunks(template, count))
+
+    def export(self, template: Dict[str, FieldDefinition], count: int, filepath: str) -> None:
+        """
+        Generate in parallel and merge the shards, in order, into a single file.
+
+        Fixed-width output is written in place by the workers instead (see
+        FixedWidthGenerator); the file is identical either way.
+
+        Args:
+            template: Dictionary defining the data structure and constraints
+            count: Total number of records to generate
+            filepath: Path to save the exported file
+        """
+        exporter = self.generator_cls(**self.options)
+        if isinstance(exporter, FixedWidthGenerator):
+            self._export_fixed_width(exporter, template, count, filepath)
+            return
+        exporter.export(self.iter_records(template, count), filepath)
+
+    def export_shards(self, template: Dict[str, FieldDefinition], count: int, directory: str,
+                      extension: Optional[str] = None) -> List[str]:
+        """
+        Generate in parallel, writing each shard to its own part file.
+
+        Args:
+            template: Dictionary defining the data structure and constraints
+            count: Total number of records to generate
+            directory: Output directory; created if missing
+            extension: Part file extension; defaults to the generator's format
+
+        Returns:
+            Part file paths (part-00000.<ext>, ...) in shard order
+        """
+        extension = extension or SHARD_EXTENSIONS.get(self.generator_cls, "dat")
+        os.makedirs(directory, exist_ok=True)
+        shards = plan_shards(count, self.shard_size, self.seed)
+        paths = [os.path.join(directory, f"part-{shard.index:05d}.{extension}") for shard in shards]
+
+        if self.workers == 1:
+            for shard, path in zip(shards, paths):
+                _export_shard(self.generator_cls, self.options, template, shard, path, self.chunk_size)
+            return paths
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(_export_shard, self.generator_cls, self.options, template,
+                            shard, path, self.chunk_size)
+                for shard, path in zip(shards, paths)
+            ]
+            return [future.result() for future in futures]
+
+    def _export_fixed_width(self, exporter: FixedWidthGenerator, template: Dict[str, FieldDefinition],
+                            count: int, filepath: str) -> None:
+        layout = exporter.layout(template, filepath)
+        preallocate(filepath, layout.file_size(count), layout.header)
+        shards = plan_shards(count, self.shard_size, self.seed)
+        if self.workers == 1:
+            for shard in shards:
+                _write_fixed_width_shard(self.generator_cls, self.options, template, shard,
+                                         filepath, self.chunk_size)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(_write_fixed_width_shard, self.generator_cls, self.options, template,
+                            shard, filepath, self.chunk_size)
+                for shard in shards
+            ]
+            for future in futures:
+                future.result()
@@ -0,0 +1,343 @@
+# src/generators/pattern.py
+import random
+import string
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Sequence
+import numpy as np
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants, sre_parse
+
+MAX_UNBOUNDED_REPEAT = 8  # Extra repetitions allowed for *, + and {n,}
+
+PRINTABLE = string.ascii_letters + string.digits + string.punctuation + " "
+CATEGORY_CHARS = {
+    sre_constants.CATEGORY_DIGIT: string.digits,
+    sre_constants.CATEGORY_WORD: string.ascii_letters + string.digits + "_",
+    sre_constants.CATEGORY_SPACE: " ",
+}
+NEGATED_CATEGORIES = {
+    sre_constants.CATEGORY_NOT_DIGIT: sre_constants.CATEGORY_DIGIT,
+    sre_constants.CATEGORY_NOT_WORD: sre_constants.CATEGORY_WORD,
+    sre_constants.CATEGORY_NOT_SPACE: sre_constants.CATEGORY_SPACE,
+}
+
+def _complement(chars: str) -> str:
+    excluded = set(chars)
+    return "".join(char for char in PRINTABLE if char not in excluded)
+
+def _category_chars(category) -> str:
+    if category in NEGATED_CATEGORIES:
+        return _complement(CATEGORY_CHARS[NEGATED_CATEGORIES[category]])
+    if category not in CATEGORY_CHARS:
+        raise ValueError(f"unsupported character category in pattern: {category}")
+    return CATEGORY_CHARS[category]
+
+def _class_chars(items) -> str:
+    """Expand the items of an IN node into the characters it accepts"""
+    chars: List[str] = []
+    negate = False
+    for op, av in items:
+        if op == sre_constants.NEGATE:
+            negate = True
+        elif op == sre_constants.LITERAL:
+            chars.append(chr(av))
+        elif op == sre_constants.RANGE:
+            chars.extend(chr(code) for code in range(av[0], av[1] + 1))
+        elif op == sre_constants.CATEGORY:
+            chars.extend(_category_chars(av))
+    unique = "".join(dict.fromkeys(chars))
+    return _complement(unique) if negate else unique
+
+class Node(ABC):
+    """One element of a compiled pattern program"""
+
+    @abstractmethod
+    def sample(self, rng, groups: Dict[int, str]) -> str:
+        """One sample, recording capture groups in groups"""
+        pass
+
+    def batch(self, count: int, np_rng: np.random.Generator) -> Optional[np.ndarray]:
+        """Vectorized form for count samples, or None if the node needs scalar sampling"""
+        return None
+
+    @abstractmethod
+    def max_length(self, groups: Dict[int, int], encoded: bool = False) -> int:
+        """Longest possible sample, in characters or (encoded=True) UTF-8 bytes"""
+        pass
+
+    @abstractmethod
+    def alphabet(self) -> FrozenSet[str]:
+        """Every character a sample can contain"""
+        pass
+
+class Literal(Node):
+    def __init__(self, text: str):
+        self.text = text
+
+    def sample(self, rng, groups: Dict[int, str]) -> str:
+        return self.text
+
+    def batch(self, count: int, np_rng: np.random.Generator) -> Optional[np.ndarray]:
+        return np.full(count, self.text)
+
+    def max_length(self, groups: Dict[int, int], encoded: bool = False) -> int:
+        return len(self.text.encode()) if encoded else len(self.text)
+
+    def alphabet(self) -> FrozenSet[str]:
+        return frozenset(self.text)
+
+class CharRepeat(Node):
+    """A character class repeated between min_count and max_count times"""
+
+    def __init__(self, chars: str, min_count: int, max_count: int):
+        self.chars = chars
+        self.min_count = min_count
+        self.max_count = max_count
+        self._table = np.array(list(chars), dtype="U1")
+
+    def sample(self, rng, groups: Dict[int, str]) -> str:
+        count = self.min_count
+        if self.max_count != count:
+            count = rng.randint(count, self.max_count)
+        return "".join(rng.choices(self.chars, k=count))
+
+    def batch(self, count: int, np_rng: np.random.Generator) -> Optional[np.ndarray]:
+        width = self.max_count
+        if width == 0:
+            return np.full(count, "")
+        matrix = self._table[np_rng.integers(0, len(self.chars), size=(count, width))]
+        if self.min_count != width:
+            lengths = np_rng.integers(self.min_count, width, size=count, endpoint=True)
+            # Trailing NUL characters are padding in NumPy unicode arrays
+            matrix[np.arange(width) >= lengths[:, None]] = ""
+        return np.ascontiguousarray(matrix).view(f"U{width}").ravel()
+
+    def max_length(self, groups: Dict[int, int], encoded: bool = False) -> int:
+        if not encoded or not self.chars:
+            return self.max_count
+        return self.max_count * max(len(char.encode()) for char in self.chars)
+
+    def alphabet(self) -> FrozenSet[str]:
+        return frozenset(self.chars)
+
+class Concat(Node):
+    def __init__(self, nodes: Sequence[Node]):
+        self.nodes = list(nodes)
+
+    def sample(self, rng, groups: Dict[int, str]) -> str:
+        return "".join([node.sample(rng, groups) for node in self.nodes])
+
+    def batch(self, count: int, np_rng: np.random.Generator) -> Optional[np.ndarray]:
+        result = np.full(count, "")
+        for node in self.nodes:
+            part = node.batch(count, np_rng)
+            if part is None:
+                return None
+            result = np.char.add(result, part)
+        return result
+
+    def max_length(self, groups: Dict[int, int], encoded: bool = False) -> int:
+        return sum(node.max_length(groups, encoded) for node in self.nodes)
+
+    def alphabet(self) -> FrozenSet[str]:
+        return frozenset().union(*(node.alphabet() for node in self.nodes))
+
+class Branch(Node):
+    def __init__(self, branches: Sequence[Node]):
+        self.branches = list(branches)
+
+    def sample(self, rng, groups: Dict[int, str]) -> str:
+        return rng.choice(self.branches).sample(rng, groups)
+
+    def batch(self, count: int, np_rng: np.random.Generator) -> Optional[np.ndarray]:
+        picks = np_rng.integers(0, len(self.branches), size=count)
+        result = np.empty(count, dtype=object)
+        for index, branch in enumerate(self.branches):
+            rows = np.flatnonzero(picks == index)
+            if len(rows):
+                part = branch.batch(len(rows), np_rng)
+                if part is None:
+                    return None
+                result[rows] = part
+        return result.astype(str)
+
+    def max_length(self, groups: Dict[int, int], encoded: bool = False) -> int:
+        return max(branch.max_length(groups, encoded) for branch in self.branches)
+
+    def alphabet(self) -> FrozenSet[str]:
+        return frozenset().union(*(branch.alphabet() for branch in self.branches))
+
+class Group(Node):
+    def __init__(self, group: Optional[int], body: Node):
+        self.group = group
+        self.body = body
+
+    def sample(self, rng, groups: Dict[int, str]) -> str:
+        text = self.body.sample(rng, groups)
+        if self.group is not None:
+            groups[self.group] = text
+        return text
+
+    def batch(self, count: int, np_rng: np.random.Generator) -> Optional[np.ndarray]:
+        return self.body.batch(count, np_rng)
+
+    def max_length(self, groups: Dict[int, int], encoded: bool = False) -> int:
+        length = self.body.max_length(groups, encoded)
+        if self.group is not None:
+            groups[self.group] = length
+        return length
+
+    def alphabet(self) -> FrozenSet[str]:
+        return self.body.alphabet()
+
+class Repeat(Node):
+    """Any sub-program repeated between min_count and max_count times"""
+
+    def __init__(self, body: Node, min_count: int, max_count: int):
+        self.body = body
+        self.min_count = min_count
+        self.max_count = max_count
+
+    def sample(self, rng, groups: Dict[int, str]) -> str:
+        count = rng.randint(self.min_count, self.max_count)
+        return "".join([self.body.sample(rng, groups) for _ in range(count)])
+
+    def max_length(self, groups: Dict[int, int], encoded: bool = False) -> int:
+        return self.max_count * self.body.max_length(groups, encoded)
+
+    def alphabet(self) -> FrozenSet[str]:
+        return self.body.alphabet()
+
+class GroupReference(Node):
+    def __init__(self, group: int):
+        self.group = group
+
+    def sample(self, rng, groups: Dict[int, str]) -> str:
+        return groups.get(self.group, "")
+
+    def max_length(self, groups: Dict[int, int], encoded: bool = False) -> int:
+        return groups.get(self.group, 0)
+
+    def alphabet(self) -> FrozenSet[str]:
+        return frozenset()  # Already counted where the group is defined
+
+def _compile_items(items) -> Node:
+    nodes: List[Node] = []
+    for op, av in items:
+        node = _compile_item(op, av)
+        if node is None:
+            continue
+        if isinstance(node, Literal) and nodes and isinstance(nodes[-1], Literal):
+            nodes[-1] = Literal(nodes[-1].text + node.text)
+        else:
+            nodes.append(node)
+    if len(nodes) == 1:
+        return nodes[0]
+    return Concat(nodes)
+
+def _single_chars(op, av) -> Optional[str]:
+    """Characters matched by a single-character node, or None for anything else"""
+    if op == sre_constants.LITERAL:
+        return chr(av)
+    elif op == sre_constants.NOT_LITERAL:
+        chars = _complement(chr(av))
+    elif op == sre_constants.ANY:
+        return PRINTABLE
+    elif op == sre_constants.IN:
+        chars = _class_chars(av)
+    else:
+        return None
+    if not chars:
+        # Negated classes are drawn from printable ASCII only
+        raise ValueError("character class in pattern matches no printable ASCII character")
+    return chars
+
+def _compile_item(op, av) -> Optional[Node]:
+    chars = _single_chars(op, av)
+    if chars is not None:
+        return Literal(chars) if len(chars) == 1 else CharRepeat(chars, 1, 1)
+
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+              getattr(sre_constants, "POSSESSIVE_REPEAT", sre_constants.MAX_REPEAT)):
+        min_count, max_count, body = av
+        if max_count == sre_constants.MAXREPEAT:
+            max_count = min_count + MAX_UNBOUNDED_REPEAT
+        if len(body) == 1:
+            chars = _single_chars(*body[0])
+            if chars is not None:
+                return CharRepeat(chars, min_count, max_count)
+        return Repeat(_compile_items(body), min_count, max_count)
+    elif op == sre_constants.SUBPATTERN:
+        group, _, _, body = av
+        return Group(group, _compile_items(body))
+    elif op == sre_constants.BRANCH:
+        return Branch([_compile_items(branch) for branch in av[1]])
+    elif op == sre_constants.GROUPREF:
+        return GroupReference(av)
+    elif op == sre_constants.AT:
+        return None
+    elif op == getattr(sre_constants, "ATOMIC_GROUP", None):
+        return _compile_items(av)
+    raise ValueError(f"unsupported regex construct in pattern: {op}")
+
+class PatternProgram:
+    """
+    Sampling program compiled from a regular expression.
+
+    Supports literals, character classes and categories, bounded and
+    unbounded quantifiers (capped at MAX_UNBOUNDED_REPEAT extra repeats),
+    groups, alternation and back-references. Anchors are ignored. Every
+    generated string matches the pattern and is at most max_length
+    characters (max_bytes in UTF-8) long, drawn from alphabet.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.root = _compile_items(sre_parse.parse(pattern))
+        self.max_length = self.root.max_length({})
+        self.max_bytes = self.root.max_length({}, encoded=True)
+        self.alphabet = self.root.alphabet()
+
+    def sample(self, rng) -> str:
+        """Generate one matching string"""
+        return self.root.sample(rng, {})
+
+    def sampler(self, rng):
+        """Return a zero-argument callable bound to rng"""
+        root = self.root
+        return lambda: root.sample(rng, {})
+
+    def generate_batch(self, count: int, np_rng: np.random.Generator, rng=None) -> List[str]:
+        """
+        Generate count matching strings, vectorized with NumPy where possible.
+
+        Args:
+            count: Number of strings
+            np_rng: NumPy generator for vectorized sampling
+            rng: Random source for patterns that need scalar sampling
+                (repeated groups, back-references); derived from np_rng by default
+
+        Returns:
+            List of generated strings
+        """
+        values = self.root.batch(count, np_rng)
+        if values is not None:
+            return values.tolist()
+        if rng is None:
+            rng = random.Random(int(np_rng.integers(0, 2 ** 63)))
+        root = self.root
+        return [root.sample(rng, {}) for _ in range(count)]
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> PatternProgram:
+    """
+    Parse a regular expression once into a cached sampling program.
+
+    Raises:
+        ValueError: if the pattern uses constructs that cannot be sampled (e.g. lookarounds)
+    """
+    return PatternProgram(pattern)
@@ -0,0 +1,93 @@
+# src/generators/pools.py
+import threading
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple, Union
+import faker
+from ..data_types.field_types import FieldTypes
+
+DEFAULT_POOL_SIZE = 10000
+POOL_SEED = 0  # Pools are built deterministically, so every process sees the same values
+
+POOLED_PROVIDERS = {
+    FieldTypes.NAME: "name",
+    FieldTypes.EMAIL: "email",
+    FieldTypes.PHONE: "phone_number",
+    FieldTypes.ADDRESS: "address",
+}
+
+_PROVIDER_FIELD_TYPES = {provider: field_type for field_type, provider in POOLED_PROVIDERS.items()}
+
+Locale = Optional[Union[str, List[str], Tuple[str, ...]]]
+
+_pools: Dict[Tuple[str, Any, int], Tuple[str, ...]] = {}
+_pools_lock = threading.Lock()
+
+def _locale_key(locale: Locale) -> Any:
+    if isinstance(locale, (list, tuple)):
+        return tuple(locale)
+    return locale
+
+def get_pool(field_type: str, size: int = DEFAULT_POOL_SIZE, locale: Locale = None) -> Tuple[str, ...]:
+    """
+    Return the cached pool of Faker values for a field type, building it on first use.
+
+    Pools are keyed by (field type, locale, size) and shared by every
+    generator in the process.
+
+    Args:
+        field_type: One of NAME, EMAIL, PHONE or ADDRESS
+        size: Number of distinct values in the pool
+        locale: Faker locale(s); None uses Faker's default
+
+    Returns:
+        Tuple of pre-generated values
+    """
+    if field_type not in POOLED_PROVIDERS:
+        raise ValueError(f"field type '{field_type}' has no Faker pool")
+    key = (field_type, _locale_key(locale), size)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                fake = faker.Faker(locale)
+                fake.seed_instance(POOL_SEED)
+                provider = getattr(fake, POOLED_PROVIDERS[field_type])
+                pool = tuple(provider() for _ in range(size))
+                _pools[key] = pool
+    return pool
+
+def clear_pools() -> None:
+    """Drop every cached pool"""
+    with _pools_lock:
+        _pools.clear()
+
+class PooledFaker:
+    """
+    Faker stand-in whose name/email/phone_number/address draw from shared pools.
+
+    Each cell costs one random index instead of a Faker provider call; the
+    pool size trades realism (distinct values) for throughput. Pools are
+    fetched on first use, and every other attribute is delegated to the
+    wrapped Faker instance.
+    """
+
+    def __init__(self, fake, rng, pool_size: int = DEFAULT_POOL_SIZE, locale: Locale = None):
+        self.fake = fake
+        self.rng = rng
+        self.pool_size = pool_size
+        self.locale = locale
+
+    def pool(self, field_type: str) -> Optional[Tuple[str, ...]]:
+        """Pool backing a field type, or None if the type is not pooled"""
+        if field_type not in POOLED_PROVIDERS:
+            return None
+        return get_pool(field_type, self.pool_size, self.locale)
+
+    def __getattr__(self, name: str) -> Any:
+        field_type = _PROVIDER_FIELD_TYPES.get(name)
+        if field_type is None:
+            return getattr(self.fake, name)
+        sampler = partial(self.rng.choice, self.pool(field_type))
+        setattr(self, name, sampler)
+        return sampler
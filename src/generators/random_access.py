@@ -0,0 +1,120 @@
+# src/generators/random_access.py
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Union
+from ..data_types.field_types import FieldDefinition
+from .base_generator import DataGenerator
+from .json_generator import JSONGenerator
+from .plan import NULL_PROBABILITY
+from .unique import MASK_64, PermutationSampler, mix64
+
+def record_seed(seed: int, index: int) -> int:
+    """Derive the seed of record `index` from the dataset seed"""
+    return mix64(mix64(seed & MASK_64) ^ index)
+
+class RandomAccessGenerator:
+    """
+    Counter-based generation: every record is a pure function of (template, seed, index).
+
+    Before each record the generator's Random (shared with its Faker instance)
+    is reseeded from (seed, index), so any record, slice or page can be
+    produced in O(1) without generating the records before it.
+
+    Unique fields with an enumerable domain (integers, floats, dates,
+    booleans, choices) take the index-th value of their keyed permutation,
+    so they stay unique across any set of indices. Open-ended unique fields
+    (text, names, emails, ...) cannot be tracked without state and are
+    generated independently per record.
+    """
+
+    def __init__(self, template: Dict[str, FieldDefinition], seed: int = 0,
+                 reference_date: Optional[date] = None, generator: Optional[JSONGenerator] = None):
+        """
+        Args:
+            template: Dictionary defining the data structure and constraints
+            seed: Dataset seed
+            reference_date: Last day of the DATE range; defaults to today.
+                Pin it to keep records stable across days.
+            generator: JSONGenerator to build on; a fresh one is created by default
+        """
+        self.template = template
+        self.seed = seed
+        self.generator = generator or JSONGenerator(seed=seed, reference_date=reference_date)
+        self._random = self.generator.random
+        # Faker draws from the same Random, so one reseed covers every field
+        self.generator.fake.random = self._random
+        plan = self.generator.compile(template)
+        self.field_names = plan.field_names
+        self._items = tuple(
+            (field.name, self._indexed_factory(field, plan.unique_samplers.get(field.name)))
+            for field in plan.fields
+        )
+        # Records available before an enumerable unique field runs out (None: unbounded)
+        self.capacity: Optional[int] = min(
+            (sampler.remaining for sampler in plan.unique_samplers.values()
+             if isinstance(sampler, PermutationSampler)),
+            default=None,
+        )
+
+    def _indexed_factory(self, field, sampler):
+        """Wrap a compiled field as a callable of the record index"""
+        if isinstance(sampler, PermutationSampler):
+            value_at, offset = sampler.value_at, sampler.position
+            if not field.field_def.nullable:
+                return lambda index: value_at(offset + index)
+            rand = self._random.random
+            return lambda index: None if rand() < NULL_PROBABILITY else value_at(offset + index)
+        if sampler is not None:
+            factory = sampler.factory
+            if field.field_def.nullable:
+                rand = self._random.random
+                return lambda index: None if rand() < NULL_PROBABILITY else factory()
+            return lambda index: factory()
+        factory = field.generate
+        return lambda index: factory()
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """
+        Generate the record at a given position.
+
+        Args:
+            index: Zero-based record position
+
+        Returns:
+            The generated data record
+        """
+        if index < 0:
+            raise IndexError("record index must be non-negative")
+        self._random.seed(record_seed(self.seed, index))
+        return {field_name: factory(index) for field_name, factory in self._items}
+
+    def iter_records(self, start: int, stop: int) -> Iterator[Dict[str, Any]]:
+        """Yield records start..stop-1 in order"""
+        for index in range(start, stop):
+            yield self.record(index)
+
+    def records(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        """Generate records start..stop-1"""
+        return list(self.iter_records(start, stop))
+
+    def page(self, page: int, size: int) -> List[Dict[str, Any]]:
+        """Generate one zero-based page of `size` records"""
+        return self.records(page * size, (page + 1) * size)
+
+    def export_range(self, exporter: DataGenerator, start: int, stop: int, filepath: str) -> None:
+        """
+        Export records start..stop-1 with any generator's exporter.
+
+        Args:
+            exporter: Generator whose export() formats the output
+            start: First record index
+            stop: One past the last record index
+            filepath: Path to save the exported file
+        """
+        exporter.export(self.iter_records(start, stop), filepath)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(key, slice):
+            if key.stop is None:
+                raise ValueError("slices of a random-access dataset need an explicit stop")
+            return [self.record(index) for index in range(*key.indices(key.stop))]
+        return self.record(key)
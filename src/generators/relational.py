@@ -0,0 +1,572 @@
+# src/generators/relational.py
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from datetime import date
+from functools import partial
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+import numpy as np
+from ..data_types.field_types import FieldDefinition
+from .base_generator import DataGenerator, DEFAULT_CHUNK_SIZE
+from .csv_generator import CSVGenerator
+from .fixed_width import FixedWidthGenerator
+from .parallel import DEFAULT_SHARD_SIZE, SHARD_EXTENSIONS, Shard, _shard_generator, plan_shards, shard_seed
+from .plan import NULL_PROBABILITY
+from .unique import UniqueOptions, compile_unique, domain_size, stable_hash
+
+@dataclass
+class Table:
+    """
+    One table of a relational schema.
+
+    Fields with `references="table.field"` are foreign keys filled from the
+    parent's key column. Give either a fixed `count` or `per_parent`, a
+    (min, max) number of rows per row of the table referenced by
+    `parent_field` (by default the only foreign key).
+    """
+    name: str
+    template: Dict[str, FieldDefinition]
+    count: Optional[int] = None
+    per_parent: Optional[Tuple[int, int]] = None
+    parent_field: Optional[str] = None
+
+class ForeignKey(NamedTuple):
+    """A foreign-key field and the parent key it points to"""
+    field: str
+    table: str
+    key: str
+    nullable: bool
+
+def table_seed(master_seed: int, table_name: str) -> int:
+    """Derive a table's seed from the master seed and the table name"""
+    return stable_hash(f"{master_seed}:{table_name}")
+
+def _stream_seed(seed: int, label: str) -> int:
+    """Seed of a named NumPy stream within a shard (per-parent counts, one per foreign key)"""
+    return stable_hash(f"{seed}:{label}")
+
+def foreign_keys(template: Dict[str, FieldDefinition]) -> List[ForeignKey]:
+    """Foreign keys declared in a template, in field order"""
+    keys = []
+    for field_name, field_def in template.items():
+        if field_def.references is None:
+            continue
+        table, _, key = field_def.references.partition(".")
+        if not table or not key:
+            raise ValueError(f"field '{field_name}' must reference 'table.field', "
+                             f"not '{field_def.references}'")
+        keys.append(ForeignKey(field_name, table, key, field_def.nullable))
+    return keys
+
+class PermutationKeys:
+    """
+    Parent keys recomputed from the parent table's seed.
+
+    Enumerable unique keys (integers, floats, dates, choices) are the i-th
+    value of a keyed permutation, so the key of any parent row is O(1) to
+    compute and the index needs no memory per row.
+    """
+
+    def __init__(self, table: str, field_name: str, field_def: FieldDefinition,
+                 key: int, size: int, reference_date: Optional[date]):
+        self.table = table
+        self.field_name = field_name
+        self.field_def = field_def
+        self.key = key
+        self.size = size
+        self.reference_date = reference_date
+        self._sampler = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The compiled sampler holds closures; workers rebuild it on first use
+        return dict(self.__dict__, _sampler=None)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def take(self, positions: np.ndarray) -> List[Any]:
+        """Keys of the given parent rows; position -1 gives None"""
+        if self._sampler is None:
+            self._sampler = compile_unique(self.field_name, self.field_def, None, None,
+                                           UniqueOptions(key=self.key), self.reference_date)
+        value_at = self._sampler.value_at
+        return [None if position < 0 else value_at(position) for position in positions.tolist()]
+
+    def column(self, positions: np.ndarray) -> Callable[[], List[Any]]:
+        """Deferred take(), so the keys are computed by the worker that needs them"""
+        return partial(self.take, positions)
+
+class ArrayKeys:
+    """
+    Parent keys collected while the parent table was generated.
+
+    Used for open-ended unique keys (emails, patterns, ...) that cannot be
+    recomputed; only the key column is kept, as one NumPy array.
+    """
+
+    def __init__(self, table: str, field_name: str, keys: Sequence[Any]):
+        self.table = table
+        self.field_name = field_name
+        self.keys = np.asarray(keys) if len(keys) else np.empty(0, dtype=object)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def take(self, positions: np.ndarray) -> List[Any]:
+        """Keys of the given parent rows; position -1 gives None"""
+        values = self.keys[positions].tolist()
+        if len(positions) and positions.min() < 0:
+            values = [None if position < 0 else value for position, value in zip(positions.tolist(), values)]
+        return values
+
+    def column(self, positions: np.ndarray) -> List[Any]:
+        """Keys resolved up front, so workers never receive the whole index"""
+        return self.take(positions)
+
+KeyIndex = Union[PermutationKeys, ArrayKeys]
+
+class TableShard(NamedTuple):
+    """
+    Rows [start, start + count) of one table.
+
+    Tables sized per parent are split into blocks of parent rows:
+    parents [parent_start, parent_start + parent_count).
+    """
+    table: str
+    shard: Shard
+    parent_start: int = 0
+    parent_count: int = 0
+
+def _merge_foreign_keys(records: List[Dict[str, Any]], field_names: Tuple[str, ...],
+                        columns: Dict[str, List[Any]], offset: int) -> List[Dict[str, Any]]:
+    """Rebuild records in template order with the foreign-key values filled in"""
+    merged = []
+    for row, record in enumerate(records, offset):
+        merged.append({
+            field_name: columns[field_name][row] if field_name in columns else record[field_name]
+            for field_name in field_names
+        })
+    return merged
+
+def _iter_table_shard(generator: DataGenerator, template: Dict[str, FieldDefinition],
+                      count: int, columns: Dict[str, Any], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    columns = {field_name: column() if callable(column) else column for field_name, column in columns.items()}
+    field_names = tuple(template)
+    local = {field_name: field_def for field_name, field_def in template.items() if field_name not in columns}
+    offset = 0
+    for chunk in generator.iter_generate(local, count, chunk_size):
+        if columns:
+            chunk = _merge_foreign_keys(chunk, field_names, columns, offset)
+        offset += len(chunk)
+        yield chunk
+
+def _generate_table_shard(generator_cls: Type[DataGenerator], options: Dict[str, Any],
+                          template: Dict[str, FieldDefinition], shard: Shard,
+                          columns: Dict[str, Any], chunk_size: int) -> List[Dict[str, Any]]:
+    """Worker entry point: generate the records of one table shard"""
+    generator = _shard_generator(generator_cls, options, shard)
+    return list(chain.from_iterable(_iter_table_shard(generator, template, shard.count, columns, chunk_size)))
+
+def _export_table_shard(generator_cls: Type[DataGenerator], options: Dict[str, Any],
+                        template: Dict[str, FieldDefinition], shard: Shard,
+                        columns: Dict[str, Any], chunk_size: int, filepath: str,
+                        key_fields: Tuple[str, ...]) -> Tuple[str, Dict[str, List[Any]]]:
+    """Worker entry point: stream one table shard into its part file, returning the requested key columns"""
+    generator = _shard_generator(generator_cls, options, shard)
+    keys: Dict[str, List[Any]] = {field_name: [] for field_name in key_fields}
+
+    def records() -> Iterator[Dict[str, Any]]:
+        for chunk in _iter_table_shard(generator, template, shard.count, columns, chunk_size):
+            for field_name, collected in keys.items():
+                collected.extend(record[field_name] for record in chunk)
+            yield from chunk
+
+    generator.export(records(), filepath)
+    return filepath, keys
+
+class RelationalGenerator:
+    """
+    Several tables linked by foreign keys, generated shard by shard.
+
+    Every table is generated like ParallelGenerator output, with its own seed
+    derived from (seed, table name). Foreign-key columns are drawn from the
+    parent's key index instead of the parent rows:
+
+    - enumerable unique keys are recomputed from the parent's seed
+      (PermutationKeys), so a child table does not wait for its parent;
+    - open-ended unique keys are collected into a compact array while the
+      parent is generated (ArrayKeys). Such parents run as a single shard,
+      which keeps their keys unique.
+
+    The foreign key named by `parent_field` of a per-parent table gives each
+    parent row its own block of children; other foreign keys pick a parent
+    row uniformly. Output is identical for any number of workers.
+    """
+
+    def __init__(self, tables: Sequence[Table], seed: int = 0,
+                 generator_cls: Type[DataGenerator] = CSVGenerator, workers: Optional[int] = None,
+                 shard_size: int = DEFAULT_SHARD_SIZE, chunk_size: int = DEFAULT_CHUNK_SIZE, **options):
+        """
+        Args:
+            tables: Tables of the schema, in any order
+            seed: Master seed from which every table and shard seed is derived
+            generator_cls: Generator class used for both generation and export
+            workers: Process count; defaults to os.cpu_count(), 1 runs in-process
+            shard_size: Maximum records per shard; part of the output's identity
+            chunk_size: Records held in memory per chunk when writing part files
+            options: Extra generator options (e.g. columnar=True)
+
+        Raises:
+            ValueError: on unknown or non-unique referenced keys, mismatched key
+                types, invalid sizes or reference cycles
+        """
+        self.tables = {table.name: table for table in tables}
+        if len(self.tables) != len(tables):
+            raise ValueError("table names must be unique")
+        self.seed = seed
+        self.generator_cls = generator_cls
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.chunk_size = chunk_size
+        options.setdefault("reference_date", date.today())
+        options.setdefault("unique", UniqueOptions())
+        self.options = options
+        self.foreign_keys = {name: foreign_keys(table.template) for name, table in self.tables.items()}
+        self._validate()
+        self.order = self._dependency_order()
+        self._shards: Dict[str, List[TableShard]] = {}
+        self._indexes: Dict[Tuple[str, str], KeyIndex] = {}
+
+    def _validate(self) -> None:
+        for name, table in self.tables.items():
+            if (table.count is None) == (table.per_parent is None):
+                raise ValueError(f"table '{name}' needs exactly one of count or per_parent")
+            if table.count is not None and table.count < 0:
+                raise ValueError(f"table '{name}' has a negative count")
+            for foreign_key in self.foreign_keys[name]:
+                parent = self.tables.get(foreign_key.table)
+                if parent is None:
+                    raise ValueError(f"'{name}.{foreign_key.field}' references unknown table '{foreign_key.table}'")
+                key_def = parent.template.get(foreign_key.key)
+                if key_def is None:
+                    raise ValueError(f"'{name}.{foreign_key.field}' references unknown field "
+                                     f"'{foreign_key.table}.{foreign_key.key}'")
+                if not key_def.unique or key_def.nullable or key_def.references is not None:
+                    raise ValueError(f"'{foreign_key.table}.{foreign_key.key}' must be a unique, "
+                                     f"non-nullable field to be referenced")
+                if key_def.field_type != table.template[foreign_key.field].field_type:
+                    raise ValueError(f"'{name}.{foreign_key.field}' is {table.template[foreign_key.field].field_type} "
+                                     f"but references a {key_def.field_type} key")
+            if table.per_parent is not None:
+                low, high = table.per_parent
+                if not 0 <= low <= high:
+                    raise ValueError(f"table '{name}' per_parent must be (min, max) with 0 <= min <= max")
+                self._parent_key(name)
+
+    def _parent_key(self, name: str) -> ForeignKey:
+        """The foreign key whose parent rows a per-parent table is grouped by"""
+        table = self.tables[name]
+        candidates = self.foreign_keys[name]
+        if table.parent_field is not None:
+            candidates = [foreign_key for foreign_key in candidates if foreign_key.field == table.parent_field]
+        if len(candidates) != 1:
+            raise ValueError(f"table '{name}' needs parent_field naming one of its foreign keys")
+        if candidates[0].nullable:
+            raise ValueError(f"parent field '{name}.{candidates[0].field}' cannot be nullable")
+        return candidates[0]
+
+    def _dependency_order(self) -> List[str]:
+        """Table names with every parent before its children"""
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1: visiting, 2: done
+
+        def visit(name: str) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"foreign keys form a cycle through table '{name}'")
+            state[name] = 1
+            for foreign_key in self.foreign_keys[name]:
+                if foreign_key.table != name:
+                    visit(foreign_key.table)
+            state[name] = 2
+            order.append(name)
+
+        for name in self.tables:
+            visit(name)
+        return order
+
+    def _table_options(self, name: str) -> Dict[str, Any]:
+        """Generator options of one table: unique permutations keyed by the table's seed"""
+        options = dict(self.options, unique=replace(self.options["unique"], key=table_seed(self.seed, name)))
+        if self.generator_cls is FixedWidthGenerator:
+            # Its export() sizes the columns from the table's template
+            options["template"] = self._template(name)
+        return options
+
+    def _template(self, name: str) -> Dict[str, FieldDefinition]:
+        return self.tables[name].template
+
+    def _recomputable(self, name: str, field_name: str) -> bool:
+        return domain_size(self._template(name)[field_name]) is not None
+
+    def _single_shard(self, name: str) -> bool:
+        """Tables with an open-ended referenced key run as one shard to keep that key unique"""
+        return any(
+            foreign_key.table == name and not self._recomputable(name, foreign_key.key)
+            for keys in self.foreign_keys.values() for foreign_key in keys
+        )
+
+    def shards(self, name: str) -> List[TableShard]:
+        """
+        Plan the shards of a table.
+
+        Per-parent tables draw each block's child counts from the block seed,
+        so planning streams over the parent rows without storing the counts.
+        """
+        if name in self._shards:
+            return self._shards[name]
+        table = self.tables[name]
+        seed = table_seed(self.seed, name)
+        if table.count is not None:
+            shard_size = max(1, table.count) if self._single_shard(name) else self.shard_size
+            planned = [TableShard(name, shard) for shard in plan_shards(table.count, shard_size, seed)]
+        else:
+            parent_count = self.count(self._parent_key(name).table)
+            low, high = table.per_parent
+            block_size = parent_count if self._single_shard(name) else max(1, self.shard_size // max(1, high))
+            planned, start = [], 0
+            for index, parent_start in enumerate(range(0, parent_count, max(1, block_size))):
+                parent_block = min(block_size, parent_count - parent_start)
+                block_seed = shard_seed(seed, index)
+                count = int(self._children(block_seed, parent_block, low, high).sum())
+                planned.append(TableShard(name, Shard(index, start, count, block_seed), parent_start, parent_block))
+                start += count
+        self._shards[name] = planned
+        return planned
+
+    @staticmethod
+    def _children(block_seed: int, parents: int, low: int, high: int) -> np.ndarray:
+        """Number of children of each parent row in a block"""
+        return np.random.default_rng(_stream_seed(block_seed, "per_parent")).integers(low, high + 1, size=parents)
+
+    def count(self, name: str) -> int:
+        """Number of rows of a table"""
+        table = self.tables[name]
+        if table.count is not None:
+            return table.count
+        return sum(table_shard.shard.count for table_shard in self.shards(name))
+
+    def key_index(self, table: str, field_name: str) -> KeyIndex:
+        """
+        Index of a parent key column.
+
+        Enumerable keys are recomputed on demand; open-ended keys are collected
+        the first time the parent is generated, here with a pass that keeps
+        only the key column.
+        """
+        index = self._indexes.get((table, field_name))
+        if index is not None:
+            return index
+        if self._recomputable(table, field_name):
+            index = PermutationKeys(table, field_name, self._template(table)[field_name],
+                                    table_seed(self.seed, table), self.count(table),
+                                    self.options["reference_date"])
+        else:
+            for _ in self.iter_chunks(table):
+                pass
+            index = self._indexes[(table, field_name)]
+        self._indexes[(table, field_name)] = index
+        return index
+
+    def _ready(self, name: str) -> bool:
+        """True when every key index the table needs can be built without generating a parent"""
+        return all(
+            self._recomputable(foreign_key.table, foreign_key.key) or (foreign_key.table, foreign_key.key) in self._indexes
+            for foreign_key in self.foreign_keys[name]
+        )
+
+    def _key_fields(self, name: str) -> Tuple[str, ...]:
+        """Fields of a table whose values must be collected into an ArrayKeys index"""
+        return tuple(dict.fromkeys(
+            foreign_key.key for keys in self.foreign_keys.values() for foreign_key in keys
+            if foreign_key.table == name and not self._recomputable(name, foreign_key.key)
+            and (name, foreign_key.key) not in self._indexes
+        ))
+
+    def _columns(self, table_shard: TableShard) -> Dict[str, Any]:
+        """Foreign-key columns of one shard: parent positions drawn here, keys resolved by the index"""
+        name, shard = table_shard.table, table_shard.shard
+        table = self.tables[name]
+        parent_field = self._parent_key(name).field if table.per_parent is not None else None
+        columns = {}
+        for foreign_key in self.foreign_keys[name]:
+            index = self.key_index(foreign_key.table, foreign_key.key)
+            if foreign_key.field == parent_field:
+                low, high = table.per_parent
+                counts = self._children(shard.seed, table_shard.parent_count, low, high)
+                positions = np.repeat(np.arange(table_shard.parent_start,
+                                                table_shard.parent_start + table_shard.parent_count), counts)
+            else:
+                if shard.count and not len(index):
+                    raise ValueError(f"'{name}.{foreign_key.field}' references the empty table '{foreign_key.table}'")
+                rng = np.random.default_rng(_stream_seed(shard.seed, foreign_key.field))
+                positions = rng.integers(0, max(1, len(index)), size=shard.count)
+                if foreign_key.nullable:
+                    positions[rng.random(shard.count) < NULL_PROBABILITY] = -1
+            columns[foreign_key.field] = index.column(positions)
+        return columns
+
+    def iter_chunks(self, name: str) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the records of one table, one list per shard, in shard order.
+
+        Open-ended keys referenced by other tables are collected on the way,
+        so generating parents before children builds every index once.
+
+        Args:
+            name: Table name
+
+        Returns:
+            Iterator over lists of generated data records
+        """
+        template = self._template(name)
+        options = self._table_options(name)
+        key_fields = self._key_fields(name)
+        collected: Dict[str, List[Any]] = {field_name: [] for field_name in key_fields}
+
+        def collect(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            for field_name, keys in collected.items():
+                keys.extend(record[field_name] for record in records)
+            return records
+
+        table_shards = self.shards(name)
+        if self.workers == 1:
+            for table_shard in table_shards:
+                yield collect(_generate_table_shard(self.generator_cls, options, template, table_shard.shard,
+                                                    self._columns(table_shard), self.chunk_size))
+        else:
+            # Same bounded look-ahead as ParallelGenerator.iter_chunks
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                pending: "deque[Future]" = deque()
+                for table_shard in table_shards:
+                    if len(pending) >= self.workers * 2:
+                        yield collect(pending.popleft().result())
+                    pending.append(pool.submit(_generate_table_shard, self.generator_cls, options, template,
+                                               table_shard.shard, self._columns(table_shard), self.chunk_size))
+                while pending:
+                    yield collect(pending.popleft().result())
+        for field_name, keys in collected.items():
+            self._indexes.setdefault((name, field_name), ArrayKeys(name, field_name, keys))
+
+    def iter_records(self, name: str) -> Iterator[Dict[str, Any]]:
+        """Yield all records of one table in shard order"""
+        return chain.from_iterable(self.iter_chunks(name))
+
+    def generate(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Generate every table in memory.
+
+        Returns:
+            Mapping of table name to its records, parents first
+        """
+        return {name: list(self.iter_records(name)) for name in self.order}
+
+    def export(self, directory: str, extension: Optional[str] = None) -> Dict[str, str]:
+        """
+        Export each table, parents first, to <directory>/<table>.<extension>.
+
+        Args:
+            directory: Output directory; created if missing
+            extension: File extension; defaults to the generator's format
+
+        Returns:
+            Mapping of table name to its file path
+        """
+        extension = extension or SHARD_EXTENSIONS.get(self.generator_cls, "dat")
+        os.makedirs(directory, exist_ok=True)
+        paths = {}
+        for name in self.order:
+            paths[name] = os.path.join(directory, f"{name}.{extension}")
+            exporter = self.generator_cls(**self._table_options(name))
+            exporter.export(self.iter_records(name), paths[name])
+        return paths
+
+    def export_shards(self, directory: str, extension: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        Generate every table in parallel, writing each shard to its own part file.
+
+        Shards of different tables share one process pool. A table is submitted
+        as soon as its key indexes are available: immediately for recomputed
+        keys, after the parent's last shard for collected ones.
+
+        Args:
+            directory: Output directory; one sub-directory per table
+            extension: Part file extension; defaults to the generator's format
+
+        Returns:
+            Mapping of table name to its part file paths in shard order
+        """
+        extension = extension or SHARD_EXTENSIONS.get(self.generator_cls, "dat")
+        paths: Dict[str, List[str]] = {}
+        for name in self.order:
+            os.makedirs(os.path.join(directory, name), exist_ok=True)
+            paths[name] = [os.path.join(directory, name, f"part-{table_shard.shard.index:05d}.{extension}")
+                           for table_shard in self.shards(name)]
+
+        def task(name: str, table_shard: TableShard, path: str) -> tuple:
+            return (_export_table_shard, self.generator_cls, self._table_options(name), self._template(name),
+                    table_shard.shard, self._columns(table_shard), self.chunk_size, path, self._key_fields(name))
+
+        if self.workers == 1:
+            for name in self.order:
+                self._store_keys(name, [function(*args) for function, *args in
+                                        (task(name, table_shard, path)
+                                         for table_shard, path in zip(self.shards(name), paths[name]))])
+            return paths
+
+        waiting = list(self.order)
+        queue: "deque[Tuple[str, TableShard, str]]" = deque()
+        outputs = {name: [None] * len(self.shards(name)) for name in self.order}
+        remaining = {name: len(self.shards(name)) for name in self.order}
+
+        def release() -> None:
+            """Queue the shards of every table whose key indexes are now available"""
+            while True:
+                ready = [name for name in waiting if self._ready(name)]
+                if not ready:
+                    return
+                for name in ready:
+                    waiting.remove(name)
+                    queue.extend((name, table_shard, path)
+                                 for table_shard, path in zip(self.shards(name), paths[name]))
+                    if not remaining[name]:
+                        self._store_keys(name, [])
+
+        # Key columns are drawn when a shard is submitted, so at most
+        # 2 * workers shards hold theirs in memory at a time
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            in_flight: Dict[Future, Tuple[str, int]] = {}
+            release()
+            while queue or in_flight:
+                while queue and len(in_flight) < self.workers * 2:
+                    name, table_shard, path = queue.popleft()
+                    function, *args = task(name, table_shard, path)
+                    in_flight[pool.submit(function, *args)] = (name, table_shard.shard.index)
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, index = in_flight.pop(future)
+                    outputs[name][index] = future.result()
+                    remaining[name] -= 1
+                    if not remaining[name]:
+                        self._store_keys(name, outputs[name])
+                        release()
+        return paths
+
+    def _store_keys(self, name: str, outputs: List[Tuple[str, Dict[str, List[Any]]]]) -> None:
+        """Build the ArrayKeys indexes of a finished table from its shards' key columns"""
+        for field_name in self._key_fields(name):
+            keys = list(chain.from_iterable(shard_keys[field_name] for _, shard_keys in outputs))
+            self._indexes[(name, field_name)] = ArrayKeys(name, field_name, keys)
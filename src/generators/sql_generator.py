@@ -0,0 +1,342 @@
+# src/generators/sql_generator.py
+import re
+import sqlite3
+from datetime import date
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from .base_generator import DataGenerator, DEFAULT_CHUNK_SIZE
+from .compression import OutputFile, strip_compression_extension
+from .json_generator import JSONGenerator
+from .stats import GenerationStats, measure_export
+from ..data_types.field_types import FieldDefinition, FieldTypes
+
+SQLITE = "sqlite"
+INSERT = "insert"
+COPY = "copy"
+SCRIPT_FORMATS = (INSERT, COPY)
+
+DEFAULT_TABLE = "records"
+DEFAULT_BATCH_SIZE = 1000  # Rows per multi-row INSERT statement
+DEFAULT_TRANSACTION_SIZE = 100000  # Rows per SQLite transaction
+
+FORMAT_EXTENSIONS = {
+    ".db": SQLITE,
+    ".sqlite": SQLITE,
+    ".sqlite3": SQLITE,
+    ".sql": INSERT,
+}
+
+# Portable column types: PostgreSQL takes them as-is and SQLite maps them to
+# INTEGER, REAL and NUMERIC affinity (ISO date strings stay text)
+SQL_TYPES = {
+    FieldTypes.INTEGER: "BIGINT",
+    FieldTypes.FLOAT: "DOUBLE PRECISION",
+    FieldTypes.BOOLEAN: "BOOLEAN",
+    FieldTypes.DATE: "DATE",
+}
+TEXT_TYPE = "TEXT"
+
+PYTHON_FIELD_TYPES = (
+    (bool, FieldTypes.BOOLEAN),  # Before int: bool is an int subclass
+    (int, FieldTypes.INTEGER),
+    (float, FieldTypes.FLOAT),
+    (date, FieldTypes.DATE),
+)
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+def quote_identifier(name: str) -> str:
+    """Double-quoted SQL identifier"""
+    return '"' + name.replace('"', '""') + '"'
+
+def table_name_for(name: str) -> str:
+    """Table name for a template name, e.g. "User Data" -> "user_data" """
+    return re.sub(r"\W+", "_", name.strip().lower()).strip("_") or DEFAULT_TABLE
+
+def sql_type(field_def: FieldDefinition) -> str:
+    """Column type of a field; text-like types (email, name, ...) are TEXT"""
+    return SQL_TYPES.get(field_def.field_type, TEXT_TYPE)
+
+def create_table_sql(table: str, template: Dict[str, FieldDefinition]) -> str:
+    """CREATE TABLE statement with one column per template field"""
+    columns = []
+    for field_name, field_def in template.items():
+        column = f"{quote_identifier(field_name)} {sql_type(field_def)}"
+        if not field_def.nullable:
+            column += " NOT NULL"
+        if field_def.unique:
+            column += " UNIQUE"
+        columns.append(column)
+    return f"CREATE TABLE {quote_identifier(table)} ({', '.join(columns)})"
+
+def infer_template(record: Dict[str, Any]) -> Dict[str, FieldDefinition]:
+    """Nullable columns typed from one record's values, for exports without a template"""
+    template = {}
+    for field_name, value in record.items():
+        field_type = next((field_type for python_type, field_type in PYTHON_FIELD_TYPES
+                           if isinstance(value, python_type)), FieldTypes.STRING)
+        template[field_name] = FieldDefinition(name=field_name, field_type=field_type, nullable=True)
+    return template
+
+def file_format_for(filepath: str) -> Optional[str]:
+    """Format implied by a file extension (ignoring .gz/.bz2/.xz), or None"""
+    lowered = strip_compression_extension(filepath).lower()
+    for extension, file_format in FORMAT_EXTENSIONS.items():
+        if lowered.endswith(extension):
+            return file_format
+    return None
+
+def _quote_text(value: Any) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+def _literal_formatter(field_def: FieldDefinition) -> Callable[[Any], str]:
+    """Value -> SQL literal for one column"""
+    field_type = field_def.field_type
+    if field_type in (FieldTypes.INTEGER, FieldTypes.FLOAT):
+        format_value = str
+    elif field_type == FieldTypes.BOOLEAN:
+        format_value = lambda value: "TRUE" if value else "FALSE"
+    elif field_type == FieldTypes.DATE:
+        format_value = lambda value: _quote_text(value.isoformat() if isinstance(value, date) else value)
+    else:
+        format_value = _quote_text
+    return lambda value: "NULL" if value is None else format_value(value)
+
+def _copy_formatter(field_def: FieldDefinition) -> Callable[[Any], str]:
+    """Value -> PostgreSQL COPY text field for one column"""
+    field_type = field_def.field_type
+    if field_type in (FieldTypes.INTEGER, FieldTypes.FLOAT):
+        format_value = str
+    elif field_type == FieldTypes.BOOLEAN:
+        format_value = lambda value: "t" if value else "f"
+    elif field_type == FieldTypes.DATE:
+        format_value = lambda value: value.isoformat() if isinstance(value, date) else str(value)
+    else:
+        format_value = lambda value: str(value).translate(_COPY_ESCAPES)
+    return lambda value: "\\N" if value is None else format_value(value)
+
+def _row_getter(template: Dict[str, FieldDefinition]) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """Record -> value tuple in template column order"""
+    field_names = list(template)
+    if len(field_names) == 1:
+        field_name = field_names[0]
+        return lambda record: (record[field_name],)
+    return itemgetter(*field_names)
+
+def _sqlite_row_converter(template: Dict[str, FieldDefinition]) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """Record -> SQLite parameter tuple; dates are bound as ISO strings"""
+    get_row = _row_getter(template)
+    date_indices = [index for index, field_def in enumerate(template.values())
+                    if field_def.field_type == FieldTypes.DATE]
+    if not date_indices:
+        return get_row
+
+    def convert(record: Dict[str, Any]) -> Tuple[Any, ...]:
+        row = list(get_row(record))
+        for index in date_indices:
+            value = row[index]
+            if isinstance(value, date):
+                row[index] = value.isoformat()
+        return tuple(row)
+    return convert
+
+class SQLGenerator(DataGenerator):
+    """
+    Database fixture export: SQLite databases, multi-row INSERT scripts and
+    PostgreSQL COPY scripts.
+
+    The table schema comes from the template's FieldDefinitions (types,
+    NOT NULL, UNIQUE) or, without a template, from the first record. Records
+    are streamed: SQLite rows go through executemany() in transactions of
+    transaction_size rows, and scripts are written batch_size rows per
+    statement, so the dataset is never materialized.
+    """
+
+    def __init__(self, file_format: Optional[str] = None, table: str = DEFAULT_TABLE,
+                 batch_size: int = DEFAULT_BATCH_SIZE, transaction_size: int = DEFAULT_TRANSACTION_SIZE,
+                 replace: bool = True, **options):
+        """
+        Args:
+            file_format: "sqlite", "insert" or "copy"; inferred from the output extension by
+                default (.db/.sqlite/.sqlite3 for SQLite, .sql for INSERT scripts)
+            table: Table name
+            batch_size: Rows per multi-row INSERT statement
+            transaction_size: Rows per SQLite transaction
+            replace: Drop an existing table first; otherwise rows are appended to it
+            options: Generation options (seed, columnar, ...) forwarded to the JSON generator
+        """
+        if file_format not in (None, SQLITE, INSERT, COPY):
+            raise ValueError(f"unknown SQL file format: {file_format}")
+        self.json_generator = JSONGenerator(**options)
+        self.file_format = file_format
+        self.table = table
+        self.batch_size = batch_size
+        self.transaction_size = transaction_size
+        self.replace = replace
+
+    @property
+    def stats(self) -> Optional[GenerationStats]:
+        """Instrumentation shared with the JSON generator (enabled with stats=True)"""
+        return self.json_generator.stats
+
+    def generate(self, template: Dict[str, FieldDefinition], count: int) -> List[Dict[str, Any]]:
+        """Generate data using JSON generator for consistency"""
+        return self.json_generator.generate(template, count)
+
+    def iter_generate(self, template: Dict[str, FieldDefinition], count: int,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """Stream data chunks using JSON generator for consistency"""
+        return self.json_generator.iter_generate(template, count, chunk_size)
+
+    def _resolve(self, filepath: Optional[str], file_format: Optional[str]) -> str:
+        return file_format or self.file_format or (file_format_for(filepath) if filepath else None) or INSERT
+
+    def _prepare(self, data: Iterable[Dict[str, Any]], template: Optional[Dict[str, FieldDefinition]]
+                 ) -> Tuple[Iterator[Dict[str, Any]], Optional[Dict[str, FieldDefinition]]]:
+        """Records and the template fixing the schema (inferred from the first record if needed)"""
+        records = iter(data)
+        if template is not None:
+            return records, template
+        first = next(records, None)
+        if first is None:
+            return records, None
+        return chain([first], records), infer_template(first)
+
+    def _schema_statements(self, table: str, template: Dict[str, FieldDefinition]) -> List[str]:
+        if self.replace:
+            return [f"DROP TABLE IF EXISTS {quote_identifier(table)}", create_table_sql(table, template)]
+        return [create_table_sql(table, template).replace("CREATE TABLE", "CREATE TABLE IF NOT EXISTS", 1)]
+
+    def load_sqlite(self, connection: sqlite3.Connection, data: Iterable[Dict[str, Any]],
+                    template: Optional[Dict[str, FieldDefinition]] = None,
+                    table: Optional[str] = None) -> int:
+        """
+        Create the table and insert records into an open SQLite connection.
+
+        Rows are bound with executemany() straight from the record stream,
+        committing every transaction_size rows. If the connection is already
+        inside a transaction, committing is left to the caller.
+
+        Returns:
+            Number of rows inserted
+        """
+        records, template = self._prepare(data, template)
+        if template is None:
+            return 0
+        table = table or self.table
+        for statement in self._schema_statements(table, template):
+            connection.execute(statement)
+
+        columns = ", ".join(quote_identifier(field_name) for field_name in template)
+        placeholders = ", ".join("?" * len(template))
+        insert = f"INSERT INTO {quote_identifier(table)} ({columns}) VALUES ({placeholders})"
+        rows = map(_sqlite_row_converter(template), records)
+        manage_transactions = not connection.in_transaction
+
+        total = 0
+        while True:
+            if manage_transactions:
+                connection.execute("BEGIN")
+            inserted = connection.executemany(insert, islice(rows, self.transaction_size)).rowcount
+            if manage_transactions:
+                connection.execute("COMMIT")
+            total += max(inserted, 0)
+            if inserted < self.transaction_size:
+                return total
+
+    def write(self, data: Iterable[Dict[str, Any]], stream: TextIO,
+              template: Optional[Dict[str, FieldDefinition]] = None, table: Optional[str] = None,
+              file_format: Optional[str] = None) -> None:
+        """
+        Write an SQL script (schema and rows, in one transaction) to an open stream.
+
+        Args:
+            data: Generated data records; consumed batch_size records at a time
+            stream: Destination stream; it is left open
+            template: Template whose FieldDefinitions fix the schema; inferred from
+                the first record when omitted
+            table: Table name; defaults to self.table
+            file_format: "insert" (multi-row INSERT statements) or "copy"
+                (PostgreSQL COPY ... FROM stdin); defaults to self.file_format or "insert"
+        """
+        file_format = file_format or self.file_format or INSERT
+        if file_format not in SCRIPT_FORMATS:
+            raise ValueError(f"{file_format} output cannot be written to a stream")
+        records, template = self._prepare(data, template)
+        if template is None:
+            return
+        table = table or self.table
+        columns = ", ".join(quote_identifier(field_name) for field_name in template)
+        get_row = _row_getter(template)
+
+        stream.write("BEGIN;\n")
+        for statement in self._schema_statements(table, template):
+            stream.write(statement + ";\n")
+        table = quote_identifier(table)
+        if file_format == INSERT:
+            formatters = [_literal_formatter(field_def) for field_def in template.values()]
+            header = f"INSERT INTO {table} ({columns}) VALUES\n"
+            while True:
+                batch = list(islice(records, self.batch_size))
+                if not batch:
+                    break
+                values = ",\n".join(
+                    "(" + ", ".join([format_value(value) for format_value, value in zip(formatters, get_row(record))]) + ")"
+                    for record in batch
+                )
+                stream.write(header + values + ";\n")
+        else:
+            formatters = [_copy_formatter(field_def) for field_def in template.values()]
+            stream.write(f"COPY {table} ({columns}) FROM stdin;\n")
+            while True:
+                batch = list(islice(records, self.batch_size))
+                if not batch:
+                    break
+                stream.write("".join(
+                    "\t".join([format_value(value) for format_value, value in zip(formatters, get_row(record))]) + "\n"
+                    for record in batch
+                ))
+            stream.write("\\.\n")
+        stream.write("COMMIT;\n")
+
+    def export(self, data: Iterable[Dict[str, Any]], filepath: str,
+               template: Optional[Dict[str, FieldDefinition]] = None, table: Optional[str] = None,
+               file_format: Optional[str] = None, compression: Optional[str] = None,
+               compression_level: Optional[int] = None) -> None:
+        """
+        Export records to a SQLite database or an SQL script.
+
+        Args:
+            data: Generated data records; consumed incrementally
+            filepath: Database or script path; an existing database keeps its other tables
+            template: Template whose FieldDefinitions fix the schema; inferred from
+                the first record when omitted
+            table: Table name; defaults to self.table
+            file_format: "sqlite", "insert" or "copy"; defaults to self.file_format,
+                then to the one implied by the extension, then to "insert"
+            compression: "gzip", "bz2" or "xz" for scripts; defaults to the one implied
+                by a .gz/.bz2/.xz extension
+            compression_level: Compression level; defaults to the codec's usual level
+        """
+        file_format = self._resolve(filepath, file_format)
+        if file_format == SQLITE:
+            with measure_export(self.stats, SQLITE, filepath, data) as data:
+                connection = sqlite3.connect(filepath)
+                try:
+                    # Fixture loads trade durability for speed; the file is rebuilt on failure anyway
+                    connection.execute("PRAGMA synchronous = OFF")
+                    connection.execute("PRAGMA journal_mode = MEMORY")
+                    self.load_sqlite(connection, data, template, table)
+                finally:
+                    connection.close()
+            return
+        output = OutputFile(filepath, compression, compression_level)
+        with measure_export(self.stats, file_format, filepath, data, output=output) as data:
+            with output as f:
+                self.write(data, f, template, table, file_format)
+
+    def export_stream(self, template: Dict[str, FieldDefinition], count: int, filepath: str,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Generate and export count records with the template's schema, chunk by chunk"""
+        self.export(chain.from_iterable(self.iter_generate(template, count, chunk_size)), filepath, template)
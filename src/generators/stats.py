@@ -0,0 +1,207 @@
+# src/generators/stats.py
+import os
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .compression import OutputFile
+
+DEFAULT_SAMPLE_EVERY = 16  # Row plans time one record in this many
+
+@dataclass
+class FieldStats:
+    """
+    Counters for one field.
+
+    Columnar plans time every value; row plans time one record in
+    sample_every, and seconds extrapolates from the timed values.
+    """
+    name: str
+    field_type: str
+    values: int = 0
+    nulls: int = 0
+    timed_values: int = 0
+    timed_seconds: float = 0.0
+    unique_retries: int = 0
+    unique_exhausted: int = 0
+
+    @property
+    def seconds(self) -> float:
+        """Estimated time spent generating this field's values"""
+        if not self.timed_values:
+            return 0.0
+        return self.timed_seconds * self.values / self.timed_values
+
+    @property
+    def values_per_second(self) -> float:
+        return self.values / self.seconds if self.seconds > 0 else 0.0
+
+@dataclass
+class ExportStats:
+    """One export() call; bytes is the size on disk, after any compression"""
+    format: str
+    records: int
+    bytes: int
+    seconds: float
+    compression: Optional[str] = None
+    uncompressed_bytes: Optional[int] = None
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        if self.uncompressed_bytes is None or not self.bytes:
+            return None
+        return self.uncompressed_bytes / self.bytes
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+class GenerationStats:
+    """
+    Instrumentation shared by a generator's plans and exporters.
+
+    Collects per-field timing and null counts, unique retry and exhaustion
+    counts, and exporter throughput. Enabled with JSONGenerator(stats=True)
+    (or any generator forwarding options to it); totals accumulate over
+    every call until reset().
+    """
+
+    def __init__(self, sample_every: int = DEFAULT_SAMPLE_EVERY):
+        self.sample_every = sample_every
+        self.fields: Dict[str, FieldStats] = {}
+        self.exports: List[ExportStats] = []
+        self.records = 0
+        self.seconds = 0.0
+        self._unique_seen: "weakref.WeakKeyDictionary[Any, Tuple[int, int]]" = weakref.WeakKeyDictionary()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Sampler bookkeeping refers to live plans and is not carried over
+        state = dict(self.__dict__)
+        del state["_unique_seen"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._unique_seen = weakref.WeakKeyDictionary()
+
+    def reset(self) -> None:
+        """Clear every counter"""
+        self.fields.clear()
+        self.exports.clear()
+        self.records = 0
+        self.seconds = 0.0
+        self._unique_seen = weakref.WeakKeyDictionary()
+
+    def field(self, name: str, field_type: str) -> FieldStats:
+        """Counters for a field, created on first use"""
+        stats = self.fields.get(name)
+        if stats is None:
+            stats = self.fields[name] = FieldStats(name, field_type)
+        return stats
+
+    def add_batch(self, records: int, seconds: float) -> None:
+        self.records += records
+        self.seconds += seconds
+
+    def observe_unique(self, samplers: Dict[str, Any]) -> None:
+        """Fold retry and exhaustion counts the samplers gained since the last call into the totals"""
+        for field_name, sampler in samplers.items():
+            stats = self.fields.get(field_name)
+            if stats is None:
+                continue
+            retries = getattr(sampler, "retries", 0)
+            exhausted = sampler.exhausted
+            seen_retries, seen_exhausted = self._unique_seen.get(sampler, (0, 0))
+            stats.unique_retries += retries - seen_retries
+            stats.unique_exhausted += exhausted - seen_exhausted
+            self._unique_seen[sampler] = (retries, exhausted)
+
+    def by_field_type(self) -> Dict[str, FieldStats]:
+        """Field counters summed per field type"""
+        totals: Dict[str, FieldStats] = {}
+        for stats in self.fields.values():
+            total = totals.get(stats.field_type)
+            if total is None:
+                total = totals[stats.field_type] = FieldStats(stats.field_type, stats.field_type)
+            total.values += stats.values
+            total.nulls += stats.nulls
+            total.timed_values += stats.timed_values
+            total.timed_seconds += stats.timed_seconds
+            total.unique_retries += stats.unique_retries
+            total.unique_exhausted += stats.unique_exhausted
+        return totals
+
+    @contextmanager
+    def measure_export(self, fmt: str, filepath: str, data: Iterable[Any] = (),
+                       records: int = 0, output: Optional[OutputFile] = None,
+                       batches: bool = False) -> Iterator[Iterable[Any]]:
+        """
+        Time an export and record its size, counting records as the exporter consumes them.
+
+        Usage:
+            with stats.measure_export("csv", filepath, data) as data:
+                ...write data to filepath...
+
+        Pass records instead of data when the exporter does not consume records (column batches),
+        batches=True when data yields RecordBatches (each counts len(batch) records), and the
+        OutputFile written to so its compression ratio is recorded.
+        """
+        counter = _Counter(data, batches)
+        start = time.perf_counter()
+        yield counter
+        seconds = time.perf_counter() - start
+        size = os.path.getsize(filepath) if os.path.exists(filepath) else 0
+        export = ExportStats(fmt, counter.count or records, size, seconds)
+        if output is not None and output.stats is not None:
+            export.compression = output.stats.compression
+            export.uncompressed_bytes = output.stats.bytes_in
+        self.exports.append(export)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain-data snapshot for logging or display"""
+        return {
+            "records": self.records,
+            "seconds": self.seconds,
+            "fields": [_field_dict(stats) for stats in self.fields.values()],
+            "field_types": [_field_dict(stats) for stats in self.by_field_type().values()],
+            "exports": [dict(asdict(export), bytes_per_second=export.bytes_per_second,
+                             compression_ratio=export.compression_ratio)
+                        for export in self.exports],
+        }
+
+def _field_dict(stats: FieldStats) -> Dict[str, Any]:
+    return dict(asdict(stats), seconds=stats.seconds)
+
+class _Counter:
+    """Iterable wrapper that counts the records (or records of the batches) passing through it"""
+
+    def __init__(self, data: Iterable[Any], batches: bool = False):
+        self.data = data
+        self.batches = batches
+        self.count = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.batches:
+            for batch in self.data:
+                self.count += len(batch)
+                yield batch
+            return
+        for record in self.data:
+            self.count += 1
+            yield record
+
+@contextmanager
+def measure_export(stats: Optional[GenerationStats], fmt: str, filepath: str,
+                   data: Iterable[Any] = (), records: int = 0,
+                   output: Optional[OutputFile] = None, batches: bool = False) -> Iterator[Iterable[Any]]:
+    """stats.measure_export() when stats are enabled, otherwise pass data through untouched"""
+    if stats is None:
+        yield data
+    else:
+        with stats.measure_export(fmt, filepath, data, records, output, batches) as counted:
+            yield counted
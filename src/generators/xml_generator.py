@@ -1,52 +1,86 @@
 # src/generators/xml_generator.py
-from typing import Dict, Any, List
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
-from datetime import date, datetime
-from .base_generator import DataGenerator
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+from .base_generator import DataGenerator, DEFAULT_CHUNK_SIZE
+from .batch import RecordBatch
 from .json_generator import JSONGenerator
+from .xml_writer import XMLStreamWriter, format_xml_value
+from .compression import OutputFile
+from .stats import GenerationStats, measure_export
 from ..data_types.field_types import FieldDefinition
 import faker
 
 class XMLGenerator(DataGenerator):
-    def __init__(self):
+    def __init__(self, **options):
+        """Options (columnar, seed, reference_date) are forwarded to the JSON generator"""
         self.fake = faker.Faker()
-        self.json_generator = JSONGenerator()
+        self.json_generator = JSONGenerator(**options)
+        
+    @property
+    def stats(self) -> Optional[GenerationStats]:
+        """Instrumentation shared with the JSON generator (enabled with stats=True)"""
+        return self.json_generator.stats
         
     def _format_value(self, value: Any) -> str:
         """
         Format value to proper string representation for XML.
         """
-        if value is None:
-            return ""
-        elif isinstance(value, (date, datetime)):
-            return value.isoformat()
-        elif isinstance(value, bool):
-            return str(value).lower()
-        elif isinstance(value, (int, float)):
-            return str(value)
-        else:
-            # Escape special XML characters
-            return str(value).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;').replace("'", '&apos;')
+        return format_xml_value(value)
     
     def generate(self, template: Dict[str, FieldDefinition], count: int) -> List[Dict[str, Any]]:
         """Generate data using JSON generator for consistency"""
         return self.json_generator.generate(template, count)
     
-    def export(self, data: List[Dict[str, Any]], filepath: str) -> None:
-        """Export data to XML format"""
-        root = ET.Element("records")
-        
-        for record in data:
-            record_elem = ET.SubElement(root, "record")
-            for key, value in record.items():
-                field_elem = ET.SubElement(record_elem, key)
-                field_elem.text = self._format_value(value)
-        
-        # Convert to string with pretty printing
-        rough_string = ET.tostring(root, encoding='unicode', method='xml')
-        reparsed = minidom.parseString(rough_string)
+    def generate_with_stats(self, template: Dict[str, FieldDefinition],
+                            count: int) -> Tuple[List[Dict[str, Any]], GenerationStats]:
+        """Generate data and return it with the generator's instrumentation"""
+        return self.json_generator.generate_with_stats(template, count)
+    
+    def iter_generate(self, template: Dict[str, FieldDefinition], count: int,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """Stream data chunks using JSON generator for consistency"""
+        return self.json_generator.iter_generate(template, count, chunk_size)
+    
+    def iter_batches(self, template: Dict[str, FieldDefinition], count: int,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[RecordBatch]:
+        """Stream compact RecordBatches using JSON generator for consistency"""
+        return self.json_generator.iter_batches(template, count, chunk_size)
+    
+    def write(self, data: Iterable[Dict[str, Any]], stream: TextIO, indent: Optional[str] = "  ") -> None:
+        """Write data as an XML document to an open stream"""
+        with XMLStreamWriter(stream, indent=indent) as writer:
+            writer.write_records(data)
+    
+    def export(self, data: Iterable[Dict[str, Any]], filepath: str, indent: Optional[str] = "  ",
+               compression: Optional[str] = None, compression_level: Optional[int] = None) -> None:
+        """
+        Export data to XML format.
         
-        # Write to file with explicit encoding
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(reparsed.toprettyxml(indent="  "))
\ No newline at end of file
+        Records are written as they arrive; pass indent=None for compact output.
+        Compression ("gzip", "bz2", "xz") defaults to the one implied by a
+        .gz/.bz2/.xz extension and runs on a background thread.
+        """
+        if isinstance(data, RecordBatch):
+            return self.export_batches([data], filepath, indent, compression, compression_level)
+        output = OutputFile(filepath, compression, compression_level)
+        with measure_export(self.stats, "xml", filepath, data, output=output) as data:
+            with output as f:
+                self.write(data, f, indent)
+    
+    def write_batches(self, batches: Iterable[RecordBatch], stream: TextIO, indent: Optional[str] = "  ") -> None:
+        """Write RecordBatches as an XML document, straight from their rows"""
+        with XMLStreamWriter(stream, indent=indent) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+    
+    def export_batches(self, batches: Iterable[RecordBatch], filepath: str, indent: Optional[str] = "  ",
+                       compression: Optional[str] = None, compression_level: Optional[int] = None) -> None:
+        """Export RecordBatches to XML; the file is identical to exporting the same records"""
+        output = OutputFile(filepath, compression, compression_level)
+        with measure_export(self.stats, "xml", filepath, batches, output=output, batches=True) as batches:
+            with output as f:
+                self.write_batches(batches, f, indent)
+    
+    def export_stream(self, template: Dict[str, FieldDefinition], count: int, filepath: str,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Generate and export chunk by chunk as RecordBatches"""
+        self.export_batches(self.iter_batches(template, count, chunk_size), filepath)
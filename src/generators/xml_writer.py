@@ -0,0 +1,108 @@
+# src/generators/xml_writer.py
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
+from .batch import RecordBatch
+
+XML_DECLARATION = '<?xml version="1.0" ?>'
+
+def format_xml_value(value: Any) -> str:
+    """
+    Format value to an escaped string representation for XML text content.
+    """
+    if value is None:
+        return ""
+    elif isinstance(value, (date, datetime)):
+        return value.isoformat()
+    elif isinstance(value, bool):
+        return "true" if value else "false"
+    elif isinstance(value, (int, float)):
+        return str(value)
+    text = str(value)
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+class XMLStreamWriter:
+    """
+    Incremental writer for <records>/<record> documents.
+
+    Each record is rendered to a single string and written as soon as it
+    arrives, so memory use is bounded by one record regardless of file size.
+    The layout matches the previous minidom pretty printer.
+    """
+
+    def __init__(self, stream: TextIO, root_tag: str = "records", record_tag: str = "record",
+                 indent: Optional[str] = "  "):
+        self.stream = stream
+        self.root_tag = root_tag
+        self.record_tag = record_tag
+        self.newline = "\n" if indent is not None else ""
+        indent = indent or ""
+        self._field_indent = indent * 2
+        self._record_open = f"{indent}<{record_tag}>{self.newline}"
+        self._record_close = f"{indent}</{record_tag}>{self.newline}"
+        self._tags: Dict[str, Tuple[str, str, str]] = {}
+        self.records_written = 0
+
+    def _field_tags(self, key: str) -> Tuple[str, str, str]:
+        tags = self._tags.get(key)
+        if tags is None:
+            tags = (f"{self._field_indent}<{key}>",
+                    f"</{key}>{self.newline}",
+                    f"{self._field_indent}<{key}/>{self.newline}")
+            self._tags[key] = tags
+        return tags
+
+    def write_record(self, record: Dict[str, Any]) -> None:
+        """Render and write one record element"""
+        field_tags = self._field_tags
+        self._write_values([field_tags(key) for key in record], record.values())
+
+    def write_batch(self, batch: RecordBatch) -> None:
+        """Write every row of a RecordBatch, resolving the field tags once per batch"""
+        tags = [self._field_tags(field_name) for field_name in batch.fields]
+        for row in batch.iter_rows():
+            self._write_values(tags, row)
+
+    def _write_values(self, tags: List[Tuple[str, str, str]], values: Iterable[Any]) -> None:
+        if self.records_written == 0:
+            self.stream.write(f"{XML_DECLARATION}\n<{self.root_tag}>{self.newline}")
+
+        parts = [self._record_open]
+        for (open_tag, close_tag, empty_tag), value in zip(tags, values):
+            text = format_xml_value(value)
+            if text:
+                parts.append(open_tag)
+                parts.append(text)
+                parts.append(close_tag)
+            else:
+                parts.append(empty_tag)
+        parts.append(self._record_close)
+        self.stream.write("".join(parts))
+        self.records_written += 1
+
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Write every record from an iterable"""
+        for record in records:
+            self.write_record(record)
+
+    def flush(self) -> None:
+        """Records are written as they arrive, so nothing is queued"""
+
+    def close(self) -> None:
+        """Close the root element; the underlying stream is left open"""
+        if self.records_written == 0:
+            self.stream.write(f"{XML_DECLARATION}\n<{self.root_tag}/>\n")
+        else:
+            self.stream.write(f"</{self.root_tag}>\n")
+
+    def __enter__(self) -> "XMLStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
@@ -0,0 +1,428 @@
+# src/server.py
+"""
+Local asyncio HTTP server exposing each template as a paged, streaming endpoint:
+
+    python -m src.server --port 8080
+    curl 'http://127.0.0.1:8080/user?seed=42&page=3&size=500&format=csv'
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
+from functools import partial
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+from .data_types.field_types import FieldDefinition, template_fingerprint
+from .generators.json_writer import JSONLinesWriter
+from .generators.random_access import RandomAccessGenerator
+from .templates.base_template import BaseTemplate
+from .templates.registry import TEMPLATES
+from .templates.schema_template import SchemaError, SchemaTemplate
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000000
+CHUNK_ROWS = 1000  # Records rendered per executor call and per HTTP chunk
+DATASET_CACHE_SIZE = 16  # Random-access datasets kept per executor thread or process
+MAX_HEADER_LINES = 100
+MAX_DISCARDED_BODY = 1 << 20  # Larger request bodies close the connection instead of being skipped
+
+NDJSON = "ndjson"
+CSV = "csv"
+CONTENT_TYPES = {
+    NDJSON: "application/x-ndjson",
+    CSV: "text/csv; charset=utf-8",
+}
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           500: "Internal Server Error"}
+
+DatasetKey = Tuple[str, int, date]
+
+class RequestError(Exception):
+    """A request that is answered with an error status and JSON message"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class ResponseAborted(Exception):
+    """A failure after the status line was sent; only closing the connection can signal it"""
+
+_local = threading.local()
+
+def _dataset(key: DatasetKey, template: Dict[str, FieldDefinition]) -> RandomAccessGenerator:
+    """Random-access dataset for (template fingerprint, seed, reference date), cached per thread"""
+    cache = getattr(_local, "datasets", None)
+    if cache is None:
+        cache = _local.datasets = OrderedDict()
+    dataset = cache.get(key)
+    if dataset is None:
+        _, seed, reference_date = key
+        dataset = cache[key] = RandomAccessGenerator(template, seed, reference_date)
+        if len(cache) > DATASET_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return dataset
+
+def page_bounds(key: DatasetKey, template: Dict[str, FieldDefinition], page: int, size: int) -> Tuple[int, int]:
+    """Record range of a page, cut short where an enumerable unique field runs out"""
+    start, stop = page * size, (page + 1) * size
+    capacity = _dataset(key, template).capacity
+    if capacity is not None:
+        stop = min(stop, capacity)
+    return start, stop
+
+def render_records(records: List[Dict[str, Any]], fmt: str, header: bool = False) -> bytes:
+    """Encode records as NDJSON or CSV rows (with a header row when asked)"""
+    buffer = io.StringIO()
+    if fmt == NDJSON:
+        with JSONLinesWriter(buffer) as writer:
+            writer.write_records(records)
+    else:
+        writer = csv.writer(buffer)
+        field_names = list(records[0]) if records else []
+        if header:
+            writer.writerow(field_names)
+        if len(field_names) == 1:
+            writer.writerows([record[field_names[0]]] for record in records)
+        elif field_names:
+            writer.writerows(map(itemgetter(*field_names), records))
+    return buffer.getvalue().encode("utf-8")
+
+def render_chunk(key: DatasetKey, template: Dict[str, FieldDefinition], start: int, stop: int,
+                 fmt: str, header: bool = False) -> bytes:
+    """Executor entry point: generate and encode records start..stop-1"""
+    return render_records(_dataset(key, template).records(start, stop), fmt, header)
+
+def _int_param(query: Dict[str, List[str]], name: str, default: int, minimum: int,
+               maximum: Optional[int] = None) -> int:
+    values = query.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[-1])
+    except ValueError:
+        raise RequestError(400, f"{name} must be an integer")
+    if value < minimum or (maximum is not None and value > maximum):
+        bounds = f"between {minimum} and {maximum}" if maximum is not None else f"at least {minimum}"
+        raise RequestError(400, f"{name} must be {bounds}")
+    return value
+
+class MockDataServer:
+    """
+    HTTP/1.1 server with one endpoint per template.
+
+    GET /<template>?seed=S&page=P&size=N&format=ndjson|csv returns records
+    P*N .. P*N+N-1 of the dataset defined by (template, seed, reference
+    date). Every record is a pure function of its index (see
+    RandomAccessGenerator), so a page is identical on every request and
+    for any page size. Responses are streamed with chunked transfer
+    encoding (to HTTP/1.0 clients as a body ending at connection close),
+    CHUNK_ROWS records per chunk, each generated in the executor while
+    the previous one is sent, so the event loop keeps serving other
+    clients. GET / lists the endpoints.
+    """
+
+    def __init__(self, templates: Dict[str, BaseTemplate], reference_date: Optional[date] = None,
+                 executor: Optional[Executor] = None, chunk_rows: int = CHUNK_ROWS,
+                 max_page_size: int = MAX_PAGE_SIZE):
+        """
+        Args:
+            templates: Endpoint name -> template
+            reference_date: Default last day of the DATE range; fixed at startup
+                (today) so pages stay stable while the server runs
+            executor: Executor generating the chunks; a thread pool by default.
+                A ProcessPoolExecutor spreads generation over CPU cores
+            chunk_rows: Records per generated and transferred chunk
+            max_page_size: Largest accepted page size
+        """
+        self.templates = templates
+        self.reference_date = reference_date or date.today()
+        self.executor = executor
+        self.chunk_rows = chunk_rows
+        self.max_page_size = max_page_size
+        self._fields = {name: template.get_template() for name, template in templates.items()}
+        self._fingerprints = {name: template_fingerprint(fields) for name, fields in self._fields.items()}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._owns_executor = executor is None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """Start listening; port 0 picks a free port (see self.port)"""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(thread_name_prefix="mock-data")
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    async def __aenter__(self) -> "MockDataServer":
+        if self._server is None:
+            await self.start(port=0)
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        await self.close()
+
+    def endpoints(self) -> Dict[str, Any]:
+        return {
+            name: {
+                "name": template.get_name(),
+                "path": f"/{name}",
+                "fields": {field_name: field_def.field_type for field_name, field_def in self._fields[name].items()},
+            }
+            for name, template in self.templates.items()
+        }
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until the client closes it or asks to"""
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, target, version, headers = request
+                keep_alive = (version == "HTTP/1.1" and headers.get("connection", "").lower() != "close")
+                # No endpoint reads a body, but a leftover one would be parsed as the next request
+                if keep_alive and not await self._discard_body(reader, headers):
+                    keep_alive = False
+                try:
+                    if method != "GET":
+                        raise RequestError(405, f"{method} is not supported")
+                    await self._route(target, version, headers, writer, keep_alive)
+                except RequestError as exc:
+                    await self._send(writer, exc.status, "application/json",
+                                     json.dumps({"error": exc.message}).encode(), keep_alive)
+                except ResponseAborted:
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception as exc:
+                    # Nothing was sent yet (see ResponseAborted), so the failure can still be answered
+                    await self._send(writer, 500, "application/json",
+                                     json.dumps({"error": f"{type(exc).__name__}: {exc}"}).encode(), keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # The client went away; nothing left to answer
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader
+                            ) -> Optional[Tuple[str, str, str, Dict[str, str]]]:
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise ConnectionError("malformed request line")
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return method, target, version, headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        raise ConnectionError("too many request headers")
+
+    @staticmethod
+    async def _discard_body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> bool:
+        """Skip a request's Content-Length body; False if the connection cannot be reused"""
+        if "transfer-encoding" in headers:
+            return False
+        try:
+            remaining = int(headers.get("content-length", 0))
+        except ValueError:
+            return False
+        if not 0 <= remaining <= MAX_DISCARDED_BODY:
+            return False
+        if remaining:
+            await reader.readexactly(remaining)
+        return True
+
+    async def _route(self, target: str, version: str, headers: Dict[str, str],
+                     writer: asyncio.StreamWriter, keep_alive: bool) -> None:
+        url = urlsplit(target)
+        name = url.path.strip("/")
+        if not name:
+            await self._send(writer, 200, "application/json",
+                             json.dumps({"templates": self.endpoints()}).encode(), keep_alive)
+            return
+        if name not in self.templates:
+            raise RequestError(404, f"unknown template: {name}")
+        await self._stream_page(name, parse_qs(url.query), version, headers, writer, keep_alive)
+
+    def _format(self, query: Dict[str, List[str]], headers: Dict[str, str]) -> str:
+        fmt = query.get("format", [None])[-1]
+        if fmt is None:
+            fmt = CSV if "text/csv" in headers.get("accept", "") else NDJSON
+        if fmt not in CONTENT_TYPES:
+            raise RequestError(400, f"format must be one of {', '.join(CONTENT_TYPES)}")
+        return fmt
+
+    async def _stream_page(self, name: str, query: Dict[str, List[str]], version: str,
+                           headers: Dict[str, str], writer: asyncio.StreamWriter, keep_alive: bool) -> None:
+        seed = _int_param(query, "seed", 0, 0)
+        page = _int_param(query, "page", 0, 0)
+        size = _int_param(query, "size", DEFAULT_PAGE_SIZE, 1, self.max_page_size)
+        fmt = self._format(query, headers)
+        reference_date = self.reference_date
+        if "reference_date" in query:
+            try:
+                reference_date = date.fromisoformat(query["reference_date"][-1])
+            except ValueError:
+                raise RequestError(400, "reference_date must be YYYY-MM-DD")
+
+        loop = asyncio.get_running_loop()
+        fields = self._fields[name]
+        key = (self._fingerprints[name], seed, reference_date)
+        start, stop = await loop.run_in_executor(self.executor, page_bounds, key, fields, page, size)
+        if start >= stop:
+            raise RequestError(404, f"page {page} is past the end of the dataset ({max(stop, 0)} records)")
+
+        def submit(chunk_start: int) -> "asyncio.Future[bytes]":
+            return loop.run_in_executor(self.executor, render_chunk, key, fields, chunk_start,
+                                        min(chunk_start + self.chunk_rows, stop), fmt, chunk_start == start)
+
+        starts = range(start, stop, self.chunk_rows)
+        pending = submit(starts[0])
+        body = await pending  # Generation errors surface here, before the status line is sent
+
+        next_page = {"seed": seed, "page": page + 1, "size": size, "format": fmt}
+        if "reference_date" in query:
+            next_page["reference_date"] = reference_date.isoformat()
+        response_headers = {
+            "X-Seed": str(seed),
+            "X-Page": str(page),
+            "X-Page-Size": str(size),
+            "Link": f'</{name}?{urlencode(next_page)}>; rel="next"',
+        }
+        # HTTP/1.0 clients do not understand chunked framing: the body ends when the connection closes
+        chunked = version == "HTTP/1.1"
+        self._write_head(writer, 200, CONTENT_TYPES[fmt], keep_alive, response_headers, chunked=chunked)
+        write = partial(self._write_chunk, writer) if chunked else writer.write
+        try:
+            for chunk_start in starts[1:]:
+                # Generate the next chunk while this one drains to the client
+                pending = submit(chunk_start)
+                write(body)
+                await writer.drain()
+                body = await pending
+            write(body)
+            if chunked:
+                writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        except ConnectionError:
+            pending.cancel()
+            raise
+        except Exception as exc:
+            pending.cancel()
+            raise ResponseAborted(f"page {page} of /{name} failed after the response started") from exc
+
+    def _write_head(self, writer: asyncio.StreamWriter, status: int, content_type: str, keep_alive: bool,
+                    headers: Optional[Dict[str, str]] = None, length: Optional[int] = None,
+                    chunked: bool = False) -> None:
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}", f"Content-Type: {content_type}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if chunked:
+            lines.append("Transfer-Encoding: chunked")
+        elif length is not None:
+            lines.append(f"Content-Length: {length}")
+        lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+    @staticmethod
+    def _write_chunk(writer: asyncio.StreamWriter, data: bytes) -> None:
+        if data:
+            writer.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+
+    async def _send(self, writer: asyncio.StreamWriter, status: int, content_type: str, body: bytes,
+                    keep_alive: bool) -> None:
+        self._write_head(writer, status, content_type, keep_alive, length=len(body))
+        writer.write(body)
+        await writer.drain()
+
+def load_templates(schemas: Iterable[str]) -> Dict[str, BaseTemplate]:
+    """Built-in templates plus one endpoint per schema file, named after the file"""
+    templates: Dict[str, BaseTemplate] = {name: template_cls() for name, template_cls in TEMPLATES.items()}
+    for path in schemas:
+        templates[os.path.splitext(os.path.basename(path))[0].lower()] = SchemaTemplate.from_file(path)
+    return templates
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server",
+        description="Serve mock data over HTTP: one paged, streaming endpoint per template.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"interface to bind (default {DEFAULT_HOST})")
+    parser.add_argument("-p", "--port", type=int, default=DEFAULT_PORT, help=f"port (default {DEFAULT_PORT})")
+    parser.add_argument("-s", "--schema", action="append", default=[], metavar="PATH",
+                        help="JSON or YAML schema file to serve as /<file name>; repeatable")
+    parser.add_argument("--reference-date", type=date.fromisoformat, metavar="YYYY-MM-DD",
+                        help="last day of the DATE range; defaults to today")
+    parser.add_argument("-w", "--workers", type=int, default=0,
+                        help="generate in this many processes; 0 (the default) uses threads")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS,
+                        help="records per generated and transferred chunk")
+    parser.add_argument("--max-page-size", type=int, default=MAX_PAGE_SIZE,
+                        help="largest accepted page size")
+    return parser
+
+async def serve(args: argparse.Namespace) -> None:
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 0 else None
+    server = MockDataServer(load_templates(args.schema), args.reference_date, executor,
+                            args.chunk_rows, args.max_page_size)
+    await server.start(args.host, args.port)
+    print(f"Serving {', '.join('/' + name for name in server.templates)} "
+          f"on http://{args.host}:{server.port}", file=sys.stderr, flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+        if executor is not None:
+            executor.shutdown()
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.chunk_rows < 1 or args.max_page_size < 1 or args.workers < 0:
+        parser.error("--chunk-rows and --max-page-size must be positive, --workers non-negative")
+    try:
+        asyncio.run(serve(args))
+    except (SchemaError, OSError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
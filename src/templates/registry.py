@@ -0,0 +1,11 @@
+# src/templates/registry.py
+from typing import Dict, Type
+from .base_template import BaseTemplate
+from .financial_template import FinancialTemplate
+from .user_template import UserTemplate
+
+# Built-in templates by the name the CLI and the server expose them under
+TEMPLATES: Dict[str, Type[BaseTemplate]] = {
+    "user": UserTemplate,
+    "financial": FinancialTemplate,
+}
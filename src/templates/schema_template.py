@@ -0,0 +1,263 @@
+# src/templates/schema_template.py
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple, Union
+from .base_template import BaseTemplate
+from ..data_types.field_types import FieldDefinition, FieldTypes
+from ..generators.distributions import distribution_for, weighted_choices_for
+from ..generators.pattern import compile_pattern
+from ..generators.unique import check_unique_options
+
+try:
+    import yaml
+except ImportError:  # PyYAML is optional; only YAML schema files need it
+    yaml = None
+
+FIELD_TYPES = {
+    value for name, value in vars(FieldTypes).items() if not name.startswith("_")
+}
+FIELD_OPTIONS = ("min_value", "max_value", "choices", "pattern", "nullable", "unique",
+                 "references", "weights", "distribution", "distribution_params")
+
+YAML_EXTENSIONS = (".yaml", ".yml")
+NESTING_SEPARATOR = "."  # Nested fields are flattened to "parent.child" names
+CACHE_VERSION = 4  # Part of every cache key; bump when the cached form changes
+CACHE_DIR_ENV = "MOCK_DATA_SCHEMA_CACHE"
+
+class SchemaError(ValueError):
+    """Raised when a schema file does not describe a valid template"""
+
+def default_cache_dir() -> str:
+    """$MOCK_DATA_SCHEMA_CACHE, else <user cache dir>/mock-data-generator/schemas"""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return configured
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "mock-data-generator", "schemas")
+
+def field_from_dict(name: str, spec: Dict[str, Any]) -> FieldDefinition:
+    """
+    Build a FieldDefinition from its schema entry.
+
+    The type may be given as "type" or "field_type", by value ("integer")
+    or by FieldTypes attribute name ("INTEGER").
+    """
+    if not isinstance(spec, dict):
+        raise SchemaError(f"field '{name}' must be an object")
+    field_type = spec.get("field_type", spec.get("type"))
+    if not isinstance(field_type, str):
+        raise SchemaError(f"field '{name}' has no type")
+    field_type = field_type.lower()
+    if field_type not in FIELD_TYPES:
+        raise SchemaError(f"field '{name}' has unknown type '{field_type}'")
+    unknown = set(spec) - set(FIELD_OPTIONS) - {"name", "type", "field_type"}
+    if unknown:
+        raise SchemaError(f"field '{name}' has unknown options: {', '.join(sorted(unknown))}")
+    field_def = FieldDefinition(name=name, field_type=field_type,
+                                **{option: spec[option] for option in FIELD_OPTIONS if option in spec})
+    validate_field(field_def)
+    return field_def
+
+def _is_number(value: Any) -> bool:
+    """int or float, but not bool"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def validate_field(field_def: FieldDefinition) -> None:
+    """
+    Check that a field can be generated, compiling its pattern, weights and distribution.
+
+    The compiled forms are cached per process, so generation reuses them.
+    """
+    name = field_def.name
+    for option in ("nullable", "unique"):
+        if not isinstance(getattr(field_def, option), bool):
+            raise SchemaError(f"field '{name}' {option} must be true or false")
+    for option in ("min_value", "max_value"):
+        value = getattr(field_def, option)
+        if value is not None and not _is_number(value):
+            raise SchemaError(f"field '{name}' {option} must be a number")
+    params = field_def.distribution_params
+    if params is not None and (not isinstance(params, dict) or not all(map(_is_number, params.values()))):
+        raise SchemaError(f"field '{name}' distribution_params must map names to numbers")
+    if field_def.choices is not None and field_def.field_type != FieldTypes.STRING:
+        raise SchemaError(f"field '{name}' is {field_def.field_type}; choices apply to string fields")
+    if field_def.weights is not None and (not isinstance(field_def.weights, list)
+                                          or not all(map(_is_number, field_def.weights))):
+        raise SchemaError(f"field '{name}' weights must be a list of numbers")
+    if field_def.choices is not None and (not isinstance(field_def.choices, list) or not field_def.choices):
+        raise SchemaError(f"field '{name}' choices must be a non-empty list")
+    if field_def.weights is not None and field_def.choices is None:
+        raise SchemaError(f"field '{name}' has weights but no choices")
+    try:
+        if (field_def.min_value is not None and field_def.max_value is not None
+                and field_def.min_value > field_def.max_value):
+            raise ValueError("min_value is greater than max_value")
+        if field_def.pattern is not None:
+            compile_pattern(field_def.pattern)
+        weighted_choices_for(field_def)
+        distribution_for(field_def)
+        check_unique_options(name, field_def)
+    except (ValueError, TypeError) as exc:
+        raise SchemaError(f"field '{name}': {exc}") from exc
+
+def _is_group(spec: Any) -> bool:
+    """A nested group is an entry with its own "fields" and no scalar type"""
+    return isinstance(spec, dict) and "fields" in spec and spec.get("type", spec.get("field_type", "object")) == "object"
+
+def _entries(entries: Any, where: str) -> List[Tuple[str, Any]]:
+    """(name, spec) pairs of a mapping- or list-style "fields" entry"""
+    if isinstance(entries, list):
+        pairs = []
+        for entry in entries:
+            if not isinstance(entry, dict) or "name" not in entry:
+                raise SchemaError("list-style fields need a 'name' on every entry")
+            pairs.append((entry["name"], entry))
+        return pairs
+    elif isinstance(entries, dict):
+        return list(entries.items())
+    raise SchemaError(f"'fields' of {where} must be an object or a list")
+
+def flatten_fields(entries: Any, prefix: str = "") -> List[Tuple[str, Any]]:
+    """
+    Flatten nested groups into (dotted name, field spec) pairs, in schema order.
+
+    A group is an entry with "fields" (and optionally "type": "object");
+    its fields are named "<group>.<field>", to any depth.
+    """
+    pairs = []
+    for field_name, spec in _entries(entries, f"'{prefix[:-1]}'" if prefix else "the schema"):
+        full_name = f"{prefix}{field_name}"
+        if _is_group(spec):
+            unknown = set(spec) - {"name", "type", "field_type", "fields"}
+            if unknown:
+                raise SchemaError(f"group '{full_name}' has unknown options: {', '.join(sorted(unknown))}")
+            nested = flatten_fields(spec["fields"], full_name + NESTING_SEPARATOR)
+            if not nested:
+                raise SchemaError(f"group '{full_name}' defines no fields")
+            pairs.extend(nested)
+        else:
+            pairs.append((full_name, spec))
+    return pairs
+
+def parse_schema(text: str, path: str) -> Any:
+    """Parse schema text as YAML for .yaml/.yml paths, otherwise as JSON"""
+    if path.lower().endswith(YAML_EXTENSIONS):
+        if yaml is None:
+            raise SchemaError(f"{path}: YAML schemas require PyYAML (pip install pyyaml)")
+        try:
+            # The C loader, when built, parses large schemas several times faster
+            return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        except yaml.YAMLError as exc:
+            raise SchemaError(f"{path}: {exc}") from exc
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise SchemaError(f"{path}: {exc}") from exc
+
+class SchemaTemplate(BaseTemplate):
+    """
+    Template defined by data instead of code.
+
+    A schema is {"name": ..., "fields": ...} where fields is either a
+    mapping of field name to options or a list of objects with a "name" key.
+    Entries with their own "fields" are nested groups, flattened to dotted
+    field names ("address.city").
+    """
+
+    def __init__(self, fields: Dict[str, FieldDefinition], name: str = "Schema"):
+        self.fields = fields
+        self.name = name
+
+    @classmethod
+    def from_dict(cls, schema: Dict[str, Any], default_name: str = "Schema") -> "SchemaTemplate":
+        """Validate a parsed schema and build the template"""
+        if not isinstance(schema, dict) or "fields" not in schema:
+            raise SchemaError("schema must be an object with a 'fields' entry")
+        pairs = flatten_fields(schema["fields"])
+        if not pairs:
+            raise SchemaError("schema defines no fields")
+
+        fields: Dict[str, FieldDefinition] = {}
+        for field_name, spec in pairs:
+            if field_name in fields:
+                raise SchemaError(f"duplicate field '{field_name}'")
+            fields[field_name] = field_from_dict(field_name, spec)
+        return cls(fields, schema.get("name", default_name))
+
+    @classmethod
+    def from_file(cls, path: str, cache_dir: Union[str, bool, None] = None) -> "SchemaTemplate":
+        """
+        Load a JSON or YAML (.yaml/.yml) schema file.
+
+        The validated, flattened fields are stored as JSON in cache_dir under
+        the SHA-256 of the file's content, so loading an unchanged file again
+        skips parsing and validation. Entries are plain data, never pickles, so
+        a writable (e.g. shared) cache directory cannot run code; a tampered
+        entry can at worst describe a different template. cache_dir defaults
+        to default_cache_dir(); pass False to disable the cache. Cache entries
+        that cannot be read or written are ignored.
+        """
+        with open(path, "rb") as f:
+            content = f.read()
+        default_name = os.path.splitext(os.path.basename(path))[0]
+        cache_path = None
+        if cache_dir is not False:
+            # The file name picks the parser and the default template name, so it is part of the key
+            digest = hashlib.sha256(f"{CACHE_VERSION}:{os.path.basename(path)}:".encode() + content).hexdigest()
+            cache_path = os.path.join(cache_dir or default_cache_dir(), f"{digest}.json")
+            cached = _read_cache(cache_path)
+            if cached is not None:
+                return cached
+
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            raise SchemaError(f"{path}: {exc}") from exc
+        template = cls.from_dict(parse_schema(text, path), default_name)
+        if cache_path is not None:
+            _write_cache(cache_path, template)
+        return template
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_template(self) -> Dict[str, FieldDefinition]:
+        return dict(self.fields)
+
+CACHED_ATTRIBUTES = ("field_type",) + FIELD_OPTIONS
+
+def _read_cache(cache_path: str) -> Optional[SchemaTemplate]:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            entry = json.load(f)
+        fields = {field_name: FieldDefinition(name=field_name, **spec) for field_name, spec in entry["fields"]}
+        name = entry["name"]
+    except Exception:  # Missing, truncated or stale entries are rebuilt
+        return None
+    return SchemaTemplate(fields, name) if isinstance(name, str) else None
+
+def _write_cache(cache_path: str, template: SchemaTemplate) -> None:
+    """Write atomically, so concurrent jobs never read a partial entry"""
+    try:
+        payload = json.dumps({
+            "name": template.name,
+            "fields": [[field_name, {attribute: getattr(field_def, attribute) for attribute in CACHED_ATTRIBUTES}]
+                       for field_name, field_def in template.fields.items()],
+        })
+    except (TypeError, ValueError):
+        return  # Values JSON cannot hold (e.g. YAML dates among the choices) are not cached
+    directory = os.path.dirname(cache_path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        pass  # A read-only or full cache directory only costs the speed-up
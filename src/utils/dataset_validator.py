@@ -0,0 +1,439 @@
+# src/utils/dataset_validator.py
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from itertools import islice, zip_longest
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from ..data_types.constraints import compiled_regex
+from ..data_types.field_types import DATE_RANGE_DAYS, FieldDefinition, FieldTypes
+from ..generators.compression import open_input, strip_compression_extension
+from .validators import EMAIL_PATTERN
+
+# Violation rules, in the order they are checked
+MISSING = "missing"    # Column absent from the file
+NULL = "null"          # Null in a non-nullable field
+TYPE = "type"          # Value of the wrong type, or text that does not parse as it
+RANGE = "range"        # Number or date outside its bounds
+CHOICES = "choices"    # Value not among the field's choices
+PATTERN = "pattern"    # String not fully matching the field's pattern
+EMAIL = "email"        # Malformed email address
+UNIQUE = "unique"      # Repeated value in a unique field
+
+DEFAULT_CHUNK_SIZE = 100000
+DEFAULT_MAX_SAMPLES = 20
+
+Columns = Dict[str, List[Any]]
+
+_BOOLEAN_TEXT = {"True": True, "False": False, "true": True, "false": False, "1": True, "0": False}
+
+# Python types accepted as-is, and the parser for text values (CSV cells, JSON date strings)
+NATIVE_TYPES = {
+    FieldTypes.INTEGER: frozenset([int]),
+    FieldTypes.FLOAT: frozenset([float, int]),
+    FieldTypes.BOOLEAN: frozenset([bool]),
+    FieldTypes.DATE: frozenset([date]),
+}
+TEXT_PARSERS: Dict[str, Callable[[str], Any]] = {
+    FieldTypes.INTEGER: int,
+    FieldTypes.FLOAT: float,
+    FieldTypes.BOOLEAN: _BOOLEAN_TEXT.__getitem__,
+    FieldTypes.DATE: date.fromisoformat,
+}
+PARSE_ERRORS = (ValueError, TypeError, KeyError)
+
+@dataclass
+class Violation:
+    """One offending value; row is the zero-based record index in the dataset"""
+    field: str
+    rule: str
+    row: int
+    value: Any
+
+@dataclass
+class ValidationReport:
+    """Violation counts per field and rule, with the first few offending values"""
+    rows: int = 0
+    counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    samples: List[Violation] = field(default_factory=list)
+    max_samples: int = DEFAULT_MAX_SAMPLES
+    seconds: float = 0.0
+
+    @property
+    def valid(self) -> bool:
+        return not self.counts
+
+    @property
+    def violations(self) -> int:
+        return sum(sum(rules.values()) for rules in self.counts.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def add(self, field_name: str, rule: str, row: int, value: Any, count: int = 1) -> None:
+        rules = self.counts.setdefault(field_name, {})
+        rules[rule] = rules.get(rule, 0) + count
+        if len(self.samples) < self.max_samples:
+            self.samples.append(Violation(field_name, rule, row, value))
+
+    def merge(self, other: "ValidationReport") -> None:
+        """Fold a later chunk's report into this one"""
+        self.rows += other.rows
+        for field_name, rules in other.counts.items():
+            totals = self.counts.setdefault(field_name, {})
+            for rule, count in rules.items():
+                totals[rule] = totals.get(rule, 0) + count
+        self.samples.extend(other.samples[:max(0, self.max_samples - len(self.samples))])
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain-data snapshot for logging or display"""
+        return {
+            "rows": self.rows,
+            "valid": self.valid,
+            "violations": self.violations,
+            "counts": self.counts,
+            "samples": [vars(sample) for sample in self.samples],
+            "seconds": self.seconds,
+        }
+
+    def summary(self) -> str:
+        """Human-readable report"""
+        lines = [f"{self.rows:,} rows, {self.violations:,} violations"]
+        for field_name, rules in self.counts.items():
+            lines.append(f"  {field_name}: " + ", ".join(f"{rule} {count:,}" for rule, count in rules.items()))
+        for sample in self.samples:
+            lines.append(f"  row {sample.row}: {sample.field} {sample.rule} {sample.value!r}")
+        return "\n".join(lines)
+
+class FieldCheck:
+    """
+    Compiled checks for one field.
+
+    check_column() first runs whole-column tests that stay in C (type sets,
+    min()/max(), frozenset inclusion, map() over a compiled regex) and only
+    walks the values one by one when a test fails, to locate the violations.
+    """
+    __slots__ = ("name", "nullable", "unique", "native_types", "parse", "column_rules", "value_rules")
+
+    def __init__(self, name: str, field_def: FieldDefinition, reference_date: Optional[date] = None):
+        self.name = name
+        self.nullable = field_def.nullable
+        self.unique = field_def.unique
+        field_type = field_def.field_type
+        self.native_types = NATIVE_TYPES.get(field_type, frozenset([str]))
+        self.parse = TEXT_PARSERS.get(field_type)
+        # (rule, all-values test on a list, single-value test)
+        rules: List[Tuple[str, Callable[[List[Any]], bool], Callable[[Any], bool]]] = []
+
+        low, high = self._bounds(field_def, reference_date)
+        if low is not None:
+            rules.append((RANGE, lambda values: not values or (low <= min(values) and max(values) <= high),
+                          lambda value: low <= value <= high))
+        if field_def.choices:
+            choices = frozenset(field_def.choices)
+            rules.append((CHOICES, lambda values: choices.issuperset(values), choices.__contains__))
+        elif field_type == FieldTypes.STRING and field_def.pattern:
+            fullmatch = compiled_regex(field_def.pattern).fullmatch
+            rules.append((PATTERN, lambda values: all(map(fullmatch, values)),
+                          lambda value: fullmatch(value) is not None))
+        if field_type == FieldTypes.EMAIL:
+            match = compiled_regex(EMAIL_PATTERN).match
+            rules.append((EMAIL, lambda values: all(map(match, values)),
+                          lambda value: match(value) is not None))
+        self.column_rules = tuple((rule, column_ok) for rule, column_ok, _ in rules)
+        self.value_rules = tuple((rule, value_ok) for rule, _, value_ok in rules)
+
+    @staticmethod
+    def _bounds(field_def: FieldDefinition, reference_date: Optional[date]) -> Tuple[Any, Any]:
+        """Bounds as the generator resolves them (see compile_value()); (None, None) when unchecked"""
+        field_type = field_def.field_type
+        if field_type == FieldTypes.INTEGER:
+            return (field_def.min_value if field_def.min_value is not None else 0,
+                    field_def.max_value if field_def.max_value is not None else 1000)
+        elif field_type == FieldTypes.FLOAT:
+            return (float(field_def.min_value if field_def.min_value is not None else 0),
+                    float(field_def.max_value if field_def.max_value is not None else 1000))
+        elif field_type == FieldTypes.DATE and reference_date is not None:
+            return reference_date - timedelta(days=DATE_RANGE_DAYS), reference_date
+        return None, None
+
+    def _coerce_column(self, values: List[Any]) -> Optional[List[Any]]:
+        """Values in their native type, or None if any value is of the wrong type or unparsable"""
+        types = set(map(type, values))
+        if types <= self.native_types:
+            return values
+        if self.parse is not None and types <= {str}:
+            try:
+                return list(map(self.parse, values))
+            except PARSE_ERRORS:
+                return None
+        return None
+
+    def check_column(self, values: List[Any], offset: int, report: ValidationReport,
+                     empty_is_null: bool = False, rows: Optional[Sequence[int]] = None) -> List[Any]:
+        """
+        Report the violations in one column chunk.
+
+        Args:
+            values: Column values of rows offset..offset+len(values)-1
+            offset: Dataset index of the first value
+            report: Report receiving the violations
+            empty_is_null: Treat "" as null (CSV input)
+            rows: Dataset indices of the values, when they are not consecutive
+
+        Returns:
+            The valid-typed, non-null values in their native type (for uniqueness checks)
+        """
+        present = values
+        has_nulls = None in values or (empty_is_null and "" in values)
+        if has_nulls and self.nullable:
+            present = [value for value in values if value is not None and not (empty_is_null and value == "")]
+        if not has_nulls or self.nullable:
+            coerced = self._coerce_column(present)
+            if coerced is not None and all(column_ok(coerced) for _, column_ok in self.column_rules):
+                return coerced
+        return self._check_values(values, offset, report, empty_is_null, rows)
+
+    def _check_values(self, values: List[Any], offset: int, report: ValidationReport,
+                      empty_is_null: bool, rows: Optional[Sequence[int]] = None) -> List[Any]:
+        """Slow path: test value by value, reporting each violation"""
+        name, native_types, parse, value_rules = self.name, self.native_types, self.parse, self.value_rules
+        coerced = []
+        for row, value in zip(rows, values) if rows is not None else enumerate(values, offset):
+            if value is None or (empty_is_null and value == ""):
+                if not self.nullable:
+                    report.add(name, NULL, row, value)
+                continue
+            if type(value) in native_types:
+                native = value
+            elif parse is not None and type(value) is str:
+                try:
+                    native = parse(value)
+                except PARSE_ERRORS:
+                    report.add(name, TYPE, row, value)
+                    continue
+            else:
+                report.add(name, TYPE, row, value)
+                continue
+            for rule, value_ok in value_rules:
+                if not value_ok(native):
+                    report.add(name, rule, row, value)
+            coerced.append(native)
+        return coerced
+
+def _count_duplicates(values: Iterable[Any], seen: set) -> int:
+    """Add values to seen and return how many were already there (or repeated among values)"""
+    before = len(seen)
+    seen.update(values)
+    return len(values) - (len(seen) - before)
+
+def _check_chunk(checks: Sequence[FieldCheck], columns: Columns, offset: int, rows: int,
+                 max_samples: int, empty_is_null: bool, absent: Optional[Dict[str, List[int]]] = None
+                 ) -> Tuple[ValidationReport, Dict[str, set]]:
+    """
+    Validate one chunk; returns its report and the distinct values of each unique field.
+
+    absent maps a field to the chunk rows that lack it (JSON records without
+    the key); its column then holds the values of the other rows only.
+    """
+    report = ValidationReport(rows=rows, max_samples=max_samples)
+    uniques = {}
+    for check in checks:
+        values = columns.get(check.name)
+        if values is None:
+            report.add(check.name, MISSING, offset, None, rows)
+            continue
+        value_rows = None
+        if absent and check.name in absent:
+            skipped = set(absent[check.name])
+            for row in absent[check.name]:
+                report.add(check.name, MISSING, offset + row, None)
+            value_rows = [offset + row for row in range(rows) if row not in skipped]
+        present = check.check_column(values, offset, report, empty_is_null, value_rows)
+        if check.unique:
+            distinct = uniques[check.name] = set()
+            duplicates = _count_duplicates(present, distinct)
+            if duplicates:
+                report.add(check.name, UNIQUE, offset, None, duplicates)
+    return report, uniques
+
+def compile_checks(template: Dict[str, FieldDefinition], reference_date: Optional[date] = None
+                   ) -> Tuple[FieldCheck, ...]:
+    """One FieldCheck per template field"""
+    return tuple(FieldCheck(field_name, field_def, reference_date) for field_name, field_def in template.items())
+
+def _check_text_lines(checks: Sequence[FieldCheck], header: Optional[List[str]], lines: List[Any],
+                      offset: int, max_samples: int) -> Tuple[ValidationReport, Dict[str, set]]:
+    """Parse CSV rows (with header) or JSON lines (without) and validate them"""
+    if header is not None:
+        columns = dict(zip(header, map(list, zip_longest(*lines)))) if lines else {name: [] for name in header}
+        return _check_chunk(checks, columns, offset, len(lines), max_samples, empty_is_null=True)
+    records = [json.loads(line) for line in lines]
+    names = frozenset(check.name for check in checks)
+    absent: Dict[str, List[int]] = {}
+    if not all(names <= record.keys() for record in records):
+        for row, record in enumerate(records):
+            for name in names - record.keys():
+                absent.setdefault(name, []).append(row)
+    columns = {name: [record[name] for record in records if name in record] if name in absent
+               else [record[name] for record in records] for name in names}
+    return _check_chunk(checks, columns, offset, len(records), max_samples, empty_is_null=False,
+                        absent=absent)
+
+def _check_text_chunk(template: Dict[str, FieldDefinition], reference_date: Optional[date],
+                      header: Optional[List[str]], lines: List[Any], offset: int,
+                      max_samples: int) -> Tuple[ValidationReport, Dict[str, set]]:
+    """
+    Worker entry point for _check_text_lines().
+
+    Checks hold closures, which do not pickle, so each worker call compiles its own from the template.
+    """
+    return _check_text_lines(compile_checks(template, reference_date), header, lines, offset, max_samples)
+
+def _chunks(items: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _with_offsets(chunks: Iterable[List[Any]]) -> Iterator[Tuple[List[Any], int]]:
+    """Pair each chunk with the dataset index of its first row"""
+    offset = 0
+    for chunk in chunks:
+        yield chunk, offset
+        offset += len(chunk)
+
+class DatasetValidator:
+    """
+    Validate whole datasets against a template.
+
+    The template is compiled once into FieldChecks: compiled regexes,
+    frozenset choices and resolved numeric bounds. Data is validated a
+    column chunk at a time; files can be split across worker processes.
+    Uniqueness is checked across the whole dataset. Every validate_*()
+    call starts a fresh report.
+    """
+
+    def __init__(self, template: Dict[str, FieldDefinition], reference_date: Optional[date] = None,
+                 max_samples: int = DEFAULT_MAX_SAMPLES, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            template: Dictionary defining the data structure and constraints
+            reference_date: Last day of the generated DATE range; when given, dates must
+                fall in the year up to it
+            max_samples: Offending values kept in the report
+            chunk_size: Records validated per chunk
+        """
+        self.template = template
+        self.reference_date = reference_date
+        self.max_samples = max_samples
+        self.chunk_size = chunk_size
+        self.checks = compile_checks(template, reference_date)
+
+    def _new_report(self) -> ValidationReport:
+        return ValidationReport(max_samples=self.max_samples)
+
+    def _merge(self, report: ValidationReport, chunk_report: ValidationReport,
+               uniques: Dict[str, set], seen: Dict[str, set], offset: int) -> None:
+        report.merge(chunk_report)
+        for field_name, distinct in uniques.items():
+            duplicates = _count_duplicates(distinct, seen.setdefault(field_name, set()))
+            if duplicates:
+                report.add(field_name, UNIQUE, offset, None, duplicates)
+
+    def _validate_column_chunks(self, chunks: Iterable[Tuple[Columns, int]],
+                                empty_is_null: bool = False) -> ValidationReport:
+        report, seen = self._new_report(), {}
+        start = time.perf_counter()
+        offset = 0
+        for columns, rows in chunks:
+            chunk_report, uniques = _check_chunk(self.checks, columns, offset, rows,
+                                                 self.max_samples, empty_is_null)
+            self._merge(report, chunk_report, uniques, seen, offset)
+            offset += rows
+        report.seconds = time.perf_counter() - start
+        return report
+
+    def validate_columns(self, columns: Columns) -> ValidationReport:
+        """Validate one column batch (field name -> values)"""
+        rows = len(next(iter(columns.values()), ()))
+        return self._validate_column_chunks([(columns, rows)])
+
+    def validate_column_batches(self, batches: Iterable[Columns]) -> ValidationReport:
+        """Validate a stream of column batches, e.g. ColumnarPlan.iter_columns()"""
+        return self._validate_column_chunks((columns, len(next(iter(columns.values()), ())))
+                                            for columns in batches)
+
+    def validate_records(self, records: Iterable[Dict[str, Any]]) -> ValidationReport:
+        """Validate records from any iterable, chunk_size records at a time"""
+        field_names = list(self.template)
+
+        def column_chunks():
+            for chunk in _chunks(iter(records), self.chunk_size):
+                yield {field_name: [record.get(field_name) for record in chunk]
+                       for field_name in field_names}, len(chunk)
+        return self._validate_column_chunks(column_chunks())
+
+    def validate_file(self, filepath: str, workers: int = 1) -> ValidationReport:
+        """
+        Validate a CSV or JSON Lines file (optionally .gz/.bz2/.xz compressed).
+
+        The file is read in chunk_size-row chunks; with workers > 1 the
+        chunks are parsed and checked in a process pool while the next
+        ones are read. CSV cells are parsed to the field types and empty
+        cells count as nulls.
+
+        Args:
+            filepath: .csv, .jsonl or .ndjson path
+            workers: Worker processes; 1 validates in-process
+
+        Returns:
+            Aggregate report over the whole file
+        """
+        inner = strip_compression_extension(filepath).lower()
+        is_csv = inner.endswith(".csv")
+        if not is_csv and not inner.endswith((".jsonl", ".ndjson")):
+            raise ValueError(f"cannot validate {os.path.basename(filepath)}: expected CSV or JSON Lines")
+
+        report, seen = self._new_report(), {}
+        start = time.perf_counter()
+        with open_input(filepath, newline="" if is_csv else None) as f:
+            if is_csv:
+                reader = csv.reader(f)
+                header: Optional[List[str]] = next(reader, None) or []
+                lines: Iterator[Any] = reader
+            else:
+                header = None
+                lines = (line for line in f if line.strip())
+            chunks = _chunks(lines, self.chunk_size)
+            if workers <= 1:
+                results = (_check_text_lines(self.checks, header, chunk, offset, self.max_samples)
+                           for chunk, offset in _with_offsets(chunks))
+                self._merge_results(report, seen, results)
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    self._merge_results(report, seen, self._map_ordered(pool, header, chunks, workers))
+        report.seconds = time.perf_counter() - start
+        return report
+
+    def _map_ordered(self, pool: ProcessPoolExecutor, header: Optional[List[str]],
+                     chunks: Iterator[List[Any]], workers: int) -> Iterator[Tuple[ValidationReport, Dict[str, set]]]:
+        """Submit chunks with their offsets, keeping at most 2 * workers in flight, and yield results in order"""
+        pending = []
+        for chunk, offset in _with_offsets(chunks):
+            pending.append(pool.submit(_check_text_chunk, self.template, self.reference_date, header,
+                                       chunk, offset, self.max_samples))
+            if len(pending) >= 2 * workers:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+    def _merge_results(self, report: ValidationReport, seen: Dict[str, set],
+                       results: Iterable[Tuple[ValidationReport, Dict[str, set]]]) -> None:
+        for chunk_report, uniques in results:
+            self._merge(report, chunk_report, uniques, seen, report.rows)
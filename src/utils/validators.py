@@ -1,7 +1,9 @@
 # src/utils/validators.py
-import re
 from typing import Any, Optional
-from ..data_types.field_types import FieldDefinition
+from ..data_types.constraints import compiled_regex
+from ..data_types.field_types import FieldDefinition, FieldTypes
+
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 
 class FieldValidator:
     """Validator for field values"""
@@ -10,7 +12,7 @@ class FieldValidator:
     def validate_string(value: str, field_def: FieldDefinition) -> bool:
         """Validate string fields"""
         if field_def.pattern:
-            return bool(re.match(field_def.pattern, value))
+            return bool(compiled_regex(field_def.pattern).match(value))
         return True
     
     @staticmethod
@@ -25,8 +27,7 @@ class FieldValidator:
     @staticmethod
     def validate_email(value: str) -> bool:
         """Validate email format"""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, value))
+        return bool(compiled_regex(EMAIL_PATTERN).match(value))
     
     @staticmethod
     def validate_field(value: Any, field_def: FieldDefinition) -> bool:
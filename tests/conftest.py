@@ -8,6 +8,12 @@ from src.templates.user_template import UserTemplate
 from src.templates.financial_template import FinancialTemplate
 from src.data_types.field_types import FieldDefinition, FieldTypes
 
+@pytest.fixture(autouse=True)
+def schema_cache(tmp_path, monkeypatch):
+    """Keep compiled schema cache entries out of the user's cache directory"""
+    monkeypatch.setenv("MOCK_DATA_SCHEMA_CACHE", str(tmp_path / "schema-cache"))
+    return tmp_path / "schema-cache"
+
 @pytest.fixture
 def basic_template() -> Dict[str, FieldDefinition]:
     """Fixture providing a basic template for testing"""
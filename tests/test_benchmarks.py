@@ -0,0 +1,36 @@
+import pytest
+from benchmarks.suite import Result, compare, fit_unique_domains, load_results, run_suite, save_results
+from src.generators.unique import domain_size
+
+def test_run_suite_covers_every_group(tmp_path):
+    """Test a tiny suite run and its baseline round trip"""
+    results = run_suite(sizes=[20], repeat=1)
+    groups = {result.group for result in results}
+
+    assert groups == {"field", "template", "exporter"}
+    assert all(result.rows_per_second > 0 and result.peak_bytes > 0 for result in results)
+
+    path = str(tmp_path / "baseline.json")
+    save_results(results, path)
+    assert load_results(path) == results
+
+def test_compare_flags_slowdowns_and_memory_growth():
+    """Test the regression check against a baseline"""
+    baseline = [Result("field:integer", "field", 1000, 1000.0, 100),
+                Result("field:float", "field", 1000, 1000.0, 100)]
+    current = [Result("field:integer", "field", 1000, 800.0, 100),
+               Result("field:float", "field", 1000, 900.0, 200),
+               Result("field:date", "field", 1000, 1.0, 100)]
+
+    regressions = compare(current, baseline, threshold=0.15)
+
+    assert [(regression.name, regression.metric) for regression in regressions] == [
+        ("field:integer", "rows/s"), ("field:float", "peak bytes")]
+    assert regressions[0].change == pytest.approx(-0.2)
+
+def test_fit_unique_domains(user_template):
+    """Test that unique integer ranges are widened only when too small"""
+    template = user_template.get_template()
+
+    assert fit_unique_domains(template, 100)["id"] == template["id"]
+    assert domain_size(fit_unique_domains(template, 50000)["id"]) == 50000
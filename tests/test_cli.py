@@ -0,0 +1,145 @@
+import csv
+import gzip
+import json
+import sqlite3
+import pytest
+from src.cli import Progress, main, resolve_format
+
+def test_cli_writes_csv_to_stdout(capsys):
+    """Test streaming a built-in template to stdout"""
+    assert main(["--template", "user", "--count", "25", "--seed", "1", "--quiet"]) == 0
+
+    rows = list(csv.DictReader(capsys.readouterr().out.splitlines()))
+    assert len(rows) == 25
+    assert set(rows[0]) == set(["id", "username", "email", "first_name", "last_name",
+                                "date_joined", "is_active"])
+
+def test_cli_output_independent_of_workers(tmp_path):
+    """Test that the seed, not the worker count, determines the output"""
+    outputs = []
+    for workers in ("1", "2"):
+        path = tmp_path / f"out-{workers}.jsonl"
+        assert main(["-t", "financial", "-n", "120", "--seed", "7", "-w", workers,
+                     "--shard-size", "50", "--reference-date", "2024-01-31",
+                     "-q", "-o", str(path)]) == 0
+        outputs.append(path.read_bytes())
+
+    assert outputs[0] == outputs[1]
+    assert len([json.loads(line) for line in outputs[0].decode().splitlines()]) == 120
+
+def test_cli_reports_summary(tmp_path, capsys):
+    """Test the throughput summary on stderr"""
+    path = tmp_path / "users.xml"
+    assert main(["-t", "user", "-n", "10", "--seed", "3", "-o", str(path)]) == 0
+
+    assert "Wrote 10 User Data records as xml" in capsys.readouterr().err
+    assert path.read_text().count("<record>") == 10
+
+def test_cli_compressed_output(tmp_path, capsys):
+    """Test gzip output selected by extension, with the ratio in the summary"""
+    path = tmp_path / "transactions.jsonl.gz"
+    assert main(["-t", "financial", "-n", "200", "--seed", "3", "--compression-level", "9",
+                 "-o", str(path)]) == 0
+
+    assert "ratio" in capsys.readouterr().err
+    with gzip.open(path, "rt") as f:
+        assert len([json.loads(line) for line in f]) == 200
+
+def test_cli_sqlite_output(tmp_path):
+    """Test loading a template into a SQLite table named after it"""
+    path = tmp_path / "fixtures.db"
+    assert main(["-t", "user", "-n", "300", "--seed", "3", "-q", "-o", str(path)]) == 0
+
+    connection = sqlite3.connect(str(path))
+    try:
+        assert connection.execute("SELECT COUNT(DISTINCT id) FROM user_data").fetchone() == (300,)
+    finally:
+        connection.close()
+
+def test_cli_schema_file(tmp_path, capsys):
+    """Test generating from a JSON schema file"""
+    schema = tmp_path / "orders.json"
+    schema.write_text(json.dumps({
+        "name": "Orders",
+        "fields": {
+            "order_id": {"type": "integer", "min_value": 1, "max_value": 100000, "unique": True},
+            "status": {"type": "string", "choices": ["open", "closed"]},
+            "total": {"type": "FLOAT", "min_value": 1, "max_value": 50},
+        },
+    }))
+
+    assert main(["--schema", str(schema), "-n", "50", "-f", "jsonl", "--seed", "1", "-q"]) == 0
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len({record["order_id"] for record in records}) == 50
+    assert all(record["status"] in ("open", "closed") for record in records)
+
+def test_cli_fails_before_writing_when_unique_domain_too_small(tmp_path, capsys):
+    """Test that an impossible unique count is reported without creating the output"""
+    path = tmp_path / "users.csv"
+
+    assert main(["-t", "user", "-n", "9001", "-q", "-o", str(path)]) == 1
+    assert "9000" in capsys.readouterr().err
+    assert not path.exists()
+
+def test_resolve_format():
+    """Test format inference from the output path"""
+    assert resolve_format("data.ndjson", None) == "jsonl"
+    assert resolve_format("data.xml", None) == "xml"
+    assert resolve_format("-", None) == "csv"
+    assert resolve_format("data.xml", "json") == "json"
+    assert resolve_format("data.jsonl.gz", None) == "jsonl"
+    assert resolve_format("fixtures.sqlite3", None) == "sqlite"
+
+def test_progress_reports_on_interval():
+    """Test that progress lines are throttled by the clock"""
+    class Stream:
+        def __init__(self):
+            self.lines = []
+
+        def write(self, text):
+            self.lines.append(text)
+
+        def flush(self):
+            pass
+
+    now = [0.0]
+    stream = Stream()
+    progress = Progress(30, stream, interval=5.0, clock=lambda: now[0])
+    records = progress.track(iter([[{}] * 10, [{}] * 10, [{}] * 10]))
+    for index, _ in enumerate(records):
+        now[0] = index
+
+    assert progress.records == 30
+    assert any("20/30 records" in line for line in stream.lines)
+
+def test_cli_fixed_width_output(tmp_path):
+    """Test that padded CSV is written in place and read back with skipinitialspace"""
+    paths = []
+    for workers in ("1", "2"):
+        path = tmp_path / f"transactions-{workers}.csv"
+        assert main(["-t", "financial", "-n", "130", "--seed", "5", "-w", workers, "--shard-size", "40",
+                     "-f", "fixed-csv", "--reference-date", "2024-01-31", "-q", "-o", str(path)]) == 0
+        paths.append(path)
+
+    assert paths[0].read_bytes() == paths[1].read_bytes()
+    lines = paths[0].read_bytes().splitlines()
+    assert len({len(line) for line in lines}) == 1
+    with open(paths[0], newline="") as f:
+        assert len(list(csv.DictReader(f, skipinitialspace=True))) == 130
+
+def test_cli_fixed_width_needs_bounded_fields(tmp_path, capsys):
+    """Test that unpooled Faker fields are reported instead of guessed"""
+    path = tmp_path / "users.txt"
+    assert main(["-t", "user", "-n", "10", "-f", "fixed", "-q", "-o", str(path)]) == 1
+    assert "pool" in capsys.readouterr().err
+    assert main(["-t", "user", "-n", "10", "-f", "fixed", "--pool-size", "100", "-q", "-o", str(path)]) == 0
+
+@pytest.mark.parametrize("options", [["-o", "out.txt.gz"], ["-o", "out.txt", "--compression", "gzip"]])
+def test_cli_fixed_width_rejects_compression(tmp_path, monkeypatch, capsys, options):
+    """Test that compressed fixed-width output is refused rather than written as plain text"""
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit):
+        main(["-t", "financial", "-n", "10", "-f", "fixed", "-q"] + options)
+    assert "cannot be compressed" in capsys.readouterr().err
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,88 @@
+# tests/test_generators/test_arrow_generator.py
+import io
+import pytest
+from datetime import date
+from src.data_types.field_types import FieldDefinition, FieldTypes
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.generators.arrow_generator import ArrowGenerator, arrow_schema
+
+REFERENCE_DATE = date(2024, 1, 31)
+
+def test_arrow_schema_maps_field_types(user_template):
+    """Test typed columns derived from FieldTypes"""
+    schema = arrow_schema(user_template.get_template())
+
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("email").type == pa.string()
+    assert schema.field("date_joined").type == pa.date32()
+    assert schema.field("is_active").type == pa.bool_()
+
+def test_export_stream_writes_row_groups(tmp_path, financial_template):
+    """Test streaming columnar batches into Parquet row groups"""
+    path = str(tmp_path / "transactions.parquet")
+    generator = ArrowGenerator(seed=1, reference_date=REFERENCE_DATE, row_group_size=100,
+                               compression="zstd")
+    generator.export_stream(financial_template.get_template(), 250, path)
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_rows == 250
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.metadata.row_group(0).column(0).compression == "ZSTD"
+    assert parquet.schema_arrow.field("amount").type == pa.float64()
+
+def test_export_records_to_arrow_ipc(tmp_path, basic_template):
+    """Test exporting records to an Arrow IPC file inferred from the extension"""
+    path = str(tmp_path / "people.arrow")
+    generator = ArrowGenerator(seed=2)
+    data = generator.generate(basic_template, 30)
+    generator.export(data, path, template=basic_template)
+
+    table = pa.ipc.open_file(path).read_all()
+    assert table.to_pylist() == data
+
+def test_export_matches_generated_records(tmp_path):
+    """Test that written values equal the generated records, nulls included"""
+    template = {
+        "amount": FieldDefinition(name="amount", field_type=FieldTypes.FLOAT, nullable=True),
+        "created": FieldDefinition(name="created", field_type=FieldTypes.DATE),
+    }
+    generator = ArrowGenerator(seed=3, reference_date=REFERENCE_DATE)
+    data = generator.generate(template, 200)
+    path = str(tmp_path / "values.parquet")
+    generator.export(data, path)
+
+    assert pq.read_table(path).to_pylist() == data
+
+def test_inferred_schema_promotes_leading_null_columns(tmp_path):
+    """Test that a column all null in the first row group takes the type of later values"""
+    records = [{"a": 1, "b": None}] * 5 + [{"a": 2, "b": "x"}] * 5 + [{"a": 3, "b": None}] * 5
+    path = str(tmp_path / "nulls.parquet")
+    ArrowGenerator(row_group_size=5).export(iter(records), path)
+
+    table = pq.read_table(path)
+    assert table.schema.field("b").type == pa.string()
+    assert table.to_pylist() == records
+    assert pq.ParquetFile(path).metadata.num_row_groups == 3
+
+def test_export_bytes_round_trip(basic_template):
+    """Test in-memory Parquet payloads"""
+    generator = ArrowGenerator(seed=4)
+    data = generator.generate(basic_template, 10)
+
+    table = pq.read_table(pa.BufferReader(generator.export_bytes(data, basic_template)))
+    assert table.num_rows == 10
+
+def test_write_to_binary_backed_stream(basic_template):
+    """Test that write() fills the buffer beneath a text stream and refuses pure text streams"""
+    generator = ArrowGenerator(seed=4)
+    data = generator.generate(basic_template, 10)
+    buffer = io.BytesIO()
+    stream = io.TextIOWrapper(buffer, encoding="utf-8")
+    generator.write(data, stream, template=basic_template)
+
+    assert buffer.getvalue() == generator.export_bytes(data, basic_template)
+    with pytest.raises(TypeError, match="binary"):
+        generator.write(data, io.StringIO())
@@ -0,0 +1,78 @@
+import json
+import sys
+from datetime import date
+import pytest
+from src.data_types.field_types import FieldDefinition
+from src.generators.batch import RecordBatch
+from src.generators.csv_generator import CSVGenerator
+from src.generators.json_generator import JSONGenerator
+from src.generators.xml_generator import XMLGenerator
+
+REFERENCE_DATE = date(2024, 1, 31)
+
+def test_record_batch_views():
+    """Test that rows and columns give the same dict-compatible views"""
+    rows = RecordBatch(("id", "name"), rows=[(1, "a"), (2, None)])
+    columns = RecordBatch.from_columns({"id": [1, 2], "name": ["a", None]})
+
+    for batch in (rows, columns):
+        assert len(batch) == 2
+        assert batch[0] == {"id": 1, "name": "a"}
+        assert batch[-1]["name"] is None
+        assert list(batch[1]) == ["id", "name"]
+        assert [dict(view) for view in batch] == batch.to_records() == [{"id": 1, "name": "a"},
+                                                                       {"id": 2, "name": None}]
+        assert batch.columns == {"id": [1, 2], "name": ["a", None]}
+        assert batch.column("id") == [1, 2]
+        assert list(batch.iter_rows()) == [(1, "a"), (2, None)]
+        with pytest.raises(IndexError):
+            batch[2]
+    assert RecordBatch.from_records(rows.to_records()).fields == ("id", "name")
+    assert json.loads(json.dumps(rows[0], default=dict)) == {"id": 1, "name": "a"}
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_batches_match_records(financial_template, columnar):
+    """Test that iter_batches() yields the records iter_generate() yields for the same seed"""
+    template = financial_template.get_template()
+    options = dict(seed=5, columnar=columnar, reference_date=REFERENCE_DATE)
+    records = [record for chunk in JSONGenerator(**options).iter_generate(template, 250, 100) for record in chunk]
+    batches = list(JSONGenerator(**options).iter_batches(template, 250, 100))
+
+    assert [len(batch) for batch in batches] == [100, 100, 50]
+    assert all(batch.is_columnar == columnar for batch in batches)
+    assert [record for batch in batches for record in batch.to_records()] == records
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("generator_cls,extension", [
+    (CSVGenerator, "csv"), (JSONGenerator, "json"), (JSONGenerator, "jsonl"), (XMLGenerator, "xml"),
+])
+def test_export_stream_matches_record_export(tmp_path, user_template, generator_cls, extension, columnar):
+    """Test that exporting RecordBatches writes the same bytes as exporting dict records"""
+    template = user_template.get_template()
+    options = dict(seed=8, columnar=columnar, reference_date=REFERENCE_DATE)
+    # Column draws depend on the batch size, so records come in the same chunks as the batches
+    records = [record for chunk in generator_cls(**options).iter_generate(template, 120, 50) for record in chunk]
+    generator_cls(**options).export(records, str(tmp_path / f"records.{extension}"))
+    generator_cls(**options).export_stream(template, 120, str(tmp_path / f"batches.{extension}"), chunk_size=50)
+    batch = RecordBatch.from_records(records)
+    generator_cls(**options).export(batch, str(tmp_path / f"batch.{extension}"))
+
+    expected = (tmp_path / f"records.{extension}").read_bytes()
+    assert (tmp_path / f"batches.{extension}").read_bytes() == expected
+    assert (tmp_path / f"batch.{extension}").read_bytes() == expected
+
+def test_export_batches_counts_records(tmp_path, basic_template):
+    """Test that export stats count the records of every batch"""
+    generator = CSVGenerator(seed=1, stats=True)
+    generator.export_batches(generator.iter_batches(basic_template, 25, 10), str(tmp_path / "out.csv"))
+
+    assert generator.stats.exports[-1].records == 25
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10")
+def test_field_definition_is_slotted():
+    """Test that field definitions carry no per-instance dict"""
+    field_def = FieldDefinition(name="id", field_type="integer")
+
+    assert not hasattr(field_def, "__dict__")
+    with pytest.raises(AttributeError):
+        field_def.extra = 1
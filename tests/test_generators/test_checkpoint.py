@@ -0,0 +1,103 @@
+import os
+from datetime import date
+import pytest
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.checkpoint import GenerationJob, read_checkpoint
+from src.generators.csv_generator import CSVGenerator
+from src.generators.json_generator import JSONGenerator
+from src.generators.unique import MEMBERSHIP_BLOOM, BloomFilter, HashedMembership, UniqueOptions
+from src.generators.xml_generator import XMLGenerator
+
+REFERENCE_DATE = date(2024, 1, 31)
+
+def unique_template(user_template):
+    """User template plus open-ended unique emails (retry sampler)"""
+    template = dict(user_template.get_template())
+    template["contact"] = FieldDefinition(name="contact", field_type=FieldTypes.EMAIL, unique=True)
+    return template
+
+def read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+@pytest.mark.parametrize("generator_cls,extension", [
+    (CSVGenerator, "csv"), (JSONGenerator, "json"), (JSONGenerator, "jsonl"), (XMLGenerator, "xml")
+])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_resumed_job_matches_uninterrupted_export(user_template, tmp_path, generator_cls, extension, columnar):
+    """Test that a job stopped twice and resumed writes the export_stream() file byte for byte"""
+    template = unique_template(user_template)
+    expected = tmp_path / f"expected.{extension}"
+    generator_cls(seed=7, reference_date=REFERENCE_DATE, columnar=columnar).export_stream(
+        template, 1000, str(expected), chunk_size=90)
+
+    output = str(tmp_path / f"output.{extension}")
+    options = dict(chunk_size=90, checkpoint_every=200, seed=7, reference_date=REFERENCE_DATE, columnar=columnar)
+    assert GenerationJob(generator_cls, template, 1000, output, **options).run(stop_after=300) == 360
+    assert read_checkpoint(output + ".checkpoint").rows == 360
+    assert GenerationJob(generator_cls, template, 1000, output, **options).run(stop_after=250) == 630
+    assert GenerationJob(generator_cls, template, 1000, output, **options).run() == 1000
+
+    assert read_bytes(output) == read_bytes(expected)
+    assert not os.path.exists(output + ".checkpoint")
+
+def test_resume_discards_output_after_checkpoint(basic_template, tmp_path):
+    """Test that a crash's partial writes are truncated and regenerated"""
+    expected = tmp_path / "expected.csv"
+    CSVGenerator(seed=3, reference_date=REFERENCE_DATE).export_stream(basic_template, 500, str(expected), 50)
+
+    output = str(tmp_path / "output.csv")
+    GenerationJob(CSVGenerator, basic_template, 500, output, chunk_size=50, checkpoint_every=100,
+                  seed=3, reference_date=REFERENCE_DATE).run(stop_after=200)
+    with open(output, "a") as f:
+        f.write("half a row,")
+    # seed and reference date come from the checkpoint
+    GenerationJob(CSVGenerator, basic_template, 500, output, chunk_size=50, checkpoint_every=100).run()
+
+    assert read_bytes(output) == read_bytes(expected)
+
+def test_bloom_membership_survives_restart(tmp_path):
+    """Test that bloom filter state is checkpointed along with the samplers"""
+    template = {"code": FieldDefinition(name="code", field_type=FieldTypes.STRING, pattern="[A-Z]{6}", unique=True)}
+    options = dict(seed=11, reference_date=REFERENCE_DATE, unique=UniqueOptions(membership=MEMBERSHIP_BLOOM))
+    expected = tmp_path / "expected.jsonl"
+    JSONGenerator(**options).export_stream(template, 400, str(expected), chunk_size=40)
+
+    output = str(tmp_path / "output.jsonl")
+    GenerationJob(JSONGenerator, template, 400, output, chunk_size=40, checkpoint_every=40, **options).run(stop_after=120)
+    GenerationJob(JSONGenerator, template, 400, output, chunk_size=40, checkpoint_every=40, **options).run()
+
+    assert read_bytes(output) == read_bytes(expected)
+
+def test_mismatched_checkpoint_is_rejected(basic_template, tmp_path):
+    """Test that a checkpoint is never applied to a different job"""
+    output = str(tmp_path / "output.csv")
+    GenerationJob(CSVGenerator, basic_template, 500, output, chunk_size=50, checkpoint_every=50,
+                  seed=3).run(stop_after=100)
+
+    with pytest.raises(ValueError, match="different job"):
+        GenerationJob(CSVGenerator, basic_template, 600, output, chunk_size=50, seed=3).run()
+    with pytest.raises(ValueError, match="seed"):
+        GenerationJob(CSVGenerator, basic_template, 500, output, chunk_size=50, seed=4).run()
+
+def test_job_rejects_unsupported_output(basic_template, tmp_path):
+    """Test that compressed and non-appendable formats are refused"""
+    with pytest.raises(ValueError, match="compressed"):
+        GenerationJob(CSVGenerator, basic_template, 10, str(tmp_path / "out.csv.gz"))
+    with pytest.raises(ValueError, match="support"):
+        GenerationJob(object, basic_template, 10, str(tmp_path / "out.bin"))
+
+def test_membership_state_round_trip():
+    """Test that membership get_state()/set_state() restore the seen values"""
+    hashed = HashedMembership()
+    bloom = BloomFilter(100)
+    for value in ("a", "b"):
+        hashed.add(value)
+        bloom.add(value)
+
+    restored_hashed, restored_bloom = HashedMembership(), BloomFilter(100)
+    restored_hashed.set_state(hashed.get_state())
+    restored_bloom.set_state(bloom.get_state())
+
+    assert not restored_hashed.add("a") and restored_hashed.add("c")
+    assert not restored_bloom.add("b") and len(restored_bloom) == 2
@@ -0,0 +1,113 @@
+import pytest
+import bz2
+import gzip
+import json
+import lzma
+import os
+import tempfile
+from datetime import date
+from src.generators.compression import (BackgroundCompressor, OutputFile, compression_for,
+                                        strip_compression_extension)
+from src.generators.csv_generator import CSVGenerator
+from src.generators.json_generator import JSONGenerator
+from src.generators.json_writer import is_json_lines_path
+from src.generators.xml_generator import XMLGenerator
+
+REFERENCE_DATE = date(2024, 1, 31)
+OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+def test_compression_is_selected_by_extension_or_option():
+    """Test that an explicit compression wins over the file extension"""
+    assert compression_for("data.csv.gz") == "gzip"
+    assert compression_for("data.JSONL.BZ2") == "bz2"
+    assert compression_for("data.xml.xz") == "xz"
+    assert compression_for("data.csv") is None
+    assert compression_for("data.csv", "xz") == "xz"
+    with pytest.raises(ValueError):
+        compression_for("data.csv", "zip")
+
+    assert strip_compression_extension("data.jsonl.gz") == "data.jsonl"
+    assert is_json_lines_path("data.jsonl.gz")
+    assert not is_json_lines_path("data.json.gz")
+
+@pytest.mark.parametrize("extension", sorted(OPENERS))
+@pytest.mark.parametrize("generator_cls,suffix", [
+    (JSONGenerator, ".json"), (JSONGenerator, ".jsonl"), (CSVGenerator, ".csv"), (XMLGenerator, ".xml"),
+])
+def test_compressed_export_matches_plain_export(financial_template, generator_cls, suffix, extension):
+    """Test that every exporter's compressed file decompresses to its plain output"""
+    template = financial_template.get_template()
+    records = JSONGenerator(seed=2, reference_date=REFERENCE_DATE).generate(template, 300)
+    generator = generator_cls()
+
+    with tempfile.TemporaryDirectory() as directory:
+        plain = os.path.join(directory, f"data{suffix}")
+        compressed = plain + extension
+        generator.export(records, plain)
+        generator.export(records, compressed)
+
+        with open(plain, "rb") as f:
+            expected = f.read()
+        with OPENERS[extension](compressed, "rb") as f:
+            assert f.read() == expected
+        assert os.path.getsize(compressed) < len(expected)
+
+def test_compression_option_overrides_extension(user_template):
+    """Test compression=... on a plain path and gzip output determinism"""
+    records = JSONGenerator(seed=4, reference_date=REFERENCE_DATE).generate(user_template.get_template(), 200)
+    generator = CSVGenerator()
+
+    with tempfile.TemporaryDirectory() as directory:
+        first, second = os.path.join(directory, "a.csv"), os.path.join(directory, "b.csv")
+        generator.export(records, first, compression="gzip", compression_level=1)
+        generator.export(records, second, compression="gzip", compression_level=1)
+
+        with gzip.open(first, "rt", newline="") as f:
+            assert f.readline().startswith("id,")
+        with open(first, "rb") as a, open(second, "rb") as b:
+            assert a.read() == b.read()
+
+def test_compression_ratio_is_reported(financial_template):
+    """Test that export stats carry the uncompressed size and ratio"""
+    template = financial_template.get_template()
+    generator = JSONGenerator(seed=5, reference_date=REFERENCE_DATE, stats=True)
+    records = generator.generate(template, 500)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "data.jsonl.gz")
+        generator.export(records, path)
+        export = generator.stats.exports[-1]
+
+        assert export.format == "jsonl"
+        assert export.compression == "gzip"
+        assert export.bytes == os.path.getsize(path)
+        with gzip.open(path, "rb") as f:
+            assert export.uncompressed_bytes == len(f.read())
+        assert export.compression_ratio > 1
+
+def test_output_file_stats(tmp_path):
+    """Test the CompressionStats of an OutputFile"""
+    path = str(tmp_path / "data.txt.bz2")
+    output = OutputFile(path, level=1)
+    with output as f:
+        for i in range(10000):
+            f.write(f"line {i}\n")
+
+    assert output.stats.compression == "bz2"
+    assert output.stats.level == 1
+    assert output.stats.bytes_out == os.path.getsize(path)
+    assert output.stats.ratio > 1
+    with bz2.open(path, "rt") as f:
+        assert f.read().count("\n") == 10000
+
+@pytest.mark.skipif(not os.path.exists("/dev/full"), reason="needs /dev/full")
+def test_compression_errors_reach_the_writer():
+    """Test that a write failure on the compression thread is raised to the caller"""
+    sink = BackgroundCompressor("/dev/full", "gzip", level=1)
+
+    with pytest.raises(OSError):
+        try:
+            for _ in range(64):
+                sink.write(os.urandom(64 * 1024))
+        finally:
+            sink.close()
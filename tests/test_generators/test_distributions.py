@@ -0,0 +1,105 @@
+import random
+from collections import Counter
+import numpy as np
+import pytest
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.distributions import (AliasTable, EXPONENTIAL, LOGNORMAL, NORMAL, ZIPF,
+                                          distribution_for, weighted_choices_for)
+from src.generators.json_generator import JSONGenerator
+
+STATUS = FieldDefinition(name="status", field_type=FieldTypes.STRING,
+                         choices=["completed", "pending", "failed"], weights=[90, 8, 2])
+
+def test_alias_table_matches_weights():
+    """Test that scalar and batch alias draws follow the weights, never drawing zero-weight outcomes"""
+    table = AliasTable([5, 0, 3, 2])
+    rng = random.Random(1)
+    scalar = Counter(table.sample(rng) for _ in range(50000))
+    batch = Counter(table.sample_batch(50000, np.random.default_rng(1)).tolist())
+
+    for counts in (scalar, batch):
+        assert counts[1] == 0
+        assert counts[0] / 50000 == pytest.approx(0.5, abs=0.01)
+        assert counts[2] / 50000 == pytest.approx(0.3, abs=0.01)
+
+@pytest.mark.parametrize("weights", [[], [-1, 2], [0, 0], [1, float("nan")]])
+def test_alias_table_rejects_invalid_weights(weights):
+    """Test that weights must form a distribution"""
+    with pytest.raises(ValueError):
+        AliasTable(weights)
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_weighted_choices(columnar):
+    """Test that weighted choice fields are skewed in both generation modes"""
+    records = JSONGenerator(seed=4, columnar=columnar).generate({"status": STATUS}, 20000)
+    counts = Counter(record["status"] for record in records)
+
+    assert counts["completed"] / 20000 == pytest.approx(0.9, abs=0.01)
+    assert counts["failed"] < counts["pending"] < counts["completed"]
+
+def test_weights_must_match_choices():
+    """Test that a weight is required per choice"""
+    field_def = FieldDefinition(name="status", field_type=FieldTypes.STRING, choices=["a", "b"], weights=[1])
+    with pytest.raises(ValueError, match="weights"):
+        JSONGenerator().generate({"status": field_def}, 1)
+
+@pytest.mark.parametrize("field_type", [FieldTypes.INTEGER, FieldTypes.FLOAT])
+@pytest.mark.parametrize("distribution", [NORMAL, LOGNORMAL, EXPONENTIAL, ZIPF])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_distributions_stay_in_bounds(field_type, distribution, columnar):
+    """Test that every distribution is clipped to the field bounds with the field's value type"""
+    field_def = FieldDefinition(name="value", field_type=field_type, min_value=10, max_value=500,
+                                distribution=distribution)
+    values = [record["value"] for record in
+              JSONGenerator(seed=9, columnar=columnar).generate({"value": field_def}, 5000)]
+
+    assert all(10 <= value <= 500 for value in values)
+    assert all(type(value) is (int if field_type == FieldTypes.INTEGER else float) for value in values)
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_distribution_shapes(columnar):
+    """Test the location of normal values and the head of Zipf values"""
+    template = {
+        "normal": FieldDefinition(name="normal", field_type=FieldTypes.FLOAT, min_value=0, max_value=100,
+                                  distribution=NORMAL, distribution_params={"stddev": 5}),
+        "zipf": FieldDefinition(name="zipf", field_type=FieldTypes.INTEGER, min_value=1, max_value=1000,
+                                distribution=ZIPF, distribution_params={"a": 2.0}),
+    }
+    records = JSONGenerator(seed=2, columnar=columnar).generate(template, 20000)
+
+    assert np.mean([record["normal"] for record in records]) == pytest.approx(50, abs=0.5)
+    zipf = Counter(record["zipf"] for record in records)
+    # P(k) = 1 / (zeta(2) k^2): about 61% ones and 15% twos
+    assert zipf[1] / 20000 == pytest.approx(0.61, abs=0.02)
+    assert zipf[2] / 20000 == pytest.approx(0.15, abs=0.02)
+
+@pytest.mark.parametrize("field_def,message", [
+    (FieldDefinition(name="x", field_type=FieldTypes.STRING, distribution=NORMAL), "integer and float"),
+    (FieldDefinition(name="x", field_type=FieldTypes.INTEGER, distribution="cauchy"), "unknown distribution"),
+    (FieldDefinition(name="x", field_type=FieldTypes.INTEGER, distribution=ZIPF,
+                     distribution_params={"a": 1}), "a > 1"),
+    (FieldDefinition(name="x", field_type=FieldTypes.FLOAT, distribution=NORMAL,
+                     distribution_params={"sigma": 1}), "unknown parameters"),
+])
+def test_invalid_distributions_are_rejected(field_def, message):
+    """Test that bad distribution settings fail at compile time"""
+    with pytest.raises(ValueError, match=message):
+        JSONGenerator().compile({"x": field_def})
+
+@pytest.mark.parametrize("a", [1.01, 1.0001])
+def test_zipf_near_one_does_not_overflow(a):
+    """Test that row-mode Zipf draws for a close to 1 stay finite and in bounds"""
+    field_def = FieldDefinition(name="v", field_type=FieldTypes.INTEGER, min_value=1, max_value=1000,
+                                distribution=ZIPF, distribution_params={"a": a})
+    values = [record["v"] for record in JSONGenerator(seed=0).generate({"v": field_def}, 5000)]
+
+    assert all(1 <= value <= 1000 for value in values)
+    assert values.count(1) > values.count(2) > 0
+
+def test_tables_are_built_once():
+    """Test that equal definitions share one compiled table"""
+    field_def = FieldDefinition(name="amount", field_type=FieldTypes.FLOAT, min_value=0.01, max_value=10000,
+                                distribution=LOGNORMAL)
+
+    assert weighted_choices_for(STATUS) is weighted_choices_for(STATUS)
+    assert distribution_for(field_def) is distribution_for(field_def)
@@ -0,0 +1,134 @@
+import csv
+from datetime import date
+import pytest
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.batch import RecordBatch
+from src.generators.fixed_width import (
+    FIXED_WIDTH, PADDED_CSV, FixedWidthGenerator, FixedWidthLayout, LayoutError, field_width
+)
+from src.generators.parallel import ParallelGenerator
+
+REFERENCE_DATE = date(2024, 1, 31)
+
+@pytest.mark.parametrize("field_def,width", [
+    (FieldDefinition(name="v", field_type=FieldTypes.INTEGER, min_value=-50, max_value=999), 3),
+    (FieldDefinition(name="v", field_type=FieldTypes.INTEGER, min_value=-5000, max_value=9), 5),
+    (FieldDefinition(name="v", field_type=FieldTypes.FLOAT, min_value=0.01, max_value=10000.00), 8),
+    (FieldDefinition(name="v", field_type=FieldTypes.FLOAT, min_value=-1, max_value=1), 5),
+    (FieldDefinition(name="v", field_type=FieldTypes.BOOLEAN), 5),
+    (FieldDefinition(name="v", field_type=FieldTypes.DATE), 10),
+    (FieldDefinition(name="v", field_type=FieldTypes.STRING, choices=["a", "bbb", 12345]), 5),
+    (FieldDefinition(name="v", field_type=FieldTypes.STRING, pattern="TRX[0-9]{10}"), 13),
+    (FieldDefinition(name="v", field_type=FieldTypes.EMAIL), None),
+])
+def test_field_width_from_definition(field_def, width):
+    """Test widths derived from bounds, choices and pattern programs"""
+    assert field_width(field_def) == width
+
+def test_padded_csv_widths_leave_room_for_quotes():
+    """Test that values needing quotes are sized with their quotes"""
+    choices = FieldDefinition(name="v", field_type=FieldTypes.STRING, choices=['say "hi"', "plain"])
+    pattern = FieldDefinition(name="v", field_type=FieldTypes.STRING, pattern="[a,]{4}")
+
+    assert field_width(choices) == 8
+    assert field_width(choices, padded_csv=True) == 12
+    assert field_width(pattern, padded_csv=True) == 6
+
+@pytest.mark.parametrize("file_format", [FIXED_WIDTH, PADDED_CSV])
+def test_records_have_fixed_size(financial_template, file_format):
+    """Test that every encoded record is exactly record_size bytes"""
+    template = financial_template.get_template()
+    generator = FixedWidthGenerator(file_format=file_format, seed=1, reference_date=REFERENCE_DATE)
+    layout = generator.layout(template)
+    batch = next(generator.iter_batches(template, 200))
+    lines = layout.encode_batch(batch).splitlines(keepends=True)
+
+    assert len(lines) == 200
+    assert {len(line) for line in lines} == {layout.record_size}
+    assert len(layout.header) == (layout.record_size if file_format == PADDED_CSV else 0)
+
+def test_padded_csv_round_trips(tmp_path):
+    """Test that skipinitialspace recovers values, including quoted and null ones"""
+    template = {
+        "id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER, min_value=1, max_value=100000),
+        "note": FieldDefinition(name="note", field_type=FieldTypes.STRING,
+                                choices=["a, b", 'say "hi"', " lead", "plain"], nullable=True),
+    }
+    path = tmp_path / "notes.csv"
+    generator = FixedWidthGenerator(seed=4)
+    records = generator.generate(template, 300)
+    generator.export(records, str(path), template=template)
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f, skipinitialspace=True))
+    assert [row["note"] for row in rows] == [record["note"] or "" for record in records]
+    assert [int(row["id"]) for row in rows] == [record["id"] for record in records]
+
+@pytest.mark.parametrize("file_format", [FIXED_WIDTH, PADDED_CSV])
+def test_free_text_fits_non_ascii_locales(file_format):
+    """Test that free text is sized in bytes, so multi-byte locales fit their columns"""
+    template = {"note": FieldDefinition(name="note", field_type=FieldTypes.STRING)}
+    generator = FixedWidthGenerator(file_format=file_format, seed=5, locale="ja_JP")
+    layout = generator.layout(template)
+    lines = layout.encode_batch(next(generator.iter_batches(template, 200))).splitlines(keepends=True)
+
+    assert {len(line) for line in lines} == {layout.record_size}
+
+def test_unbounded_fields_need_widths(user_template):
+    """Test that Faker fields are sized by explicit widths or by their pools"""
+    template = user_template.get_template()
+    with pytest.raises(LayoutError, match="email"):
+        FixedWidthLayout(template)
+
+    widths = {"email": 40, "first_name": 30, "last_name": 30}
+    assert FixedWidthLayout(template, widths=widths).columns[2].width == 40
+    assert FixedWidthLayout(template, pool_size=100).record_size > 0
+
+def test_overflowing_value_raises():
+    """Test that a value wider than its explicit width is refused rather than truncated"""
+    template = {"name": FieldDefinition(name="name", field_type=FieldTypes.NAME)}
+    layout = FixedWidthLayout(template, widths={"name": 3})
+
+    with pytest.raises(LayoutError, match="wider"):
+        layout.encode_batch(RecordBatch(("name",), rows=[("Ada Lovelace",)]))
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("extension", ["txt", "csv"])
+def test_parallel_writes_in_place(tmp_path, financial_template, columnar, extension):
+    """Test that workers filling one mapped file match the encoded merged records"""
+    template = financial_template.get_template()
+    outputs = []
+    for workers in (1, 2):
+        path = tmp_path / f"out-{workers}.{extension}"
+        parallel = ParallelGenerator(FixedWidthGenerator, seed=9, workers=workers, shard_size=70,
+                                     chunk_size=30, reference_date=REFERENCE_DATE, columnar=columnar)
+        parallel.export(template, 250, str(path))
+        outputs.append(path.read_bytes())
+
+    layout = FixedWidthGenerator().layout(template, f"out.{extension}")
+    records = list(parallel.iter_records(template, 250))
+    expected = layout.header + layout.encode_batch(RecordBatch.from_records(records, layout.fields))
+    assert outputs[0] == outputs[1] == expected
+
+def test_export_stream_matches_export(tmp_path, financial_template):
+    """Test that the preallocated stream path writes what export() writes"""
+    template = financial_template.get_template()
+    streamed, exported = tmp_path / "streamed.txt", tmp_path / "exported.txt"
+    FixedWidthGenerator(seed=2, reference_date=REFERENCE_DATE).export_stream(template, 120, str(streamed), 50)
+    generator = FixedWidthGenerator(seed=2, reference_date=REFERENCE_DATE)
+    generator.export(generator.generate(template, 120), str(exported), template=template)
+
+    assert streamed.read_bytes() == exported.read_bytes()
+
+@pytest.mark.parametrize("file_format,extension", [(FIXED_WIDTH, "txt"), (PADDED_CSV, "csv")])
+def test_export_bytes_matches_export(tmp_path, financial_template, file_format, extension):
+    """Test that write(), via export_bytes(), produces the exported file's bytes"""
+    template = financial_template.get_template()
+    generator = FixedWidthGenerator(file_format=file_format, seed=6, reference_date=REFERENCE_DATE)
+    records = generator.generate(template, 150)
+    path = tmp_path / f"out.{extension}"
+    generator.export(records, str(path), template=template)
+
+    assert generator.export_bytes(records, template=template) == path.read_bytes()
+    with pytest.raises(ValueError, match="template"):
+        generator.export_bytes(records)
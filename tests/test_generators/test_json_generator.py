@@ -37,4 +37,59 @@ def test_export_json(json_generator, basic_template):
 def test_generate_multiple_records(json_generator, basic_template, record_count):
     """Test generating different numbers of records"""
     data = json_generator.generate(basic_template, count=record_count)
-    assert len(data) == record_count
\ No newline at end of file
+    assert len(data) == record_count
+
+def test_export_json_matches_json_dump(json_generator, user_template):
+    """Test that batched array output is identical to dumping the full list"""
+    data = json_generator.generate(user_template.get_template(), count=2500)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as tmp:
+        json_generator.export(iter(data), tmp.name)
+
+        with open(tmp.name, 'r') as f:
+            assert f.read() == json.dumps(data, indent=2, default=str)
+
+    os.unlink(tmp.name)
+
+@pytest.mark.parametrize("suffix,lines", [(".jsonl", None), (".ndjson", None), (".json", True)])
+def test_export_json_lines(json_generator, financial_template, suffix, lines):
+    """Test JSON Lines output selected by extension or option"""
+    data = json_generator.generate(financial_template.get_template(), count=10)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        json_generator.export(data, tmp.name, lines=lines)
+
+        with open(tmp.name, 'r') as f:
+            loaded = [json.loads(line) for line in f]
+
+    assert len(loaded) == 10
+    assert loaded[0]["transaction_date"] == data[0]["transaction_date"].isoformat()
+    os.unlink(tmp.name)
+
+def test_export_json_compact_and_empty(json_generator, basic_template):
+    """Test compact array output and empty exports"""
+    data = json_generator.generate(basic_template, count=3)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.json') as tmp:
+        json_generator.export(data, tmp.name, indent=None)
+        with open(tmp.name, 'r') as f:
+            assert json.load(f) == data
+
+        json_generator.export([], tmp.name)
+        with open(tmp.name, 'r') as f:
+            assert json.load(f) == []
+
+    os.unlink(tmp.name)
+
+def test_export_json_columns(json_generator, financial_template):
+    """Test exporting column batches with date columns converted up front"""
+    columns = json_generator.generate_columns(financial_template.get_template(), 20)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.jsonl') as tmp:
+        json_generator.export_columns(columns, tmp.name)
+        with open(tmp.name, 'r') as f:
+            loaded = [json.loads(line) for line in f]
+
+    assert [record["amount"] for record in loaded] == columns["amount"]
+    assert loaded[0]["transaction_date"] == columns["transaction_date"][0].isoformat()
+    os.unlink(tmp.name)
@@ -0,0 +1,71 @@
+import pytest
+import random
+import re
+import numpy as np
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.pattern import _class_chars, compile_pattern, sre_constants
+from src.templates.schema_template import SchemaError, validate_field
+
+PATTERNS = [
+    "TRX[0-9]{10}",
+    "[A-Z]{2}[0-9]{20}",
+    "[a-z0-9_]{5,15}",
+    r"\d{3}-\d{4}",
+    "(foo|ba[rz]){2}",
+    r"(ab|c)+\d?x*.[^a]\w\1",
+    "^[^0-9]{3}$",
+]
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_samples_match_pattern(pattern):
+    """Test that scalar and batch samples fully match their pattern"""
+    program = compile_pattern(pattern)
+    sample = program.sampler(random.Random(1))
+    values = [sample() for _ in range(200)] + program.generate_batch(200, np.random.default_rng(1))
+
+    assert all(re.fullmatch(pattern, value) for value in values)
+    assert len(set(values)) > 1
+
+@pytest.mark.parametrize("pattern", PATTERNS + ["é{2,3}"])
+def test_max_length_bounds_samples(pattern):
+    """Test that no sample is longer than max_length / max_bytes or leaves the alphabet"""
+    program = compile_pattern(pattern)
+    sample = program.sampler(random.Random(2))
+    values = [sample() for _ in range(2000)]
+
+    assert max(map(len, values)) <= program.max_length
+    assert max(len(value.encode()) for value in values) <= program.max_bytes
+    assert set("".join(values)) <= program.alphabet
+
+def test_compiled_patterns_are_cached():
+    """Test that each pattern is parsed only once"""
+    assert compile_pattern("TRX[0-9]{10}") is compile_pattern("TRX[0-9]{10}")
+
+def test_unsupported_pattern_raises():
+    """Test that lookarounds are rejected"""
+    with pytest.raises(ValueError):
+        compile_pattern("a(?=b)")
+
+@pytest.mark.parametrize("pattern", [r"[^\x20-\x7e]{3}", r"[^ -~]", "x[^ -~]?"])
+def test_class_without_printable_chars_is_rejected(pattern):
+    """Test that a class with nothing to draw fails when the schema is validated, not when sampling"""
+    with pytest.raises(ValueError, match="no printable"):
+        compile_pattern(pattern)
+    with pytest.raises(SchemaError, match="no printable"):
+        validate_field(FieldDefinition(name="v", field_type=FieldTypes.STRING, pattern=pattern))
+
+def test_unsupported_category_is_rejected():
+    """Test that categories without a known alphabet raise instead of drawing letters"""
+    assert _class_chars([(sre_constants.CATEGORY, sre_constants.CATEGORY_DIGIT)]) == "0123456789"
+    with pytest.raises(ValueError, match="category"):
+        _class_chars([(sre_constants.CATEGORY, sre_constants.CATEGORY_LINEBREAK)])
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_template_patterns_are_honoured(json_generator, financial_template, user_template, columnar):
+    """Test that pattern fields in the built-in templates match their patterns"""
+    json_generator.columnar = columnar
+    for template in (financial_template.get_template(), user_template.get_template()):
+        records = json_generator.generate(template, 50)
+        for field_name, field_def in template.items():
+            if field_def.pattern:
+                assert all(re.fullmatch(field_def.pattern, record[field_name]) for record in records)
@@ -0,0 +1,38 @@
+import pytest
+from datetime import date
+from src.data_types.field_types import FieldDefinition, FieldTypes
+
+def test_compiled_plan_respects_field_definitions(json_generator, financial_template):
+    """Test that a compiled plan honours bounds, choices and types"""
+    plan = json_generator.compile(financial_template.get_template())
+    data = plan.generate(50)
+
+    assert len(data) == 50
+    for record in data:
+        assert list(record.keys()) == list(plan.field_names)
+        assert 0.01 <= record["amount"] <= 10000.00
+        assert record["currency"] in ["USD", "EUR", "GBP", "JPY"]
+        assert isinstance(record["transaction_date"], date)
+
+def test_plan_unique_values_span_calls(json_generator):
+    """Test that unique tracking is shared across generate() calls on one plan"""
+    template = {
+        "id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER,
+                              min_value=1, max_value=50, unique=True)
+    }
+    plan = json_generator.compile(template)
+    ids = [record["id"] for record in plan.generate(20) + plan.generate(20)]
+
+    assert len(set(ids)) == 40
+
+@pytest.mark.parametrize("field_type", [
+    FieldTypes.STRING, FieldTypes.INTEGER, FieldTypes.FLOAT, FieldTypes.BOOLEAN,
+    FieldTypes.DATE, FieldTypes.EMAIL, FieldTypes.PHONE, FieldTypes.ADDRESS, FieldTypes.NAME
+])
+def test_nullable_fields_produce_nulls(json_generator, field_type):
+    """Test null injection for every field type"""
+    template = {"value": FieldDefinition(name="value", field_type=field_type, nullable=True)}
+    values = [record["value"] for record in json_generator.generate(template, 200)]
+
+    assert None in values
+    assert any(value is not None for value in values)
@@ -0,0 +1,45 @@
+import pytest
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.csv_generator import CSVGenerator
+from src.generators.json_generator import JSONGenerator
+from src.generators.pools import get_pool
+from src.generators.xml_generator import XMLGenerator
+
+POOLED_TEMPLATE = {
+    "name": FieldDefinition(name="name", field_type=FieldTypes.NAME),
+    "email": FieldDefinition(name="email", field_type=FieldTypes.EMAIL),
+    "phone": FieldDefinition(name="phone", field_type=FieldTypes.PHONE),
+    "address": FieldDefinition(name="address", field_type=FieldTypes.ADDRESS, nullable=True),
+}
+
+def test_pools_are_cached_and_shared():
+    """Test that every generator reuses the same pool object"""
+    assert get_pool(FieldTypes.NAME, 50) is get_pool(FieldTypes.NAME, 50)
+    assert get_pool(FieldTypes.NAME, 50) is not get_pool(FieldTypes.NAME, 50, locale="de_DE")
+
+    with pytest.raises(ValueError):
+        get_pool(FieldTypes.INTEGER, 50)
+
+@pytest.mark.parametrize("generator_cls,options", [
+    (JSONGenerator, {}),
+    (JSONGenerator, {"columnar": True}),
+    (CSVGenerator, {}),
+    (XMLGenerator, {"columnar": True}),
+])
+def test_pooled_values_come_from_pools(generator_cls, options):
+    """Test that pooled fields sample from the shared pools"""
+    generator = generator_cls(pool_size=20, seed=1, **options)
+    data = generator.generate(POOLED_TEMPLATE, 200)
+
+    for field_name, field_def in POOLED_TEMPLATE.items():
+        pool = set(get_pool(field_def.field_type, 20))
+        values = {record[field_name] for record in data} - {None}
+        assert values <= pool
+        assert len(values) > 1
+
+def test_pooled_generation_is_reproducible():
+    """Test that seeded pooled generation is deterministic"""
+    first = JSONGenerator(pool_size=100, seed=5).generate(POOLED_TEMPLATE, 30)
+    second = JSONGenerator(pool_size=100, seed=5).generate(POOLED_TEMPLATE, 30)
+
+    assert first == second
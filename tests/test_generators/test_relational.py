@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+from collections import Counter
+from datetime import date
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.fixed_width import FixedWidthGenerator
+from src.generators.relational import ArrayKeys, PermutationKeys, RelationalGenerator, Table
+
+REFERENCE_DATE = date(2024, 1, 31)
+
+@pytest.fixture
+def transaction_template(financial_template):
+    """Financial records with a foreign key to users.id"""
+    return dict(financial_template.get_template(),
+                user_id=FieldDefinition(name="user_id", field_type=FieldTypes.INTEGER, references="users.id"))
+
+def _schema(user_template, transaction_template, **options):
+    tables = [
+        Table("transactions", transaction_template, per_parent=(0, 4)),
+        Table("users", user_template.get_template(), count=60),
+    ]
+    return RelationalGenerator(tables, seed=11, shard_size=25, reference_date=REFERENCE_DATE, **options)
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_foreign_keys_follow_parent_rows(user_template, transaction_template, columnar):
+    """Test that every child references a parent, grouped per parent within the cardinality bounds"""
+    generator = _schema(user_template, transaction_template, workers=1, columnar=columnar)
+    data = generator.generate()
+
+    assert generator.order == ["users", "transactions"]
+    user_ids = [user["id"] for user in data["users"]]
+    per_user = Counter(record["user_id"] for record in data["transactions"])
+    assert set(per_user) <= set(user_ids)
+    assert all(count <= 4 for count in per_user.values())
+    assert len(data["transactions"]) == generator.count("transactions")
+    # Children follow their parents' order
+    referenced = list(dict.fromkeys(record["user_id"] for record in data["transactions"]))
+    assert referenced == [user_id for user_id in user_ids if user_id in per_user]
+    assert list(data["transactions"][0]) == list(transaction_template)
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_recomputed_keys_match_generated_parents(user_template, transaction_template, columnar):
+    """Test that the permutation index reproduces the parent keys without the parent rows"""
+    generator = _schema(user_template, transaction_template, workers=1, columnar=columnar)
+    index = generator.key_index("users", "id")
+    users = list(generator.iter_records("users"))
+
+    assert isinstance(index, PermutationKeys)
+    assert index.take(np.arange(len(users))) == [user["id"] for user in users]
+
+def test_open_ended_keys_are_collected(basic_template):
+    """Test that non-enumerable keys come from a collected index and nullable keys get nulls"""
+    parents = dict(basic_template, email=FieldDefinition(name="email", field_type=FieldTypes.EMAIL, unique=True))
+    children = {
+        "owner": FieldDefinition(name="owner", field_type=FieldTypes.EMAIL, references="people.email",
+                                 nullable=True),
+        "score": FieldDefinition(name="score", field_type=FieldTypes.INTEGER, min_value=0, max_value=9),
+    }
+    generator = RelationalGenerator([Table("people", parents, count=40), Table("scores", children, count=300)],
+                                    seed=3, workers=1, shard_size=10, reference_date=REFERENCE_DATE)
+    data = generator.generate()
+
+    emails = [person["email"] for person in data["people"]]
+    assert len(set(emails)) == 40
+    assert isinstance(generator.key_index("people", "email"), ArrayKeys)
+    owners = [record["owner"] for record in data["scores"]]
+    assert None in owners
+    assert {owner for owner in owners if owner is not None} <= set(emails)
+
+def test_output_independent_of_workers(tmp_path, user_template, transaction_template):
+    """Test identical tables and part files for different worker counts"""
+    outputs = []
+    for workers in (1, 2):
+        generator = _schema(user_template, transaction_template, workers=workers)
+        paths = generator.export_shards(str(tmp_path / f"out-{workers}"))
+        outputs.append({name: [open(path, "rb").read() for path in parts] for name, parts in paths.items()})
+        outputs.append(generator.generate())
+
+    assert outputs[0] == outputs[2]
+    assert outputs[1] == outputs[3]
+    assert len(outputs[0]["transactions"]) == len(_schema(user_template, transaction_template).shards("transactions"))
+
+def test_export_writes_one_file_per_table(tmp_path, user_template, transaction_template):
+    """Test that export() writes each table to its own file"""
+    generator = _schema(user_template, transaction_template, workers=1)
+    paths = generator.export(str(tmp_path))
+
+    assert sorted(paths) == ["transactions", "users"]
+    assert open(paths["users"]).read().count("\n") == 61
+
+def test_export_fixed_width_tables(tmp_path, financial_template):
+    """Test that fixed-width table exports are sized from each table's template"""
+    account_id = FieldDefinition(name="account_id", field_type=FieldTypes.INTEGER, references="accounts.id")
+    tables = [Table("transactions", dict(financial_template.get_template(), account_id=account_id),
+                    per_parent=(0, 4)),
+              Table("accounts", {"id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER,
+                                                       min_value=1, max_value=999, unique=True)}, count=30)]
+    generator = RelationalGenerator(tables, seed=3, workers=1, generator_cls=FixedWidthGenerator,
+                                    reference_date=REFERENCE_DATE)
+    paths = generator.export(str(tmp_path))
+
+    accounts = open(paths["accounts"], "rb").read().splitlines()
+    assert len(accounts) == 30 and {len(line) for line in accounts} == {3}
+    transactions = open(paths["transactions"], "rb").read().splitlines()
+    assert len({len(line) for line in transactions}) == 1
+
+@pytest.mark.parametrize("tables,message", [
+    ([Table("a", {"x": FieldDefinition(name="x", field_type=FieldTypes.INTEGER, references="b.id")}, count=1)],
+     "unknown table"),
+    ([Table("a", {"id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER)}, count=1),
+      Table("b", {"x": FieldDefinition(name="x", field_type=FieldTypes.INTEGER, references="a.id")}, count=1)],
+     "unique"),
+    ([Table("a", {"id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER, unique=True),
+                  "b": FieldDefinition(name="b", field_type=FieldTypes.INTEGER, references="b.id")}, count=1),
+      Table("b", {"id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER, unique=True),
+                  "a": FieldDefinition(name="a", field_type=FieldTypes.INTEGER, references="a.id")}, count=1)],
+     "cycle"),
+    ([Table("a", {"id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER, unique=True)}, count=1, per_parent=(1, 2))],
+     "exactly one"),
+])
+def test_invalid_schemas_are_rejected(tables, message):
+    """Test that broken references and sizes fail before generation"""
+    with pytest.raises(ValueError, match=message):
+        RelationalGenerator(tables, workers=1)
@@ -0,0 +1,132 @@
+import pytest
+import gzip
+import os
+import sqlite3
+import tempfile
+from datetime import date
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.json_generator import JSONGenerator
+from src.generators.sql_generator import (SQLGenerator, create_table_sql, file_format_for,
+                                          infer_template, table_name_for)
+
+REFERENCE_DATE = date(2024, 1, 31)
+
+@pytest.fixture
+def user_records(user_template):
+    template = user_template.get_template()
+    return template, JSONGenerator(seed=1, reference_date=REFERENCE_DATE).generate(template, 250)
+
+def _rows(connection, table, template):
+    columns = ", ".join(f'"{field_name}"' for field_name in template)
+    return connection.execute(f'SELECT {columns} FROM "{table}" ORDER BY rowid').fetchall()
+
+def _expected(records, template):
+    return [tuple(value.isoformat() if isinstance(value, date) else value
+                  for value in (record[field_name] for field_name in template))
+            for record in records]
+
+def test_schema_from_field_definitions():
+    """Test column types and constraints derived from the template"""
+    template = {
+        "id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER, unique=True),
+        "price": FieldDefinition(name="price", field_type=FieldTypes.FLOAT, nullable=True),
+        "email": FieldDefinition(name="email", field_type=FieldTypes.EMAIL),
+    }
+    assert create_table_sql("orders", template) == (
+        'CREATE TABLE "orders" ("id" BIGINT NOT NULL UNIQUE, "price" DOUBLE PRECISION, "email" TEXT NOT NULL)'
+    )
+    inferred = infer_template({"flag": True, "count": 3, "day": REFERENCE_DATE, "note": None})
+    assert [field_def.field_type for field_def in inferred.values()] == [
+        FieldTypes.BOOLEAN, FieldTypes.INTEGER, FieldTypes.DATE, FieldTypes.STRING]
+    assert table_name_for("User Data") == "user_data"
+    assert file_format_for("fixtures.sqlite3") == "sqlite"
+    assert file_format_for("fixtures.sql.gz") == "insert"
+
+def test_sqlite_export(user_records):
+    """Test loading records into a SQLite database across several transactions"""
+    template, records = user_records
+    generator = SQLGenerator(table="users", transaction_size=100)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "fixtures.db")
+        generator.export(records, path, template)
+        generator.export(records[:10], path, template, table="other")
+
+        connection = sqlite3.connect(path)
+        try:
+            assert _rows(connection, "users", template) == _expected(records, template)
+            assert connection.execute('SELECT COUNT(*) FROM "other"').fetchone() == (10,)
+        finally:
+            connection.close()
+
+def test_load_sqlite_into_open_connection(user_records):
+    """Test loading into a caller's connection, replacing or appending to the table"""
+    template, records = user_records
+    connection = sqlite3.connect(":memory:")
+
+    assert SQLGenerator().load_sqlite(connection, iter(records), template) == 250
+    assert SQLGenerator().load_sqlite(connection, records, template) == 250
+    assert connection.execute('SELECT COUNT(*) FROM "records"').fetchone() == (250,)
+    with pytest.raises(sqlite3.IntegrityError):
+        SQLGenerator(replace=False).load_sqlite(connection, records, template)
+    assert SQLGenerator().load_sqlite(connection, [], template) == 0
+
+@pytest.mark.parametrize("batch_size", [1, 7, 1000])
+def test_insert_script_loads_into_sqlite(user_records, batch_size):
+    """Test that multi-row INSERT scripts reproduce the records"""
+    template, records = user_records
+    script = SQLGenerator(batch_size=batch_size).export_bytes(records, template=template).decode()
+
+    assert script.count("INSERT INTO") == -(-len(records) // batch_size)
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(script)
+    assert [tuple(row[:-1]) for row in _rows(connection, "records", template)] == \
+        [row[:-1] for row in _expected(records, template)]
+    assert [bool(row[-1]) for row in _rows(connection, "records", template)] == \
+        [record["is_active"] for record in records]
+
+def test_insert_script_escapes_values():
+    """Test quoting of identifiers, quotes and NULLs without a template"""
+    records = [{'we"ird': "O'Brien", "n": 1.5}, {'we"ird': "x", "n": None}]
+    script = SQLGenerator(table="t").export_bytes(records).decode()
+
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(script)
+    assert connection.execute('SELECT "we""ird", n FROM t').fetchall() == [("O'Brien", 1.5), ("x", None)]
+
+def test_copy_script():
+    """Test PostgreSQL COPY text escaping and terminator"""
+    template = {
+        "note": FieldDefinition(name="note", field_type=FieldTypes.STRING, nullable=True),
+        "ok": FieldDefinition(name="ok", field_type=FieldTypes.BOOLEAN),
+        "day": FieldDefinition(name="day", field_type=FieldTypes.DATE),
+    }
+    records = [{"note": "a\tb\\c\nd", "ok": True, "day": REFERENCE_DATE},
+               {"note": None, "ok": False, "day": REFERENCE_DATE}]
+    script = SQLGenerator(file_format="copy", table="t").export_bytes(records, template=template).decode()
+
+    assert 'COPY "t" ("note", "ok", "day") FROM stdin;\n' in script
+    assert "a\\tb\\\\c\\nd\tt\t2024-01-31\n\\N\tf\t2024-01-31\n\\.\nCOMMIT;\n" in script
+
+def test_export_stream_compressed_script(financial_template):
+    """Test streaming generation into a gzip-compressed script"""
+    template = financial_template.get_template()
+    generator = SQLGenerator(seed=3, reference_date=REFERENCE_DATE)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "fixtures.sql.gz")
+        generator.export_stream(template, 1200, path, chunk_size=500)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            script = f.read()
+
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(script)
+    assert connection.execute('SELECT COUNT(*) FROM "records"').fetchone() == (1200,)
+    assert "NOT NULL" in script
+
+def test_stream_cannot_be_sqlite():
+    """Test that SQLite output needs a file"""
+    with pytest.raises(ValueError):
+        SQLGenerator(file_format="sqlite").export_bytes([{"a": 1}])
+    with pytest.raises(ValueError):
+        SQLGenerator(file_format="csv")
@@ -0,0 +1,91 @@
+import pytest
+import os
+import pickle
+import tempfile
+from datetime import date
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.csv_generator import CSVGenerator
+from src.generators.json_generator import JSONGenerator
+from src.generators.unique import UniqueDomainError
+
+REFERENCE_DATE = date(2024, 1, 31)
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_stats_do_not_change_output(financial_template, columnar):
+    """Test that instrumentation leaves the generated values untouched"""
+    template = financial_template.get_template()
+    plain = JSONGenerator(seed=3, reference_date=REFERENCE_DATE, columnar=columnar)
+    instrumented = JSONGenerator(seed=3, reference_date=REFERENCE_DATE, columnar=columnar, stats=True)
+
+    assert instrumented.generate(template, 200) == plain.generate(template, 200)
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_generate_with_stats_counts_fields_and_nulls(columnar):
+    """Test per-field value, timing and null counters"""
+    template = {
+        "amount": FieldDefinition(name="amount", field_type=FieldTypes.FLOAT, nullable=True),
+        "status": FieldDefinition(name="status", field_type=FieldTypes.STRING, choices=["a", "b"]),
+        "other": FieldDefinition(name="other", field_type=FieldTypes.FLOAT),
+    }
+    generator = JSONGenerator(seed=1, columnar=columnar)
+    records, stats = generator.generate_with_stats(template, 500)
+
+    assert stats.records == 500
+    assert stats.fields["amount"].values == 500
+    assert stats.fields["amount"].nulls == sum(record["amount"] is None for record in records)
+    assert stats.fields["amount"].seconds > 0
+    assert stats.fields["status"].nulls == 0
+    assert stats.by_field_type()[FieldTypes.FLOAT].values == 1000
+
+def test_stats_count_unique_exhaustion():
+    """Test that a unique domain failure is counted"""
+    template = {
+        "id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER,
+                              min_value=1, max_value=10, unique=True)
+    }
+    generator = JSONGenerator(stats=True)
+
+    with pytest.raises(UniqueDomainError):
+        generator.generate(template, 11)
+    assert generator.stats.fields["id"].unique_exhausted == 1
+
+def test_stats_count_unique_retries():
+    """Test that retries of open-ended unique fields are counted"""
+    template = {
+        "code": FieldDefinition(name="code", field_type=FieldTypes.STRING,
+                                pattern="[ab]{4}", unique=True)
+    }
+    generator = JSONGenerator(seed=2, stats=True)
+    generator.generate(template, 14)
+
+    assert generator.stats.fields["code"].unique_retries > 0
+
+def test_export_stats(basic_template):
+    """Test exporter bytes and record counters"""
+    generator = CSVGenerator(stats=True)
+    data = generator.generate(basic_template, 40)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tmp:
+        generator.export(data, tmp.name)
+        size = os.path.getsize(tmp.name)
+
+    export = generator.stats.exports[0]
+    assert (export.format, export.records, export.bytes) == ("csv", 40, size)
+    assert export.bytes_per_second > 0
+    assert generator.stats.as_dict()["exports"][0]["records"] == 40
+
+def test_generate_field_value_timing(json_generator):
+    """Test that the single-value path is instrumented when enabled"""
+    generator = JSONGenerator(stats=True)
+    generator._generate_field_value(FieldDefinition(name="age", field_type=FieldTypes.INTEGER))
+
+    assert generator.stats.fields["age"].values == 1
+    assert json_generator.stats is None
+
+def test_stats_survive_pickling(basic_template):
+    """Test that stats can be cached by value"""
+    generator = JSONGenerator(stats=True)
+    generator.generate(basic_template, 10)
+
+    restored = pickle.loads(pickle.dumps(generator.stats))
+    assert restored.as_dict() == generator.stats.as_dict()
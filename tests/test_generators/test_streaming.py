@@ -0,0 +1,100 @@
+import pytest
+import tempfile
+import os
+import csv
+import json
+import tracemalloc
+from src.data_types.field_types import FieldDefinition, FieldTypes, template_fingerprint
+from src.generators.json_generator import JSONGenerator
+
+def test_iter_generate_chunks(json_generator, basic_template):
+    """Test that iter_generate yields bounded chunks totalling count"""
+    chunks = list(json_generator.iter_generate(basic_template, count=25, chunk_size=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+
+def test_iter_generate_unique_across_chunks(json_generator):
+    """Test that unique constraints hold across chunk boundaries"""
+    template = {
+        "id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER,
+                              min_value=1, max_value=200, unique=True)
+    }
+    ids = [record["id"]
+           for chunk in json_generator.iter_generate(template, count=100, chunk_size=7)
+           for record in chunk]
+
+    assert len(set(ids)) == 100
+
+@pytest.mark.parametrize("generator_name,suffix", [
+    ("json_generator", ".json"),
+    ("csv_generator", ".csv"),
+    ("xml_generator", ".xml")
+])
+def test_export_stream(request, basic_template, generator_name, suffix):
+    """Test generating straight to a file for every exporter"""
+    generator = request.getfixturevalue(generator_name)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        generator.export_stream(basic_template, count=30, filepath=tmp.name, chunk_size=8)
+        size = os.path.getsize(tmp.name)
+
+    assert size > 0
+    os.unlink(tmp.name)
+
+def test_export_stream_bounded_memory(csv_generator):
+    """Test that streamed export memory does not grow with record count"""
+    template = {
+        "amount": FieldDefinition(name="amount", field_type=FieldTypes.FLOAT),
+        "status": FieldDefinition(name="status", field_type=FieldTypes.STRING,
+                                  choices=["completed", "pending", "failed"])
+    }
+
+    def peak_for(count: int, path: str) -> int:
+        tracemalloc.start()
+        csv_generator.export_stream(template, count=count, filepath=path, chunk_size=500)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp:
+        small = peak_for(2000, tmp.name)
+        large = peak_for(40000, tmp.name)
+        with open(tmp.name, 'r', newline='') as f:
+            assert sum(1 for _ in csv.DictReader(f)) == 40000
+
+    assert large < small * 2
+    os.unlink(tmp.name)
+
+@pytest.mark.parametrize("generator_name,suffix", [
+    ("json_generator", ".json"),
+    ("csv_generator", ".csv"),
+    ("xml_generator", ".xml")
+])
+def test_export_bytes_matches_file_export(request, basic_template, generator_name, suffix):
+    """Test that in-memory exports carry the same bytes as file exports"""
+    generator = request.getfixturevalue(generator_name)
+    data = generator.generate(basic_template, 20)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        generator.export(data, tmp.name)
+        with open(tmp.name, "rb") as f:
+            expected = f.read()
+
+    assert generator.export_bytes(iter(data)) == expected
+
+def test_seeded_prefix_matches_streamed_output(user_template):
+    """Test that a short seeded run previews the first rows of a longer streamed one"""
+    template = user_template.get_template()
+    preview = JSONGenerator(seed=11).generate(template, 5)
+    streamed = next(JSONGenerator(seed=11).iter_generate(template, 500, chunk_size=100))
+
+    assert streamed[:5] == preview
+
+def test_template_fingerprint(user_template, financial_template):
+    """Test that fingerprints follow template content, not identity"""
+    template = user_template.get_template()
+
+    assert template_fingerprint(template) == template_fingerprint(user_template.get_template())
+    assert template_fingerprint(template) != template_fingerprint(financial_template.get_template())
+    template["id"].max_value = 99999
+    assert template_fingerprint(template) != template_fingerprint(user_template.get_template())
@@ -0,0 +1,94 @@
+import pytest
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.csv_generator import CSVGenerator
+from src.generators.json_generator import JSONGenerator
+from src.generators.parallel import ParallelGenerator
+from src.generators.random_access import RandomAccessGenerator
+from src.generators.unique import (
+    BloomFilter, HashedMembership, IntegerPermutation, RetrySampler,
+    UniqueDomainError, UniqueOptions
+)
+
+@pytest.mark.parametrize("size", [1, 2, 7, 100, 9000])
+def test_integer_permutation_is_bijection(size):
+    """Test that every index maps to a distinct in-range value"""
+    permutation = IntegerPermutation(size, key=1234)
+
+    assert sorted(permutation[index] for index in range(size)) == list(range(size))
+
+def test_user_ids_fill_domain_without_retries(user_template):
+    """Test that all 9000 user ids can be drawn exactly once"""
+    template = {"id": user_template.get_template()["id"]}
+    data = JSONGenerator(seed=1).generate(template, 9000)
+
+    assert sorted(record["id"] for record in data) == list(range(1000, 10000))
+
+def test_count_exceeding_domain_fails_up_front(user_template):
+    """Test that impossible unique counts raise before generating"""
+    generator = JSONGenerator()
+    with pytest.raises(UniqueDomainError, match="'id'"):
+        generator.generate(user_template.get_template(), 9001)
+    with pytest.raises(UniqueDomainError):
+        next(generator.iter_generate(user_template.get_template(), 9001, chunk_size=10))
+
+@pytest.mark.parametrize("field_def,count", [
+    (FieldDefinition(name="v", field_type=FieldTypes.STRING, choices=["a", "b", "c"], unique=True), 3),
+    (FieldDefinition(name="v", field_type=FieldTypes.FLOAT, min_value=0.01, max_value=1.00, unique=True), 100),
+    (FieldDefinition(name="v", field_type=FieldTypes.DATE, unique=True), 366),
+    (FieldDefinition(name="v", field_type=FieldTypes.BOOLEAN, unique=True), 2)
+])
+def test_finite_domains_exhaust_exactly(field_def, count):
+    """Test permutation sampling for every enumerable field type"""
+    template = {"v": field_def}
+    values = [record["v"] for record in JSONGenerator(columnar=True).generate(template, count)]
+
+    assert len(set(values)) == count
+    with pytest.raises(UniqueDomainError):
+        JSONGenerator().generate(template, count + 1)
+
+@pytest.mark.parametrize("field_def", [
+    FieldDefinition(name="v", field_type=FieldTypes.STRING, choices=["a", "b", "c"], weights=[0, 0, 1], unique=True),
+    FieldDefinition(name="v", field_type=FieldTypes.INTEGER, max_value=100, distribution="zipf", unique=True),
+])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_unique_rejects_weights_and_distributions(field_def, columnar):
+    """Test that sampling without replacement is not silently mixed with weights or distributions"""
+    with pytest.raises(ValueError, match="without replacement"):
+        JSONGenerator(columnar=columnar).generate({"v": field_def}, 3)
+
+@pytest.mark.parametrize("membership", [HashedMembership(), BloomFilter(capacity=100)])
+def test_retry_sampler_raises_when_exhausted(membership):
+    """Test that open-ended samplers raise instead of emitting duplicates"""
+    values = iter([1, 1, 2] + [2] * 200)
+    sampler = RetrySampler("v", lambda: next(values), membership)
+
+    assert sampler() == 1
+    assert sampler() == 2
+    assert sampler.retries == 1
+    with pytest.raises(UniqueDomainError):
+        sampler()
+
+def test_bloom_membership_for_strings():
+    """Test unique strings with the probabilistic filter"""
+    template = {"email": FieldDefinition(name="email", field_type=FieldTypes.EMAIL, unique=True)}
+    generator = JSONGenerator(seed=3, unique=UniqueOptions(membership="bloom", bloom_capacity=500))
+    emails = [record["email"] for record in generator.generate(template, 300)]
+
+    assert len(set(emails)) == 300
+
+def test_unique_across_parallel_shards(tmp_path):
+    """Test that shards share one permutation and stay globally unique"""
+    template = {"id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER,
+                                      min_value=1, max_value=120, unique=True)}
+    parallel = ParallelGenerator(CSVGenerator, seed=9, workers=2, shard_size=25)
+    ids = [record["id"] for record in parallel.iter_records(template, 120)]
+
+    assert sorted(ids) == list(range(1, 121))
+
+def test_unique_across_random_access_indices(user_template):
+    """Test that random-access records keep unique ids without state"""
+    dataset = RandomAccessGenerator(user_template.get_template(), seed=4)
+    ids = [dataset.record(index)["id"] for index in range(0, 9000, 7)]
+
+    assert len(set(ids)) == len(ids)
+    assert dataset.record(8999)["id"] == dataset.record(8999)["id"]
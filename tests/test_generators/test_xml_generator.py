@@ -26,4 +26,40 @@ def test_generate_and_export_xml(xml_generator, basic_template):
             age = int(record.find("age").text)
             assert 18 <= age <= 100
             
-    os.unlink(tmp.name)
\ No newline at end of file
+    os.unlink(tmp.name)
+
+def test_export_xml_escapes_once(xml_generator):
+    """Test that special characters round-trip through a single escape"""
+    data = [{"note": "Fish & <Chips>", "empty": None, "flag": True}]
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.xml') as tmp:
+        xml_generator.export(data, tmp.name)
+        record = ET.parse(tmp.name).getroot().find("record")
+
+    assert record.find("note").text == "Fish & <Chips>"
+    assert record.find("empty").text is None
+    assert record.find("flag").text == "true"
+    os.unlink(tmp.name)
+
+@pytest.mark.parametrize("indent", ["  ", None])
+def test_export_xml_streams_records(xml_generator, basic_template, indent):
+    """Test exporting a record iterator with and without indentation"""
+    records = (record for chunk in xml_generator.iter_generate(basic_template, 12, chunk_size=5)
+               for record in chunk)
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.xml') as tmp:
+        xml_generator.export(records, tmp.name, indent=indent)
+        root = ET.parse(tmp.name).getroot()
+
+    assert len(root) == 12
+    os.unlink(tmp.name)
+
+def test_export_xml_empty(xml_generator):
+    """Test exporting no records yields an empty root element"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.xml') as tmp:
+        xml_generator.export([], tmp.name)
+        root = ET.parse(tmp.name).getroot()
+
+    assert root.tag == "records"
+    assert len(root) == 0
+    os.unlink(tmp.name)
@@ -0,0 +1,146 @@
+import asyncio
+import csv
+import json
+import urllib.error
+import urllib.request
+from datetime import date
+from src.generators.random_access import RandomAccessGenerator
+from src import server as server_module
+from src.server import MockDataServer, load_templates, render_records
+
+REFERENCE_DATE = date(2024, 1, 31)
+
+def _fetch(port, path, headers=None):
+    request = urllib.request.Request(f"http://127.0.0.1:{port}{path}", headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, dict(response.headers), response.read().decode()
+    except urllib.error.HTTPError as exc:
+        return exc.code, dict(exc.headers), exc.read().decode()
+
+def _run(scenario, **options):
+    """Run scenario(port) against a server on a free localhost port"""
+    async def main():
+        async with MockDataServer(load_templates([]), REFERENCE_DATE, chunk_rows=7, **options) as server:
+            return await scenario(server.port)
+    return asyncio.run(main())
+
+def test_pages_are_deterministic_and_match_random_access(user_template):
+    """Test that a page equals the random-access records at its indices, for any page size"""
+    async def scenario(port):
+        first = await asyncio.to_thread(_fetch, port, "/user?seed=5&page=2&size=20")
+        again = await asyncio.to_thread(_fetch, port, "/user?seed=5&page=2&size=20")
+        halves = [await asyncio.to_thread(_fetch, port, f"/user?seed=5&page={page}&size=10")
+                  for page in (4, 5)]
+        return first, again, halves
+
+    first, again, halves = _run(scenario)
+    status, headers, body = first
+    assert status == 200
+    assert headers["Transfer-Encoding"] == "chunked"
+    assert headers["Content-Type"] == "application/x-ndjson"
+    assert 'page=3' in headers["Link"]
+    assert body == again[2]
+    assert body == halves[0][2] + halves[1][2]
+
+    dataset = RandomAccessGenerator(user_template.get_template(), 5, REFERENCE_DATE)
+    expected = render_records(dataset.records(40, 60), "ndjson").decode()
+    assert body == expected
+    assert len([json.loads(line) for line in body.splitlines()]) == 20
+
+def test_csv_page_and_accept_header():
+    """Test CSV output via format= or the Accept header, with one header row"""
+    async def scenario(port):
+        by_query = await asyncio.to_thread(_fetch, port, "/financial?seed=1&size=30&format=csv")
+        by_accept = await asyncio.to_thread(_fetch, port, "/financial?seed=1&size=30", {"Accept": "text/csv"})
+        return by_query, by_accept
+
+    by_query, by_accept = _run(scenario)
+    assert by_query[0] == 200 and by_query[1]["Content-Type"].startswith("text/csv")
+    assert by_query[2] == by_accept[2]
+    rows = list(csv.DictReader(by_query[2].splitlines()))
+    assert len(rows) == 30
+    assert rows[0]["transaction_id"].startswith("TRX")
+
+def test_concurrent_clients():
+    """Test that concurrent requests are all served, each with its own page"""
+    async def scenario(port):
+        return await asyncio.gather(*[
+            asyncio.to_thread(_fetch, port, f"/financial?seed=9&page={page}&size=50")
+            for page in range(8)
+        ])
+
+    responses = _run(scenario)
+    bodies = [body for status, _, body in responses]
+    assert all(status == 200 for status, _, _ in responses)
+    assert len(set(bodies)) == 8
+    assert all(len(body.splitlines()) == 50 for body in bodies)
+
+def test_errors_and_listing():
+    """Test the endpoint listing, bad parameters and the end of a finite dataset"""
+    async def scenario(port):
+        paths = ["/", "/missing", "/user?size=0", "/user?seed=x", "/user?format=xml",
+                 "/user?page=89&size=101", "/user?page=90&size=100"]
+        return [await asyncio.to_thread(_fetch, port, path) for path in paths]
+
+    listing, missing, bad_size, bad_seed, bad_format, last_page, past_end = _run(scenario)
+    assert set(json.loads(listing[2])["templates"]) == {"user", "financial"}
+    assert missing[0] == 404
+    assert (bad_size[0], bad_seed[0], bad_format[0]) == (400, 400, 400)
+    assert "size" in json.loads(bad_size[2])["error"]
+    # UserTemplate ids span 9000 values, so the last page is partial
+    assert last_page[0] == 200 and len(last_page[2].splitlines()) == 9000 - 89 * 101
+    assert past_end[0] == 404
+
+async def _exchange(port, request):
+    """Send raw request bytes and read until the server closes the connection"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return response
+
+def test_http_1_0_gets_close_delimited_body(user_template):
+    """Test that HTTP/1.0 clients get the records without chunked framing"""
+    response = _run(lambda port: _exchange(port, b"GET /user?seed=2&size=20 HTTP/1.0\r\n\r\n"))
+    head, _, body = response.partition(b"\r\n\r\n")
+
+    assert head.startswith(b"HTTP/1.1 200")
+    assert b"Transfer-Encoding" not in head and b"Content-Length" not in head
+    assert b"Connection: close" in head
+    dataset = RandomAccessGenerator(user_template.get_template(), 2, REFERENCE_DATE)
+    assert body == render_records(dataset.records(0, 20), "ndjson")
+
+def test_request_body_is_not_parsed_as_next_request():
+    """Test that a rejected request's body is skipped on a kept-alive connection"""
+    body = b"GET /missing HTTP/1.1\r\n\r\n"
+    request = (b"POST /user HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+               + b"GET /user?size=3 HTTP/1.1\r\nConnection: close\r\n\r\n")
+    response = _run(lambda port: _exchange(port, request))
+
+    assert response.startswith(b"HTTP/1.1 405")
+    assert response.count(b"HTTP/1.1 ") == 2
+    assert b"HTTP/1.1 200" in response and b"404" not in response
+
+def test_generation_errors_are_answered(monkeypatch):
+    """Test that a failing first chunk gets a 500 and a later one closes the unfinished response"""
+    render_chunk = server_module.render_chunk
+
+    def failing_render_chunk(key, template, start, stop, fmt, header=False):
+        if start >= 14:
+            raise ValueError("generation failed")
+        return render_chunk(key, template, start, stop, fmt, header)
+    monkeypatch.setattr(server_module, "render_chunk", failing_render_chunk)
+
+    async def scenario(port):
+        failed = await asyncio.to_thread(_fetch, port, "/user?page=1&size=20")
+        aborted = await _exchange(port, b"GET /user?size=20 HTTP/1.1\r\n\r\n")
+        healthy = await asyncio.to_thread(_fetch, port, "/user?size=10")
+        return failed, aborted, healthy
+
+    failed, aborted, healthy = _run(scenario)
+    assert failed[0] == 500 and "generation failed" in json.loads(failed[2])["error"]
+    assert aborted.startswith(b"HTTP/1.1 200") and not aborted.endswith(b"0\r\n\r\n")
+    assert healthy[0] == 200 and len(healthy[2].splitlines()) == 10
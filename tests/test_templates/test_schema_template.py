@@ -0,0 +1,138 @@
+# tests/test_templates/test_schema_template.py
+import pytest
+import json
+from src.data_types.field_types import FieldTypes
+from src.templates import schema_template
+from src.templates.schema_template import SchemaError, SchemaTemplate
+
+def test_schema_template_from_file(tmp_path):
+    """Test loading fields from a JSON schema file"""
+    path = tmp_path / "orders.json"
+    path.write_text(json.dumps({
+        "fields": [
+            {"name": "order_id", "type": "integer", "min_value": 1, "unique": True},
+            {"name": "status", "field_type": "STRING", "choices": ["open", "closed"]},
+        ]
+    }))
+    template = SchemaTemplate.from_file(str(path))
+    template_def = template.get_template()
+
+    assert template.get_name() == "orders"
+    assert list(template_def) == ["order_id", "status"]
+    assert template_def["order_id"].field_type == FieldTypes.INTEGER
+    assert template_def["order_id"].unique
+    assert template_def["status"].choices == ["open", "closed"]
+
+@pytest.mark.parametrize("schema", [
+    {"fields": {"x": {"type": "uuid"}}},
+    {"fields": {"x": {"type": "integer", "minimum": 1}}},
+    {"fields": {"x": {}}},
+    {"fields": []},
+    {"name": "no fields"},
+])
+def test_schema_template_rejects_invalid_schema(schema):
+    """Test schema validation errors"""
+    with pytest.raises(SchemaError):
+        SchemaTemplate.from_dict(schema)
+
+def test_schema_template_weights_and_distributions():
+    """Test that weighted choices and distributions are read from schemas"""
+    template = SchemaTemplate.from_dict({"fields": {
+        "status": {"type": "string", "choices": ["completed", "failed"], "weights": [9, 1]},
+        "amount": {"type": "float", "min_value": 1, "max_value": 100,
+                   "distribution": "lognormal", "distribution_params": {"sigma": 0.5}},
+    }}).get_template()
+
+    assert template["status"].weights == [9, 1]
+    assert template["amount"].distribution == "lognormal"
+    assert template["amount"].distribution_params == {"sigma": 0.5}
+
+NESTED_YAML = """
+name: customers
+fields:
+  id: {type: integer, min_value: 1, max_value: 100000, unique: true}
+  address:
+    fields:
+      city: {type: string, choices: [Berlin, Paris]}
+      geo:
+        type: object
+        fields:
+          - {name: lat, type: float, min_value: -90, max_value: 90}
+  email: {type: email}
+"""
+
+def test_schema_template_yaml_nested_fields(tmp_path):
+    """Test that nested YAML groups are flattened to dotted field names"""
+    path = tmp_path / "customers.yaml"
+    path.write_text(NESTED_YAML)
+    template = SchemaTemplate.from_file(str(path))
+
+    assert template.get_name() == "customers"
+    assert list(template.get_template()) == ["id", "address.city", "address.geo.lat", "email"]
+    assert template.get_template()["address.geo.lat"].field_type == FieldTypes.FLOAT
+
+def test_schema_template_cache(tmp_path, monkeypatch):
+    """Test that unchanged files load from the cache and edited files are parsed again"""
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "customers.yml"
+    path.write_text(NESTED_YAML)
+    first = SchemaTemplate.from_file(str(path), cache_dir=str(cache_dir))
+    entry, = cache_dir.glob("*.json")
+    assert [field_name for field_name, _ in json.loads(entry.read_text())["fields"]] == list(first.get_template())
+
+    def fail(text, path):
+        raise AssertionError("cached schema was parsed again")
+
+    monkeypatch.setattr(schema_template, "parse_schema", fail)
+    cached = SchemaTemplate.from_file(str(path), cache_dir=str(cache_dir))
+    assert cached.get_template() == first.get_template()
+
+    path.write_text(NESTED_YAML.replace("Paris", "Rome"))
+    with pytest.raises(AssertionError):
+        SchemaTemplate.from_file(str(path), cache_dir=str(cache_dir))
+
+def test_schema_template_ignores_broken_cache(tmp_path):
+    """Test that unreadable cache entries are rebuilt and cache_dir=False writes nothing"""
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "orders.json"
+    path.write_text(json.dumps({"fields": {"total": {"type": "float"}}}))
+    SchemaTemplate.from_file(str(path), cache_dir=str(cache_dir))
+    entry, = cache_dir.glob("*.json")
+    entry.write_bytes(b"not json")
+
+    assert list(SchemaTemplate.from_file(str(path), cache_dir=str(cache_dir)).get_template()) == ["total"]
+    assert entry.read_bytes() != b"not json"
+
+    entry.unlink()
+    SchemaTemplate.from_file(str(path), cache_dir=False)
+    assert not list(cache_dir.glob("*.json"))
+
+@pytest.mark.parametrize("spec", [
+    {"type": "string", "pattern": "(?=lookahead)"},
+    {"type": "integer", "min_value": 10, "max_value": 1},
+    {"type": "string", "choices": ["a", "b"], "weights": [1]},
+    {"type": "string", "weights": [1]},
+    {"type": "email", "distribution": "normal"},
+    {"type": "string", "choices": ["a", "b", "c"], "weights": [0, 0, 1], "unique": True},
+    {"type": "integer", "distribution": "zipf", "unique": True},
+])
+def test_schema_template_validates_generation_settings(spec):
+    """Test that fields which cannot be generated are rejected when the schema loads"""
+    with pytest.raises(SchemaError, match="'x'"):
+        SchemaTemplate.from_dict({"fields": {"x": spec}})
+
+@pytest.mark.parametrize("spec,message", [
+    ({"type": "integer", "nullable": "no"}, "nullable"),
+    ({"type": "integer", "unique": 1}, "unique"),
+    ({"type": "integer", "min_value": "5"}, "min_value"),
+    ({"type": "float", "max_value": True}, "max_value"),
+    ({"type": "float", "distribution": "normal", "distribution_params": {"mean": "x"}}, "distribution_params"),
+    ({"type": "float", "distribution": "normal", "distribution_params": [1, 2]}, "distribution_params"),
+    ({"type": "string", "choices": ["a", "b"], "weights": ["1", "2"]}, "weights"),
+    ({"type": "integer", "choices": [1, 2]}, "choices"),
+    ({"type": "email", "choices": ["a@example.com"], "weights": [1]}, "choices"),
+])
+def test_schema_template_checks_option_types(spec, message):
+    """Test that option values of the wrong type are rejected instead of misread at generation time"""
+    with pytest.raises(SchemaError, match=f"'x' {message}|'x' is .*; {message}"):
+        SchemaTemplate.from_dict({"fields": {"x": spec}})
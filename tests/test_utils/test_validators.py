@@ -0,0 +1,155 @@
+import pytest
+import json
+import os
+import tempfile
+from datetime import date
+from src.data_types.constraints import PatternConstraint, compiled_regex, validate_constraints
+from src.data_types.field_types import FieldDefinition, FieldTypes
+from src.generators.csv_generator import CSVGenerator
+from src.generators.json_generator import JSONGenerator
+from src.utils.dataset_validator import DatasetValidator, ValidationReport
+from src.utils.validators import FieldValidator
+
+REFERENCE_DATE = date(2024, 1, 31)
+
+def test_field_validator():
+    """Test single-value validation, which needs FieldTypes and compiled patterns"""
+    username = FieldDefinition(name="username", field_type=FieldTypes.STRING, pattern="[a-z]{3}")
+    amount = FieldDefinition(name="amount", field_type=FieldTypes.FLOAT, min_value=1, max_value=5)
+    email = FieldDefinition(name="email", field_type=FieldTypes.EMAIL)
+
+    assert FieldValidator.validate_field("abc", username)
+    assert not FieldValidator.validate_field("AB", username)
+    assert FieldValidator.validate_field(2.5, amount)
+    assert not FieldValidator.validate_field(7, amount)
+    assert FieldValidator.validate_field("a@example.com", email)
+    assert not FieldValidator.validate_field("nope", email)
+    assert not FieldValidator.validate_field(None, email)
+
+def test_validate_constraints_pattern():
+    """Test pattern constraints, which need the re module"""
+    constraint = PatternConstraint(message="bad id", pattern="TRX[0-9]+")
+    assert validate_constraints("TRX123", [constraint]) is None
+    assert validate_constraints("ABC", [constraint]) == "bad id"
+    assert compiled_regex("TRX[0-9]+") is compiled_regex("TRX[0-9]+")
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_generated_data_is_valid(user_template, financial_template, columnar):
+    """Test that generated datasets pass validation of their own template"""
+    for template in (user_template.get_template(), financial_template.get_template()):
+        records = JSONGenerator(seed=1, reference_date=REFERENCE_DATE, columnar=columnar).generate(template, 2000)
+        report = DatasetValidator(template, REFERENCE_DATE, chunk_size=300).validate_records(records)
+        assert report.valid, report.summary()
+        assert report.rows == 2000
+
+def test_violations_are_counted_and_sampled(user_template):
+    """Test every rule, sample rows and uniqueness across chunks"""
+    template = user_template.get_template()
+    records = JSONGenerator(seed=2, reference_date=REFERENCE_DATE).generate(template, 10)
+    records[3] = dict(records[3], id=records[0]["id"], email="not-an-email")
+    records[6] = dict(records[6], username="UPPER", is_active="yes", date_joined=date(2000, 1, 1))
+    records[8] = dict(records[8], id=None)
+    records[9] = dict(records[9], id=99999)
+
+    report = DatasetValidator(template, REFERENCE_DATE, chunk_size=4).validate_records(records)
+
+    assert not report.valid
+    assert report.counts == {
+        "id": {"unique": 1, "null": 1, "range": 1},
+        "email": {"email": 1},
+        "username": {"pattern": 1},
+        "date_joined": {"range": 1},
+        "is_active": {"type": 1},
+    }
+    assert report.violations == 7
+    assert {(sample.field, sample.rule, sample.row) for sample in report.samples} >= {
+        ("email", "email", 3), ("username", "pattern", 6), ("id", "null", 8), ("id", "range", 9)}
+
+def test_validate_columns_with_choices_and_nulls():
+    """Test column batches, frozenset choices and nullable fields"""
+    template = {
+        "status": FieldDefinition(name="status", field_type=FieldTypes.STRING, choices=["a", "b"]),
+        "score": FieldDefinition(name="score", field_type=FieldTypes.INTEGER, nullable=True),
+    }
+    validator = DatasetValidator(template)
+
+    assert validator.validate_columns({"status": ["a", "b", "a"], "score": [1, None, 1000]}).valid
+    report = validator.validate_columns({"status": ["a", "c", "a"], "score": [1, True, -1]})
+    assert report.counts == {"status": {"choices": 1}, "score": {"type": 1, "range": 1}}
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("filename", ["data.csv", "data.csv.gz", "data.jsonl"])
+def test_validate_file(financial_template, workers, filename):
+    """Test validating exported files in-process and across worker processes"""
+    template = financial_template.get_template()
+    generator = CSVGenerator(seed=3, reference_date=REFERENCE_DATE)
+    records = generator.generate(template, 1500)
+    records[1000] = dict(records[1000], currency="XXX")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, filename)
+        if filename.startswith("data.csv"):
+            generator.export(records, path)
+        else:
+            JSONGenerator().export(records, path)
+        report = DatasetValidator(template, REFERENCE_DATE, chunk_size=400).validate_file(path, workers=workers)
+
+    assert report.rows == 1500
+    assert report.counts == {"currency": {"choices": 1}}
+    assert report.samples[0].row == 1000
+
+def test_validate_file_reports_missing_columns_and_unique_across_chunks(tmp_path):
+    """Test a missing column, CSV nulls and duplicates split over chunks and workers"""
+    template = {
+        "id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER, unique=True),
+        "day": FieldDefinition(name="day", field_type=FieldTypes.DATE),
+    }
+    path = tmp_path / "ids.csv"
+    path.write_text("id\n1\n2\n\n3\n1\n2\n", encoding="utf-8")
+
+    report = DatasetValidator(template, chunk_size=2).validate_file(str(path), workers=2)
+    assert report.counts == {"id": {"null": 1, "unique": 2}, "day": {"missing": 6}}
+    with pytest.raises(ValueError):
+        DatasetValidator(template).validate_file(str(tmp_path / "ids.xml"))
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_file_reports_missing_json_keys(tmp_path, workers):
+    """Test that an absent JSON key is reported as missing, not as null, at its row"""
+    template = {
+        "id": FieldDefinition(name="id", field_type=FieldTypes.INTEGER),
+        "note": FieldDefinition(name="note", field_type=FieldTypes.STRING, nullable=True),
+    }
+    records = [{"id": 1, "note": "a"}, {"note": None}, {"id": 3}, {"id": "x", "note": "d"}, {"id": None}]
+    path = tmp_path / "notes.jsonl"
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+
+    report = DatasetValidator(template, chunk_size=4).validate_file(str(path), workers=workers)
+    assert report.counts == {"id": {"missing": 1, "type": 1, "null": 1}, "note": {"missing": 2}}
+    assert [(sample.field, sample.rule, sample.row) for sample in report.samples] == [
+        ("id", "missing", 1), ("id", "type", 3), ("note", "missing", 2), ("id", "null", 4), ("note", "missing", 4)]
+
+def test_validate_file_in_process_reuses_checks(financial_template, tmp_path, monkeypatch):
+    """Test that single-process validation uses the validator's compiled checks"""
+    template = financial_template.get_template()
+    path = str(tmp_path / "data.csv")
+    CSVGenerator(seed=3).export_stream(template, 300, path, 100)
+    validator = DatasetValidator(template, chunk_size=100)
+
+    def fail(*args):
+        raise AssertionError("checks recompiled")
+    monkeypatch.setattr("src.utils.dataset_validator.compile_checks", fail)
+    assert validator.validate_file(path).rows == 300
+
+def test_report_merge_and_dict():
+    """Test merging chunk reports and the plain-data snapshot"""
+    report = ValidationReport(max_samples=1)
+    chunk = ValidationReport(rows=5)
+    chunk.add("a", "null", 2, None)
+    chunk.add("a", "null", 3, None)
+    report.merge(chunk)
+    report.merge(chunk)
+
+    assert report.rows == 10
+    assert report.counts == {"a": {"null": 4}}
+    assert len(report.samples) == 1
+    assert json.loads(json.dumps(report.as_dict()))["violations"] == 4